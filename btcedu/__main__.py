@@ -0,0 +1,5 @@
+"""Allow ``python -m btcedu`` as an alias for the ``btcedu`` console script."""
+
+from btcedu.cli import main
+
+main()
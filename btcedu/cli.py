@@ -1,20 +1,16 @@
+import atexit
+import itertools
 import json
 import logging
+import os
 import sys
-from datetime import UTC, datetime
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime
+from functools import cache
 
 import click
 
-from btcedu.config import get_settings
-from btcedu.db import get_session_factory, init_db
-from btcedu.models.episode import Episode, EpisodeStatus
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-)
-
 
 @click.group()
 @click.pass_context
@@ -26,31 +22,178 @@ def cli(ctx: click.Context) -> None:
     if ctx.resilient_parsing:
         return
 
-    try:
-        # Allow tests to inject settings and session_factory via ctx.obj
-        if "settings" not in ctx.obj:
-            settings = get_settings()
-            ctx.obj["settings"] = settings
-        else:
-            settings = ctx.obj["settings"]
+    # Configured here rather than at import so library users keep control of
+    # logging; a no-op when the root logger already has handlers.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    )
+
+    if ctx.invoked_subcommand in _NO_SETTINGS_COMMANDS:
+        return
 
-        if "session_factory" not in ctx.obj:
-            init_db(settings.database_url)
-            ctx.obj["session_factory"] = get_session_factory(settings.database_url)
+    # Allow tests to inject settings and session_factory via ctx.obj
+    if "settings" not in ctx.obj:
+        from btcedu.config import get_settings
 
-            # Check for pending migrations on CLI startup
-            _check_pending_migrations(ctx.obj["session_factory"])
-    except Exception as e:
-        # If database initialization fails during help display, store the error
-        # The actual command will fail properly if it tries to access the database
-        # This allows --help to work even when the database is unavailable
-        import sqlalchemy.exc
+        ctx.obj["settings"] = get_settings()
+    settings = ctx.obj["settings"]
 
-        if isinstance(e, (sqlalchemy.exc.OperationalError, sqlalchemy.exc.DatabaseError)):
-            ctx.obj["db_init_error"] = e
-        else:
-            # Re-raise non-database errors
-            raise
+    if "session_factory" not in ctx.obj:
+        # Defer engine creation and the migration check until a command
+        # actually opens a session (report, journal, profile, ... never do).
+        ctx.obj["session_factory"] = _lazy_session_factory(
+            settings.database_url,
+            check_migrations=ctx.invoked_subcommand not in _SKIP_MIGRATION_CHECK,
+        )
+
+
+# Commands that never read ctx.obj: skip importing pydantic-settings and
+# parsing .env for them. ``web`` loads its own settings in create_app, and
+# the daemon clears the get_settings cache and reloads it under the
+# client's environment for each forwarded command.
+_NO_SETTINGS_COMMANDS = {"journal", "web", "daemon"}
+
+# Commands that report migrations themselves or are too short-lived for the
+# background check to be worth starting.
+_SKIP_MIGRATION_CHECK = {"migrate", "migrate-status", "status", "report"}
+
+
+def _lazy_session_factory(database_url: str, check_migrations: bool = True):
+    """Return a session factory that initializes the database on first use."""
+    factory = None
+    lock = threading.Lock()
+
+    def make_session():
+        nonlocal factory
+        with lock:
+            if factory is None:
+                from btcedu.db import get_session_factory, init_db
+
+                init_db(database_url)
+                factory = get_session_factory(database_url)
+
+                # Check for pending migrations once the database is reachable
+                if check_migrations:
+                    _schedule_migration_check(database_url)
+        return factory()
+
+    return make_session
+
+
+# How long interpreter exit waits for an unfinished migration check, so
+# short commands still print the warning without hanging on a slow database.
+_MIGRATION_CHECK_EXIT_WAIT = 2.0
+
+
+@cache
+def _schedule_migration_check(database_url: str) -> None:
+    """Run the pending-migration check once per database URL, off the main thread."""
+    from btcedu.db import get_session_factory
+
+    thread = threading.Thread(
+        target=lambda: _check_pending_migrations(get_session_factory(database_url)),
+        name="btcedu-migration-check",
+        daemon=True,
+    )
+    thread.start()
+    atexit.register(thread.join, _MIGRATION_CHECK_EXIT_WAIT)
+
+
+def main() -> None:
+    """Console-script entry point; forwards to a running daemon if configured."""
+    from btcedu.daemon import forward, socket_path_from_env
+
+    socket_path = socket_path_from_env()
+    if socket_path and sys.argv[1:2] != ["daemon"]:
+        exit_code = forward(socket_path, sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+    cli()
+
+
+class _IsoDate(click.ParamType):
+    """``YYYY-MM-DD`` parsed with ``date.fromisoformat`` (no strptime format trials)."""
+
+    name = "date"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            self.fail(f"{value!r} is not a valid date (YYYY-MM-DD).", param, ctx)
+
+
+class _IsoDateTime(click.ParamType):
+    """ISO 8601 date or date-time, parsed with ``datetime.fromisoformat``."""
+
+    name = "datetime"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, datetime):
+            return value
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            self.fail(f"{value!r} is not a valid date (YYYY-MM-DD[ HH:MM:SS]).", param, ctx)
+
+
+def _concurrency_option(f):
+    """Add a ``--concurrency`` option to a per-episode stage command."""
+    return click.option(
+        "--concurrency",
+        type=click.IntRange(min=1),
+        default=1,
+        show_default=True,
+        help="Number of episodes to process in parallel.",
+    )(f)
+
+
+def _for_each_episode(ctx: click.Context, episode_ids, process, concurrency: int = 1) -> None:
+    """Run ``process(session, eid)`` for each episode and echo its result line.
+
+    ``process`` returns the line to print; exceptions are reported as
+    ``[FAIL]``. With ``concurrency > 1`` episodes run on worker threads, each
+    with its own session, and results are still printed in input order.
+    This relies on stages committing before their slow work (LLM, Whisper,
+    uploads): a worker holding SQLite's write lock would lock out the rest.
+    """
+    session_factory = ctx.obj["session_factory"]
+
+    def attempt(session, eid):
+        try:
+            return process(session, eid), False
+        except Exception as e:
+            return f"[FAIL] {eid}: {e}", True
+
+    if concurrency == 1 or len(episode_ids) < 2:
+        with session_factory() as session:
+            for eid in episode_ids:
+                line, failed = attempt(session, eid)
+                click.echo(line, err=failed)
+        return
+
+    def attempt_isolated(eid):
+        with session_factory() as session:
+            return attempt(session, eid)
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(episode_ids))) as executor:
+        for line, failed in executor.map(attempt_isolated, episode_ids):
+            click.echo(line, err=failed)
+
+
+def _fmt_date(dt: datetime) -> str:
+    """``YYYY-MM-DD`` without going through strftime (used in listing loops)."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+def _fmt_datetime(dt: datetime) -> str:
+    """``YYYY-MM-DD HH:MM`` without going through strftime."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
 
 
 def _check_pending_migrations(session_factory):
@@ -94,8 +237,7 @@ def detect(ctx: click.Context, profile: str | None, channel_name: str | None) ->
     # If --profile specified, temporarily override default_content_profile
     if profile:
         settings = settings.model_copy(update={"default_content_profile": profile})
-    session = ctx.obj["session_factory"]()
-    try:
+    with ctx.obj["session_factory"]() as session:
         feed_url_override = None
         if channel_name:
             ch = session.query(Channel).filter(Channel.name == channel_name).first()
@@ -106,22 +248,20 @@ def detect(ctx: click.Context, profile: str | None, channel_name: str | None) ->
             feed_url_override = ch.rss_url
         result = detect_episodes(session, settings, feed_url=feed_url_override)
         click.echo(f"Found: {result.found}  New: {result.new}  Total in DB: {result.total}")
-    finally:
-        session.close()
 
 
 @cli.command()
 @click.option("--max", "max_count", type=int, default=None, help="Max new episodes to insert.")
 @click.option(
     "--since",
-    type=click.DateTime(formats=["%Y-%m-%d"]),
+    type=_IsoDate(),
     default=None,
     help="Only videos published on or after YYYY-MM-DD.",
 )
 @click.option(
     "--until",
     "until_date",
-    type=click.DateTime(formats=["%Y-%m-%d"]),
+    type=_IsoDate(),
     default=None,
     help="Only videos published on or before YYYY-MM-DD.",
 )
@@ -132,8 +272,8 @@ def detect(ctx: click.Context, profile: str | None, channel_name: str | None) ->
 def backfill(
     ctx: click.Context,
     max_count: int | None,
-    since: datetime | None,
-    until_date: datetime | None,
+    since: date | None,
+    until_date: date | None,
     dry_run: bool,
 ) -> None:
     """Import full YouTube channel history via yt-dlp.
@@ -144,23 +284,21 @@ def backfill(
     from btcedu.core.detector import backfill_episodes
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
-        result = backfill_episodes(
-            session,
-            settings,
-            max_count=max_count,
-            since=since.date() if since else None,
-            until=until_date.date() if until_date else None,
-            dry_run=dry_run,
-        )
-        prefix = "[dry-run] " if dry_run else ""
-        click.echo(f"{prefix}Found: {result.found}  New: {result.new}  Total in DB: {result.total}")
-    except Exception as e:
-        click.echo(f"Backfill failed: {e}", err=True)
-        sys.exit(1)
-    finally:
-        session.close()
+    with ctx.obj["session_factory"]() as session:
+        try:
+            result = backfill_episodes(
+                session,
+                settings,
+                max_count=max_count,
+                since=since,
+                until=until_date,
+                dry_run=dry_run,
+            )
+        except Exception as e:
+            click.echo(f"Backfill failed: {e}", err=True)
+            sys.exit(1)
+    prefix = "[dry-run] " if dry_run else ""
+    click.echo(f"{prefix}Found: {result.found}  New: {result.new}  Total in DB: {result.total}")
 
 
 @cli.command()
@@ -172,22 +310,21 @@ def backfill(
     help="Episode ID(s) to download (repeatable).",
 )
 @click.option("--force", is_flag=True, default=False, help="Re-download even if file exists.")
+@_concurrency_option
 @click.pass_context
-def download(ctx: click.Context, episode_ids: tuple[str, ...], force: bool) -> None:
+def download(
+    ctx: click.Context, episode_ids: tuple[str, ...], force: bool, concurrency: int
+) -> None:
     """Download audio for specified episodes."""
     from btcedu.core.detector import download_episode
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                path = download_episode(session, eid, settings, force=force)
-                click.echo(f"[OK] {eid} -> {path}")
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+
+    def process(session, eid):
+        path = download_episode(session, eid, settings, force=force)
+        return f"[OK] {eid} -> {path}"
+
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -199,22 +336,21 @@ def download(ctx: click.Context, episode_ids: tuple[str, ...], force: bool) -> N
     help="Episode ID(s) to transcribe (repeatable).",
 )
 @click.option("--force", is_flag=True, default=False, help="Re-transcribe even if file exists.")
+@_concurrency_option
 @click.pass_context
-def transcribe(ctx: click.Context, episode_ids: tuple[str, ...], force: bool) -> None:
+def transcribe(
+    ctx: click.Context, episode_ids: tuple[str, ...], force: bool, concurrency: int
+) -> None:
     """Transcribe audio for specified episodes via Whisper API."""
     from btcedu.core.transcriber import transcribe_episode
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                path = transcribe_episode(session, eid, settings, force=force)
-                click.echo(f"[OK] {eid} -> {path}")
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+
+    def process(session, eid):
+        path = transcribe_episode(session, eid, settings, force=force)
+        return f"[OK] {eid} -> {path}"
+
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -226,22 +362,19 @@ def transcribe(ctx: click.Context, episode_ids: tuple[str, ...], force: bool) ->
     help="Episode ID(s) to chunk (repeatable).",
 )
 @click.option("--force", is_flag=True, default=False, help="Re-chunk even if file exists.")
+@_concurrency_option
 @click.pass_context
-def chunk(ctx: click.Context, episode_ids: tuple[str, ...], force: bool) -> None:
+def chunk(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, concurrency: int) -> None:
     """Chunk transcripts for specified episodes."""
     from btcedu.core.transcriber import chunk_episode
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                count = chunk_episode(session, eid, settings, force=force)
-                click.echo(f"[OK] {eid} -> {count} chunks")
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+
+    def process(session, eid):
+        count = chunk_episode(session, eid, settings, force=force)
+        return f"[OK] {eid} -> {count} chunks"
+
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -260,40 +393,32 @@ def chunk(ctx: click.Context, episode_ids: tuple[str, ...], force: bool) -> None
 @click.pass_context
 def run(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, profile: str | None) -> None:
     """Run the full pipeline for specific or all pending episodes."""
-    from btcedu.core.pipeline import run_episode_pipeline, write_report
+    from btcedu.core.pipeline import V1_PENDING_STATUSES, run_episode_pipeline, write_report
+    from btcedu.models.episode import Episode
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
+    with ctx.obj["session_factory"]() as session:
+        # Select just the columns the loop prints; each full Episode is
+        # loaded only when its turn comes.
+        q = session.query(Episode.id, Episode.episode_id, Episode.title)
         if episode_ids:
-            episodes = session.query(Episode).filter(Episode.episode_id.in_(episode_ids)).all()
+            q = q.filter(Episode.episode_id.in_(episode_ids))
         else:
-            q = (
-                session.query(Episode)
-                .filter(
-                    Episode.status.in_(
-                        [
-                            EpisodeStatus.NEW,
-                            EpisodeStatus.DOWNLOADED,
-                            EpisodeStatus.TRANSCRIBED,
-                            EpisodeStatus.CHUNKED,
-                            EpisodeStatus.GENERATED,
-                        ]
-                    )
-                )
-                .order_by(Episode.published_at.asc())
+            q = q.filter(Episode.status.in_(V1_PENDING_STATUSES)).order_by(
+                Episode.published_at.asc()
             )
             if profile:
                 q = q.filter(Episode.content_profile == profile)
-            episodes = q.all()
+        episodes = q.all()
 
         if not episodes:
             click.echo("No episodes to process.")
             return
 
         has_failure = False
-        for ep in episodes:
-            click.echo(f"Processing: {ep.episode_id} ({ep.title})")
+        for row in episodes:
+            click.echo(f"Processing: {row.episode_id} ({row.title})")
+            ep = session.get(Episode, row.id)
             report = run_episode_pipeline(session, ep, settings, force=force)
             write_report(report, settings.reports_dir)
 
@@ -310,9 +435,7 @@ def run(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, profile:
                 has_failure = True
 
         if has_failure:
-            sys.exit(1)
-    finally:
-        session.close()
+            ctx.exit(1)
 
 
 @cli.command(name="run-latest")
@@ -327,8 +450,7 @@ def run_latest_cmd(ctx: click.Context, profile: str | None) -> None:
     from btcedu.core.pipeline import run_latest, write_report
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
+    with ctx.obj["session_factory"]() as session:
         report = run_latest(session, settings, profile=profile)
 
         if report is None:
@@ -348,16 +470,14 @@ def run_latest_cmd(ctx: click.Context, profile: str | None) -> None:
             click.echo(f"-> OK (${report.total_cost_usd:.4f})")
         else:
             click.echo(f"-> FAILED: {report.error}", err=True)
-            sys.exit(1)
-    finally:
-        session.close()
+            ctx.exit(1)
 
 
 @cli.command(name="run-pending")
 @click.option("--max", "max_episodes", type=int, default=None, help="Max episodes to process.")
 @click.option(
     "--since",
-    type=click.DateTime(),
+    type=_IsoDateTime(),
     default=None,
     help="Only episodes published after this date (YYYY-MM-DD).",
 )
@@ -366,51 +486,68 @@ def run_latest_cmd(ctx: click.Context, profile: str | None) -> None:
     default=None,
     help="Only process episodes with this content profile.",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of episodes to process concurrently.",
+)
 @click.pass_context
 def run_pending_cmd(
     ctx: click.Context,
     max_episodes: int | None,
     since: datetime | None,
     profile: str | None,
+    workers: int,
 ) -> None:
     """Process all pending episodes through the pipeline."""
-    from btcedu.core.pipeline import run_pending, write_report
+    from btcedu.core.pipeline import run_pending, write_reports
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
+    with ctx.obj["session_factory"]() as session:
         # Add timezone info if since was provided
         if since is not None and since.tzinfo is None:
             since = since.replace(tzinfo=UTC)
 
         reports = run_pending(
-            session, settings, max_episodes=max_episodes, since=since, profile=profile
+            session,
+            settings,
+            max_episodes=max_episodes,
+            since=since,
+            profile=profile,
+            workers=workers,
         )
 
         if not reports:
             click.echo("No pending episodes to process.")
             return
 
+        write_reports(reports, settings.reports_dir)
+
         has_failure = False
-        for report in reports:
-            write_report(report, settings.reports_dir)
+        # Emit summary lines in batches: one write per 10 episodes, not per line
+        lines = []
+        for i, report in enumerate(reports, 1):
             status_str = "OK" if report.success else "FAILED"
-            click.echo(
+            lines.append(
                 f"  [{status_str}] {report.episode_id}: {report.title[:50]} "
                 f"(${report.total_cost_usd:.4f})"
             )
             if not report.success:
                 has_failure = True
+            if i % 10 == 0:
+                click.echo("\n".join(lines))
+                lines.clear()
 
         ok = sum(1 for r in reports if r.success)
         fail = len(reports) - ok
         total_cost = sum(r.total_cost_usd for r in reports)
-        click.echo(f"\nDone: {ok} ok, {fail} failed, ${total_cost:.4f} total cost")
+        lines.append(f"\nDone: {ok} ok, {fail} failed, ${total_cost:.4f} total cost")
+        click.echo("\n".join(lines))
 
         if has_failure:
-            sys.exit(1)
-    finally:
-        session.close()
+            ctx.exit(1)
 
 
 @cli.command()
@@ -427,8 +564,7 @@ def retry(ctx: click.Context, episode_ids: tuple[str, ...]) -> None:
     from btcedu.core.pipeline import retry_episode, write_report
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
+    with ctx.obj["session_factory"]() as session:
         has_failure = False
         for eid in episode_ids:
             try:
@@ -445,9 +581,7 @@ def retry(ctx: click.Context, episode_ids: tuple[str, ...]) -> None:
                 has_failure = True
 
         if has_failure:
-            sys.exit(1)
-    finally:
-        session.close()
+            ctx.exit(1)
 
 
 @cli.command()
@@ -457,20 +591,27 @@ def retry(ctx: click.Context, episode_ids: tuple[str, ...]) -> None:
 @click.pass_context
 def report(ctx: click.Context, episode_id: str) -> None:
     """Show the latest pipeline report for an episode."""
-    settings = ctx.obj["settings"]
-    report_dir = Path(settings.reports_dir) / episode_id
+    from btcedu.utils import jsonio
 
-    if not report_dir.exists():
-        click.echo(f"No reports found for {episode_id}")
-        return
+    settings = ctx.obj["settings"]
+    report_dir = os.path.join(settings.reports_dir, episode_id)
 
-    reports = sorted(report_dir.glob("report_*.json"), reverse=True)
-    if not reports:
+    # Timestamped names sort chronologically, so the newest is the max name
+    try:
+        with os.scandir(report_dir) as entries:
+            latest = max(
+                (e for e in entries if e.name.startswith("report_") and e.name.endswith(".json")),
+                key=lambda e: e.name,
+                default=None,
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        latest = None
+    if latest is None:
         click.echo(f"No reports found for {episode_id}")
         return
 
-    latest = reports[0]
-    data = json.loads(latest.read_text())
+    with open(latest.path, "rb") as f:
+        data = jsonio.loads(f.read())
 
     click.echo(f"=== Report: {episode_id} ===")
     click.echo(f"  Title:     {data['title']}")
@@ -500,10 +641,11 @@ def report(ctx: click.Context, episode_id: str) -> None:
 @click.pass_context
 def status(ctx: click.Context) -> None:
     """Show pipeline status: counts by status + last 10 episodes."""
-    session = ctx.obj["session_factory"]()
-    try:
-        from sqlalchemy import func
+    from sqlalchemy import func
 
+    from btcedu.models.episode import Episode
+
+    with ctx.obj["session_factory"]() as session:
         rows = session.query(Episode.status, func.count()).group_by(Episode.status).all()
         total = sum(c for _, c in rows)
         click.echo(f"=== Episodes: {total} ===")
@@ -512,17 +654,27 @@ def status(ctx: click.Context) -> None:
 
         click.echo("")
         click.echo("--- Last 10 episodes ---")
-        recent = session.query(Episode).order_by(Episode.detected_at.desc()).limit(10).all()
+        # Only the displayed columns: no ORM hydration or identity-map work
+        recent = (
+            session.query(
+                Episode.episode_id,
+                Episode.status,
+                Episode.published_at,
+                Episode.title,
+                Episode.error_message,
+            )
+            .order_by(Episode.detected_at.desc())
+            .limit(10)
+            .all()
+        )
         if not recent:
             click.echo("  (none)")
         for ep in recent:
-            pub = ep.published_at.strftime("%Y-%m-%d") if ep.published_at else "???"
+            pub = _fmt_date(ep.published_at) if ep.published_at else "???"
             err = ""
             if ep.error_message:
                 err = f"  !! {ep.error_message[:40]}"
             click.echo(f"  [{ep.status.value:<12}] {ep.episode_id}  {pub}  {ep.title[:50]}{err}")
-    finally:
-        session.close()
 
 
 @cli.command()
@@ -535,25 +687,21 @@ def status(ctx: click.Context) -> None:
 )
 @click.option("--force", is_flag=True, default=False, help="Regenerate even if outputs exist.")
 @click.option("--top-k", type=int, default=16, help="Number of chunks to retrieve for context.")
+@_concurrency_option
 @click.pass_context
-def generate(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, top_k: int) -> None:
+def generate(
+    ctx: click.Context, episode_ids: tuple[str, ...], force: bool, top_k: int, concurrency: int
+) -> None:
     """Generate Turkish content package for CHUNKED episodes."""
     from btcedu.core.generator import generate_content
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = generate_content(session, eid, settings, force=force, top_k=top_k)
-                click.echo(
-                    f"[OK] {eid} -> {len(result.artifacts)} artifacts "
-                    f"(${result.total_cost_usd:.4f})"
-                )
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+
+    def process(session, eid):
+        result = generate_content(session, eid, settings, force=force, top_k=top_k)
+        return f"[OK] {eid} -> {len(result.artifacts)} artifacts (${result.total_cost_usd:.4f})"
+
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -565,25 +713,19 @@ def generate(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, top_
     help="Episode ID(s) to refine (repeatable).",
 )
 @click.option("--force", is_flag=True, default=False, help="Re-refine even if v2 outputs exist.")
+@_concurrency_option
 @click.pass_context
-def refine(ctx: click.Context, episode_ids: tuple[str, ...], force: bool) -> None:
+def refine(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, concurrency: int) -> None:
     """Refine generated content using QA feedback (v1 -> v2)."""
     from btcedu.core.generator import refine_content
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = refine_content(session, eid, settings, force=force)
-                click.echo(
-                    f"[OK] {eid} -> {len(result.artifacts)} artifacts "
-                    f"(${result.total_cost_usd:.4f})"
-                )
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+
+    def process(session, eid):
+        result = refine_content(session, eid, settings, force=force)
+        return f"[OK] {eid} -> {len(result.artifacts)} artifacts (${result.total_cost_usd:.4f})"
+
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -595,25 +737,42 @@ def refine(ctx: click.Context, episode_ids: tuple[str, ...], force: bool) -> Non
     help="Episode ID(s) to correct (repeatable).",
 )
 @click.option("--force", is_flag=True, default=False, help="Re-correct even if output exists.")
+@click.option(
+    "--batch",
+    is_flag=True,
+    default=False,
+    help="Submit all episodes as one Anthropic Message Batch (half price, waits for completion).",
+)
+@_concurrency_option
 @click.pass_context
-def correct(ctx: click.Context, episode_ids: tuple[str, ...], force: bool) -> None:
+def correct(
+    ctx: click.Context, episode_ids: tuple[str, ...], force: bool, batch: bool, concurrency: int
+) -> None:
     """Correct Whisper transcripts for specified episodes (v2 pipeline)."""
-    from btcedu.core.corrector import correct_transcript
+    from btcedu.core.corrector import correct_transcript, correct_transcripts_batch
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = correct_transcript(session, eid, settings, force=force)
-                click.echo(
-                    f"[OK] {eid} -> {result.corrected_path} "
-                    f"({result.change_count} changes, ${result.cost_usd:.4f})"
-                )
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+
+    def result_line(eid, result):
+        return (
+            f"[OK] {eid} -> {result.corrected_path} "
+            f"({result.change_count} changes, ${result.cost_usd:.4f})"
+        )
+
+    if batch:
+        with ctx.obj["session_factory"]() as session:
+            results = correct_transcripts_batch(session, list(episode_ids), settings, force=force)
+        for eid, result in results.items():
+            if isinstance(result, Exception):
+                click.echo(f"[FAIL] {eid}: {result}", err=True)
+            else:
+                click.echo(result_line(eid, result))
+        return
+
+    def process(session, eid):
+        return result_line(eid, correct_transcript(session, eid, settings, force=force))
+
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -631,32 +790,29 @@ def correct(ctx: click.Context, episode_ids: tuple[str, ...], force: bool) -> No
     default=False,
     help="Write request JSON instead of calling Claude API.",
 )
+@_concurrency_option
 @click.pass_context
-def segment(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, dry_run: bool) -> None:
+def segment(
+    ctx: click.Context, episode_ids: tuple[str, ...], force: bool, dry_run: bool, concurrency: int
+) -> None:
     """Segment corrected broadcast transcript into discrete news stories (v2 news pipeline)."""
     from btcedu.core.segmenter import segment_broadcast
 
     settings = ctx.obj["settings"]
     if dry_run:
-        settings.dry_run = True
+        settings = settings.model_copy(update={"dry_run": True})
+
+    def process(session, eid):
+        result = segment_broadcast(session, eid, settings, force=force)
+        if result.skipped:
+            return f"[SKIP] {eid} -> segment not enabled or already up-to-date"
+        return (
+            f"[OK] {eid} -> {result.story_count} stories, "
+            f"~{result.total_duration_seconds}s total, "
+            f"${result.cost_usd:.4f}"
+        )
 
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = segment_broadcast(session, eid, settings, force=force)
-                if result.skipped:
-                    click.echo(f"[SKIP] {eid} -> segment not enabled or already up-to-date")
-                else:
-                    click.echo(
-                        f"[OK] {eid} -> {result.story_count} stories, "
-                        f"~{result.total_duration_seconds}s total, "
-                        f"${result.cost_usd:.4f}"
-                    )
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -674,32 +830,29 @@ def segment(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, dry_r
     default=False,
     help="Write request JSON instead of calling Claude API.",
 )
+@_concurrency_option
 @click.pass_context
-def translate(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, dry_run: bool) -> None:
+def translate(
+    ctx: click.Context, episode_ids: tuple[str, ...], force: bool, dry_run: bool, concurrency: int
+) -> None:
     """Translate corrected German transcripts to Turkish (v2 pipeline)."""
     from btcedu.core.translator import translate_transcript
 
     settings = ctx.obj["settings"]
     if dry_run:
-        settings.dry_run = True
+        settings = settings.model_copy(update={"dry_run": True})
+
+    def process(session, eid):
+        result = translate_transcript(session, eid, settings, force=force)
+        if result.skipped:
+            return f"[SKIP] {eid} -> already up-to-date (idempotent)"
+        return (
+            f"[OK] {eid} -> {result.translated_path} "
+            f"({result.input_char_count}→{result.output_char_count} chars, "
+            f"${result.cost_usd:.4f})"
+        )
 
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = translate_transcript(session, eid, settings, force=force)
-                if result.skipped:
-                    click.echo(f"[SKIP] {eid} -> already up-to-date (idempotent)")
-                else:
-                    click.echo(
-                        f"[OK] {eid} -> {result.translated_path} "
-                        f"({result.input_char_count}→{result.output_char_count} chars, "
-                        f"${result.cost_usd:.4f})"
-                    )
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -717,33 +870,53 @@ def translate(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, dry
     default=False,
     help="Write request JSON instead of calling Claude API.",
 )
+@click.option(
+    "--batch",
+    is_flag=True,
+    default=False,
+    help="Submit all episodes as one Anthropic Message Batch (half price, waits for completion).",
+)
+@_concurrency_option
 @click.pass_context
-def adapt(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, dry_run: bool) -> None:
+def adapt(
+    ctx: click.Context,
+    episode_ids: tuple[str, ...],
+    force: bool,
+    dry_run: bool,
+    batch: bool,
+    concurrency: int,
+) -> None:
     """Adapt Turkish translation for Turkey context (v2 pipeline)."""
-    from btcedu.core.adapter import adapt_script
+    from btcedu.core.adapter import adapt_script, adapt_scripts_batch
 
     settings = ctx.obj["settings"]
     if dry_run:
-        settings.dry_run = True
+        settings = settings.model_copy(update={"dry_run": True})
+
+    def result_line(eid, result):
+        if result.skipped:
+            return f"[SKIP] {eid} -> already up-to-date (idempotent)"
+        return (
+            f"[OK] {eid} -> {result.adapted_path} "
+            f"({result.adaptation_count} adaptations: "
+            f"T1={result.tier1_count}, T2={result.tier2_count}, "
+            f"${result.cost_usd:.4f})"
+        )
 
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = adapt_script(session, eid, settings, force=force)
-                if result.skipped:
-                    click.echo(f"[SKIP] {eid} -> already up-to-date (idempotent)")
-                else:
-                    click.echo(
-                        f"[OK] {eid} -> {result.adapted_path} "
-                        f"({result.adaptation_count} adaptations: "
-                        f"T1={result.tier1_count}, T2={result.tier2_count}, "
-                        f"${result.cost_usd:.4f})"
-                    )
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+    if batch:
+        with ctx.obj["session_factory"]() as session:
+            results = adapt_scripts_batch(session, list(episode_ids), settings, force=force)
+        for eid, result in results.items():
+            if isinstance(result, Exception):
+                click.echo(f"[FAIL] {eid}: {result}", err=True)
+            else:
+                click.echo(result_line(eid, result))
+        return
+
+    def process(session, eid):
+        return result_line(eid, adapt_script(session, eid, settings, force=force))
+
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -761,35 +934,34 @@ def adapt(ctx: click.Context, episode_ids: tuple[str, ...], force: bool, dry_run
     default=False,
     help="Write request JSON instead of calling Claude API.",
 )
+@_concurrency_option
 @click.pass_context
 def chapterize(
-    ctx: click.Context, episode_ids: tuple[str, ...], force: bool, dry_run: bool
+    ctx: click.Context,
+    episode_ids: tuple[str, ...],
+    force: bool,
+    dry_run: bool,
+    concurrency: int,
 ) -> None:
     """Chapterize adapted script into production JSON (v2 pipeline)."""
     from btcedu.core.chapterizer import chapterize_script
 
     settings = ctx.obj["settings"]
     if dry_run:
-        settings.dry_run = True
+        settings = settings.model_copy(update={"dry_run": True})
+
+    def process(session, eid):
+        result = chapterize_script(session, eid, settings, force=force)
+        if result.skipped:
+            return f"[SKIP] {eid} -> already up-to-date (idempotent)"
+        return (
+            f"[OK] {eid} -> {result.chapter_count} chapters, "
+            f"~{result.estimated_duration_seconds}s total, "
+            f"{result.input_tokens} in / {result.output_tokens} out "
+            f"(${result.cost_usd:.4f})"
+        )
 
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = chapterize_script(session, eid, settings, force=force)
-                if result.skipped:
-                    click.echo(f"[SKIP] {eid} -> already up-to-date (idempotent)")
-                else:
-                    click.echo(
-                        f"[OK] {eid} -> {result.chapter_count} chapters, "
-                        f"~{result.estimated_duration_seconds}s total, "
-                        f"{result.input_tokens} in / {result.output_tokens} out "
-                        f"(${result.cost_usd:.4f})"
-                    )
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -818,6 +990,7 @@ def chapterize(
     default=None,
     help="Regenerate images for a specific chapter only.",
 )
+@_concurrency_option
 @click.pass_context
 def imagegen(
     ctx: click.Context,
@@ -825,32 +998,27 @@ def imagegen(
     force: bool,
     dry_run: bool,
     chapter_id: str | None,
+    concurrency: int,
 ) -> None:
     """Generate images for chapters (v2 pipeline, Sprint 7)."""
     from btcedu.core.image_generator import generate_images
 
     settings = ctx.obj["settings"]
     if dry_run:
-        settings.dry_run = True
+        settings = settings.model_copy(update={"dry_run": True})
+
+    def process(session, eid):
+        result = generate_images(session, eid, settings, force=force, chapter_id=chapter_id)
+        if result.skipped:
+            return f"[SKIP] {eid} -> already up-to-date (idempotent)"
+        return (
+            f"[OK] {eid} -> {result.generated_count}/{result.image_count} "
+            f"images generated, {result.template_count} placeholders, "
+            f"{result.failed_count} failed, {result.input_tokens} in / "
+            f"{result.output_tokens} out (${result.cost_usd:.4f})"
+        )
 
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = generate_images(session, eid, settings, force=force, chapter_id=chapter_id)
-                if result.skipped:
-                    click.echo(f"[SKIP] {eid} -> already up-to-date (idempotent)")
-                else:
-                    click.echo(
-                        f"[OK] {eid} -> {result.generated_count}/{result.image_count} "
-                        f"images generated, {result.template_count} placeholders, "
-                        f"{result.failed_count} failed, {result.input_tokens} in / "
-                        f"{result.output_tokens} out (${result.cost_usd:.4f})"
-                    )
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command("frame-edit")
@@ -863,36 +1031,32 @@ def imagegen(
 )
 @click.option("--force", is_flag=True, default=False, help="Re-edit even if current.")
 @click.option("--dry-run", is_flag=True, default=False, help="Copy frames without Gemini.")
+@_concurrency_option
 @click.pass_context
 def frame_edit(
     ctx: click.Context,
     episode_ids: tuple[str, ...],
     force: bool,
     dry_run: bool,
+    concurrency: int,
 ) -> None:
     """Edit extracted frames via Gemini (translate DE text to TR)."""
     from btcedu.core.frame_editor import edit_frames
 
     settings = ctx.obj["settings"]
     if dry_run:
-        settings.dry_run = True
+        settings = settings.model_copy(update={"dry_run": True})
+
+    def process(session, eid):
+        result = edit_frames(session, eid, settings, force=force)
+        if result.skipped:
+            return f"[SKIP] {eid} -> already up-to-date"
+        return (
+            f"[OK] {eid} -> {result.chapters_edited} edited, "
+            f"{result.chapters_skipped} skipped (${result.total_cost_usd:.4f})"
+        )
 
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = edit_frames(session, eid, settings, force=force)
-                if result.skipped:
-                    click.echo(f"[SKIP] {eid} -> already up-to-date")
-                else:
-                    click.echo(
-                        f"[OK] {eid} -> {result.chapters_edited} edited, "
-                        f"{result.chapters_skipped} skipped (${result.total_cost_usd:.4f})"
-                    )
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -921,6 +1085,7 @@ def frame_edit(
     default=None,
     help="Regenerate audio for a specific chapter only.",
 )
+@_concurrency_option
 @click.pass_context
 def tts(
     ctx: click.Context,
@@ -928,32 +1093,27 @@ def tts(
     force: bool,
     dry_run: bool,
     chapter_id: str | None,
+    concurrency: int,
 ) -> None:
     """Generate TTS audio for chapters (v2 pipeline, Sprint 8)."""
     from btcedu.core.tts import generate_tts
 
     settings = ctx.obj["settings"]
     if dry_run:
-        settings.dry_run = True
+        settings = settings.model_copy(update={"dry_run": True})
+
+    def process(session, eid):
+        result = generate_tts(session, eid, settings, force=force, chapter_id=chapter_id)
+        if result.skipped:
+            return f"[SKIP] {eid} -> already up-to-date (idempotent)"
+        return (
+            f"[OK] {eid} -> {result.segment_count} segments, "
+            f"{result.total_duration_seconds:.1f}s total, "
+            f"{result.total_characters} chars "
+            f"(${result.cost_usd:.4f})"
+        )
 
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = generate_tts(session, eid, settings, force=force, chapter_id=chapter_id)
-                if result.skipped:
-                    click.echo(f"[SKIP] {eid} -> already up-to-date (idempotent)")
-                else:
-                    click.echo(
-                        f"[OK] {eid} -> {result.segment_count} segments, "
-                        f"{result.total_duration_seconds:.1f}s total, "
-                        f"{result.total_characters} chars "
-                        f"(${result.cost_usd:.4f})"
-                    )
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command()
@@ -976,37 +1136,33 @@ def tts(
     default=False,
     help="Generate render manifest and segments without executing ffmpeg.",
 )
+@_concurrency_option
 @click.pass_context
 def render(
     ctx: click.Context,
     episode_ids: tuple[str, ...],
     force: bool,
     dry_run: bool,
+    concurrency: int,
 ) -> None:
     """Render draft video from chapters, images, and TTS audio (v2 pipeline, Sprint 9)."""
     from btcedu.core.renderer import render_video
 
     settings = ctx.obj["settings"]
     if dry_run:
-        settings.dry_run = True
+        settings = settings.model_copy(update={"dry_run": True})
+
+    def process(session, eid):
+        result = render_video(session, eid, settings, force=force)
+        if result.skipped:
+            return f"[SKIP] {eid} -> already up-to-date (idempotent)"
+        return (
+            f"[OK] {eid} -> {result.segment_count} segments, "
+            f"{result.total_duration_seconds:.1f}s, "
+            f"{result.total_size_bytes / 1024 / 1024:.1f}MB"
+        )
 
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = render_video(session, eid, settings, force=force)
-                if result.skipped:
-                    click.echo(f"[SKIP] {eid} -> already up-to-date (idempotent)")
-                else:
-                    click.echo(
-                        f"[OK] {eid} -> {result.segment_count} segments, "
-                        f"{result.total_duration_seconds:.1f}s, "
-                        f"{result.total_size_bytes / 1024 / 1024:.1f}MB"
-                    )
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.group()
@@ -1025,11 +1181,23 @@ def review(ctx: click.Context) -> None:
 @click.pass_context
 def review_list(ctx: click.Context, status: str | None) -> None:
     """List review tasks."""
+    from btcedu.models.episode import Episode
     from btcedu.models.review import ReviewStatus, ReviewTask
 
-    session = ctx.obj["session_factory"]()
-    try:
-        query = session.query(ReviewTask).order_by(ReviewTask.created_at.desc())
+    with ctx.obj["session_factory"]() as session:
+        # One joined SELECT instead of an Episode lookup per task
+        query = (
+            session.query(
+                ReviewTask.id,
+                ReviewTask.episode_id,
+                ReviewTask.stage,
+                ReviewTask.status,
+                ReviewTask.created_at,
+                Episode.title,
+            )
+            .outerjoin(Episode, Episode.episode_id == ReviewTask.episode_id)
+            .order_by(ReviewTask.created_at.desc())
+        )
 
         if status:
             query = query.filter(ReviewTask.status == status)
@@ -1039,20 +1207,19 @@ def review_list(ctx: click.Context, status: str | None) -> None:
                 ReviewTask.status.in_([ReviewStatus.PENDING.value, ReviewStatus.IN_REVIEW.value])
             )
 
-        tasks = query.all()
-        if not tasks:
+        # Stream rows in batches instead of materialising the whole listing
+        rows = iter(query.yield_per(200))
+        first = next(rows, None)
+        if first is None:
             click.echo("No review tasks found.")
             return
 
         click.echo(f"{'ID':<5} {'Episode':<20} {'Stage':<10} {'Status':<20} {'Created'}")
         click.echo("-" * 80)
-        for t in tasks:
-            ep = session.query(Episode).filter(Episode.episode_id == t.episode_id).first()
-            title = ep.title[:18] if ep else t.episode_id[:18]
-            created = t.created_at.strftime("%Y-%m-%d %H:%M") if t.created_at else "?"
+        for t in itertools.chain([first], rows):
+            title = t.title[:18] if t.title is not None else t.episode_id[:18]
+            created = _fmt_datetime(t.created_at) if t.created_at else "?"
             click.echo(f"{t.id:<5} {title:<20} {t.stage:<10} {t.status:<20} {created}")
-    finally:
-        session.close()
 
 
 @review.command()
@@ -1064,15 +1231,13 @@ def approve(ctx: click.Context, review_id: int, notes: str | None, rating: int |
     """Approve a review task."""
     from btcedu.core.reviewer import approve_review
 
-    session = ctx.obj["session_factory"]()
-    try:
-        decision = approve_review(session, review_id, notes=notes, quality_rating=rating)
-        stars = f" ({'\u2605' * rating}{'\u2606' * (5 - rating)})" if rating else ""
-        click.echo(f"[OK] Review {review_id} approved{stars} (decision {decision.id})")
-    except ValueError as e:
-        click.echo(f"[FAIL] {e}", err=True)
-    finally:
-        session.close()
+    with ctx.obj["session_factory"]() as session:
+        try:
+            decision = approve_review(session, review_id, notes=notes, quality_rating=rating)
+            stars = f" ({'\u2605' * rating}{'\u2606' * (5 - rating)})" if rating else ""
+            click.echo(f"[OK] Review {review_id} approved{stars} (decision {decision.id})")
+        except ValueError as e:
+            click.echo(f"[FAIL] {e}", err=True)
 
 
 @review.command()
@@ -1084,15 +1249,13 @@ def reject(ctx: click.Context, review_id: int, notes: str | None, rating: int |
     """Reject a review task (reverts episode to TRANSCRIBED)."""
     from btcedu.core.reviewer import reject_review
 
-    session = ctx.obj["session_factory"]()
-    try:
-        decision = reject_review(session, review_id, notes=notes, quality_rating=rating)
-        stars = f" ({'\u2605' * rating}{'\u2606' * (5 - rating)})" if rating else ""
-        click.echo(f"[OK] Review {review_id} rejected{stars} (decision {decision.id})")
-    except ValueError as e:
-        click.echo(f"[FAIL] {e}", err=True)
-    finally:
-        session.close()
+    with ctx.obj["session_factory"]() as session:
+        try:
+            decision = reject_review(session, review_id, notes=notes, quality_rating=rating)
+            stars = f" ({'\u2605' * rating}{'\u2606' * (5 - rating)})" if rating else ""
+            click.echo(f"[OK] Review {review_id} rejected{stars} (decision {decision.id})")
+        except ValueError as e:
+            click.echo(f"[FAIL] {e}", err=True)
 
 
 @review.command(name="request-changes")
@@ -1106,17 +1269,15 @@ def request_changes_cmd(
     """Request changes on a review task (reverts episode and marks artifacts stale)."""
     from btcedu.core.reviewer import request_changes
 
-    session = ctx.obj["session_factory"]()
-    try:
-        decision = request_changes(session, review_id, notes=notes, quality_rating=rating)
-        stars = f" ({'\u2605' * rating}{'\u2606' * (5 - rating)})" if rating else ""
-        click.echo(
-            f"[OK] Changes requested on review {review_id}{stars} (decision {decision.id})"
-        )
-    except ValueError as e:
-        click.echo(f"[FAIL] {e}", err=True)
-    finally:
-        session.close()
+    with ctx.obj["session_factory"]() as session:
+        try:
+            decision = request_changes(session, review_id, notes=notes, quality_rating=rating)
+            stars = f" ({'\u2605' * rating}{'\u2606' * (5 - rating)})" if rating else ""
+            click.echo(
+                f"[OK] Changes requested on review {review_id}{stars} (decision {decision.id})"
+            )
+        except ValueError as e:
+            click.echo(f"[FAIL] {e}", err=True)
 
 
 @review.command()
@@ -1132,8 +1293,7 @@ def feedback(
 
     from btcedu.core.reviewer import get_all_feedback
 
-    session = ctx.obj["session_factory"]()
-    try:
+    with ctx.obj["session_factory"]() as session:
         results = get_all_feedback(session, stage=stage, profile=profile)
         if not results:
             click.echo("No feedback found.")
@@ -1155,8 +1315,6 @@ def feedback(
                 if fb["notes"]:
                     click.echo(f"  → {fb['notes'][:120]}")
             click.echo(f"\nTotal: {len(results)} feedback entries")
-    finally:
-        session.close()
 
 
 @cli.group()
@@ -1168,43 +1326,95 @@ def prompt(ctx: click.Context) -> None:
 
 @prompt.command(name="list")
 @click.option("--name", default=None, help="Filter by prompt name.")
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=50,
+    show_default=True,
+    help="Maximum number of versions to list (ignored with --name).",
+)
+@click.option(
+    "--after",
+    default=None,
+    metavar="NAME:VERSION",
+    help="Continue listing after this cursor (printed as next-cursor).",
+)
 @click.pass_context
-def prompt_list(ctx: click.Context, name: str | None) -> None:
+def prompt_list(ctx: click.Context, name: str | None, limit: int, after: str | None) -> None:
     """List prompt versions."""
+    from sqlalchemy import and_, or_
+
     from btcedu.core.prompt_registry import PromptRegistry
     from btcedu.models.prompt_version import PromptVersion
 
-    session = ctx.obj["session_factory"]()
-    try:
+    after_key = None
+    if after:
+        after_name, _, after_version = after.rpartition(":")
+        if not after_name or not after_version.isdigit():
+            raise click.BadParameter(
+                f"{after!r} is not a NAME:VERSION cursor.", param_hint="--after"
+            )
+        after_key = (after_name, int(after_version))
+
+    next_cursor = None
+    with ctx.obj["session_factory"]() as session:
         if name:
             registry = PromptRegistry(session)
             versions = registry.get_history(name)
         else:
+            # Keyset pagination on (name ASC, version DESC): each page is an
+            # index range scan, however far into the registry it starts.
+            query = session.query(PromptVersion)
+            if after_key:
+                query = query.filter(
+                    or_(
+                        PromptVersion.name > after_key[0],
+                        and_(
+                            PromptVersion.name == after_key[0],
+                            PromptVersion.version < after_key[1],
+                        ),
+                    )
+                )
+            # Fetched in batches rather than as one list of ORM objects; the
+            # extra row only tells us whether to emit a cursor.
             versions = (
-                session.query(PromptVersion)
-                .order_by(PromptVersion.name, PromptVersion.version.desc())
-                .all()
+                query.order_by(PromptVersion.name, PromptVersion.version.desc())
+                .limit(limit + 1)
+                .yield_per(200)
             )
 
-        if not versions:
-            click.echo("No prompt versions registered.")
-            return
+        # Header and rows share one template, bound once outside the loop
+        row_format = "{:<5} {:<25} {:<5} {:<9} {:<14} {:<30} {}".format
 
-        click.echo(
-            f"{'ID':<5} {'Name':<25} {'Ver':<5} {'Default':<9} "
-            f"{'Hash':<14} {'Model':<30} {'Created'}"
-        )
-        click.echo("-" * 110)
+        # The page is bounded by --limit: build it and write it in one go
+        lines = []
+        page_end = None
         for pv in versions:
-            created = pv.created_at.strftime("%Y-%m-%d %H:%M") if pv.created_at else "?"
-            default = "✓" if pv.is_default else ""
-            hash_short = pv.content_hash[:12] if pv.content_hash else "?"
-            click.echo(
-                f"{pv.id:<5} {pv.name:<25} {pv.version:<5} {default:<9} {hash_short:<14} "
-                f"{(pv.model or ''):<30} {created}"
+            if not name and len(lines) == limit:
+                next_cursor = page_end
+                break
+            lines.append(
+                row_format(
+                    pv.id,
+                    pv.name,
+                    pv.version,
+                    "✓" if pv.is_default else "",
+                    pv.content_hash[:12] if pv.content_hash else "?",
+                    pv.model or "",
+                    _fmt_datetime(pv.created_at) if pv.created_at else "?",
+                )
             )
-    finally:
-        session.close()
+            page_end = f"{pv.name}:{pv.version}"
+
+        if not lines:
+            click.echo("No prompt versions registered.")
+            return
+
+        header = row_format("ID", "Name", "Ver", "Default", "Hash", "Model", "Created")
+        lines[:0] = [header, "-" * 110]
+        if next_cursor:
+            lines.append(f"next-cursor: {next_cursor}")
+        click.echo("\n".join(lines))
 
 
 @prompt.command()
@@ -1214,15 +1424,13 @@ def promote(ctx: click.Context, version_id: int) -> None:
     """Promote a prompt version to default."""
     from btcedu.core.prompt_registry import PromptRegistry
 
-    session = ctx.obj["session_factory"]()
-    try:
-        registry = PromptRegistry(session)
-        registry.promote_to_default(version_id)
-        click.echo(f"[OK] Prompt version {version_id} promoted to default.")
-    except ValueError as e:
-        click.echo(f"[FAIL] {e}", err=True)
-    finally:
-        session.close()
+    with ctx.obj["session_factory"]() as session:
+        try:
+            registry = PromptRegistry(session)
+            registry.promote_to_default(version_id)
+            click.echo(f"[OK] Prompt version {version_id} promoted to default.")
+        except ValueError as e:
+            click.echo(f"[FAIL] {e}", err=True)
 
 
 @cli.command()
@@ -1230,60 +1438,79 @@ def promote(ctx: click.Context, version_id: int) -> None:
 @click.pass_context
 def cost(ctx: click.Context, episode_id: str | None) -> None:
     """Show API usage costs from PipelineRun records."""
-    from sqlalchemy import func
+    from sqlalchemy import String, cast, func, select
+    from sqlalchemy.orm import aliased
 
-    from btcedu.models.episode import PipelineRun
+    from btcedu.models.episode import Episode, PipelineRun
+
+    with ctx.obj["session_factory"]() as session:
+        # Distinct-episode count rides along as a scalar subquery, so the
+        # per-stage totals and the episode count come back in one statement.
+        runs = aliased(PipelineRun)
+        ep_count_q = select(func.count(func.distinct(runs.episode_id)))
+        if episode_id:
+            # Filter through the natural key in the same statement instead
+            # of looking up the episode's primary key first
+            ep_count_q = ep_count_q.join(Episode, Episode.id == runs.episode_id).where(
+                Episode.episode_id == episode_id
+            )
 
-    session = ctx.obj["session_factory"]()
-    try:
         query = session.query(
-            PipelineRun.stage,
+            # Stages are stored by enum name; every PipelineStage value is its
+            # lower-cased name, so the display string comes straight from SQL.
+            func.lower(cast(PipelineRun.stage, String)).label("stage"),
             func.count().label("runs"),
-            func.sum(PipelineRun.input_tokens).label("input_tokens"),
-            func.sum(PipelineRun.output_tokens).label("output_tokens"),
-            func.sum(PipelineRun.estimated_cost_usd).label("total_cost"),
+            func.coalesce(func.sum(PipelineRun.input_tokens), 0).label("input_tokens"),
+            func.coalesce(func.sum(PipelineRun.output_tokens), 0).label("output_tokens"),
+            func.coalesce(func.sum(PipelineRun.estimated_cost_usd), 0.0).label("total_cost"),
+            # Window over the grouped sums: every row carries the grand total
+            func.coalesce(func.sum(func.sum(PipelineRun.estimated_cost_usd)).over(), 0.0).label(
+                "grand_total"
+            ),
+            ep_count_q.scalar_subquery().label("episodes"),
         )
-
         if episode_id:
-            ep = session.query(Episode).filter(Episode.episode_id == episode_id).first()
-            if not ep:
-                click.echo(f"Episode not found: {episode_id}")
-                return
-            query = query.filter(PipelineRun.episode_id == ep.id)
+            query = query.join(Episode, Episode.id == PipelineRun.episode_id).filter(
+                Episode.episode_id == episode_id
+            )
 
         rows = query.group_by(PipelineRun.stage).all()
 
         if not rows:
-            click.echo("No pipeline runs recorded yet.")
+            # Only the empty result needs to tell a missing episode apart
+            if episode_id and (
+                session.query(Episode.id).filter(Episode.episode_id == episode_id).first() is None
+            ):
+                click.echo(f"Episode not found: {episode_id}")
+            else:
+                click.echo("No pipeline runs recorded yet.")
             return
 
-        click.echo("=== API Usage Costs ===")
-        grand_total = 0.0
+        lines = ["=== API Usage Costs ==="]
         for row in rows:
-            cost_val = row.total_cost or 0.0
-            grand_total += cost_val
-            click.echo(
-                f"  {row.stage.value:<12} "
+            lines.append(
+                f"  {row.stage:<12} "
                 f"runs={row.runs}  "
-                f"in={row.input_tokens or 0:>8}  "
-                f"out={row.output_tokens or 0:>8}  "
-                f"${cost_val:.4f}"
+                f"in={row.input_tokens:>8}  "
+                f"out={row.output_tokens:>8}  "
+                f"${row.total_cost:.4f}"
             )
-        click.echo(f"  {'TOTAL':<12} ${grand_total:.4f}")
+        grand_total = rows[0].grand_total
+        lines.append(f"  {'TOTAL':<12} ${grand_total:.4f}")
 
         # Episode count and per-episode average
-        ep_count = session.query(func.count(func.distinct(PipelineRun.episode_id))).scalar()
+        ep_count = rows[0].episodes
         if ep_count and ep_count > 0:
-            click.echo(f"\n  Episodes processed: {ep_count}")
-            click.echo(f"  Avg cost/episode:   ${grand_total / ep_count:.4f}")
-    finally:
-        session.close()
+            lines.append(f"\n  Episodes processed: {ep_count}")
+            lines.append(f"  Avg cost/episode:   ${grand_total / ep_count:.4f}")
+        click.echo("\n".join(lines))
 
 
 @cli.command(name="init-db")
 @click.pass_context
 def init_db_cmd(ctx: click.Context) -> None:
     """Initialize the database (create tables)."""
+    ctx.obj["session_factory"]().close()
     click.echo("Database initialized successfully.")
 
 
@@ -1299,30 +1526,28 @@ def migrate(ctx: click.Context, dry_run: bool) -> None:
     """Run pending database migrations."""
     from btcedu.migrations import get_pending_migrations, run_migrations
 
-    session = ctx.obj["session_factory"]()
-    try:
-        pending = get_pending_migrations(session)
+    with ctx.obj["session_factory"]() as session:
+        try:
+            pending = get_pending_migrations(session)
 
-        if not pending:
-            click.echo("✓ Database is up to date. No migrations needed.")
-            return
+            if not pending:
+                click.echo("✓ Database is up to date. No migrations needed.")
+                return
 
-        click.echo(f"Found {len(pending)} pending migration(s):")
-        for migration in pending:
-            click.echo(f"  • {migration.version}: {migration.description}")
+            click.echo(f"Found {len(pending)} pending migration(s):")
+            for migration in pending:
+                click.echo(f"  • {migration.version}: {migration.description}")
 
-        if dry_run:
-            click.echo("\n[DRY RUN] No changes were made.")
-            return
+            if dry_run:
+                click.echo("\n[DRY RUN] No changes were made.")
+                return
 
-        click.echo("\nApplying migrations...")
-        run_migrations(session, dry_run=False)
-        click.echo("\n✓ All migrations completed successfully!")
-    except Exception as e:
-        click.echo(f"\n✗ Migration failed: {e}", err=True)
-        sys.exit(1)
-    finally:
-        session.close()
+            click.echo("\nApplying migrations...")
+            run_migrations(session, dry_run=False)
+            click.echo("\n✓ All migrations completed successfully!")
+        except Exception as e:
+            click.echo(f"\n✗ Migration failed: {e}", err=True)
+            sys.exit(1)
 
 
 @cli.command(name="migrate-status")
@@ -1331,10 +1556,9 @@ def migrate_status(ctx: click.Context) -> None:
     """Show migration status (applied and pending)."""
     from btcedu.migrations import get_applied_migrations, get_pending_migrations
 
-    session = ctx.obj["session_factory"]()
-    try:
+    with ctx.obj["session_factory"]() as session:
         applied = get_applied_migrations(session)
-        pending = get_pending_migrations(session)
+        pending = get_pending_migrations(session, applied=applied)
 
         if applied:
             click.echo(f"Applied migrations ({len(applied)}):")
@@ -1350,26 +1574,22 @@ def migrate_status(ctx: click.Context) -> None:
             click.echo("\nRun 'btcedu migrate' to apply pending migrations.")
         else:
             click.echo("\n✓ Database is up to date.")
-    finally:
-        session.close()
 
 
 @cli.command()
 @click.option("--tail", "tail_n", type=int, default=50, help="Show last N lines.")
 def journal(tail_n: int) -> None:
     """Show the project progress log."""
-    from btcedu.utils.journal import JOURNAL_PATH
+    from btcedu.utils.journal import JOURNAL_PATH, tail_lines
 
     if not JOURNAL_PATH.exists():
         click.echo(f"No journal yet at {JOURNAL_PATH}")
         return
 
-    lines = JOURNAL_PATH.read_text(encoding="utf-8").splitlines()
-    if len(lines) <= tail_n:
-        click.echo("\n".join(lines))
-    else:
-        click.echo(f"... ({len(lines) - tail_n} lines above) ...\n")
-        click.echo("\n".join(lines[-tail_n:]))
+    truncated, lines = tail_lines(JOURNAL_PATH, tail_n)
+    if truncated:
+        click.echo("... (earlier lines omitted) ...\n")
+    click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -1379,6 +1599,8 @@ def journal(tail_n: int) -> None:
 def web(host: str, port: int, production: bool) -> None:
     """Start the web dashboard."""
     if production:
+        from pathlib import Path
+
         venv = Path(sys.executable).parent
         cmd = (
             f'{venv / "gunicorn"} -w 2 -b {host}:{port} --timeout 300 "btcedu.web.app:create_app()"'
@@ -1394,6 +1616,26 @@ def web(host: str, port: int, production: bool) -> None:
     app.run(host=host, port=port, debug=False)
 
 
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    default=None,
+    help="Unix socket to listen on (default: /tmp/btcedu-<uid>.sock).",
+)
+def daemon(socket_path: str | None) -> None:
+    """Serve btcedu commands from one warm process (see BTCEDU_DAEMON)."""
+    import btcedu.core.pipeline  # noqa: F401  (pay the heavy imports once, up front)
+    from btcedu.daemon import ENV_VAR, default_socket_path, serve
+
+    socket_path = socket_path or default_socket_path()
+    click.echo(f"Listening on {socket_path}; set {ENV_VAR}={socket_path} to forward commands.")
+    try:
+        serve(socket_path)
+    except KeyboardInterrupt:
+        click.echo("Daemon stopped.")
+
+
 @cli.group()
 @click.pass_context
 def stock(ctx: click.Context) -> None:
@@ -1420,10 +1662,9 @@ def search(
 
     settings = ctx.obj["settings"]
     if per_page is not None:
-        settings.pexels_results_per_chapter = per_page
+        settings = settings.model_copy(update={"pexels_results_per_chapter": per_page})
 
-    session = ctx.obj["session_factory"]()
-    try:
+    with ctx.obj["session_factory"]() as session:
         for eid in episode_ids:
             try:
                 result = search_stock_images(session, eid, settings, force=force)
@@ -1434,8 +1675,6 @@ def search(
                 )
             except Exception as e:
                 click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
 
 
 @stock.command(name="list")
@@ -1525,15 +1764,15 @@ def stock_select(
     from btcedu.core.stock_images import select_stock_image
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
-        select_stock_image(session, episode_id, chapter_id, pexels_id, settings, lock=lock)
-        locked_msg = " (locked)" if lock else ""
-        click.echo(f"[OK] Selected pexels:{pexels_id} for {episode_id}/{chapter_id}{locked_msg}")
-    except Exception as e:
-        click.echo(f"[FAIL] {e}", err=True)
-    finally:
-        session.close()
+    with ctx.obj["session_factory"]() as session:
+        try:
+            select_stock_image(session, episode_id, chapter_id, pexels_id, settings, lock=lock)
+            locked_msg = " (locked)" if lock else ""
+            click.echo(
+                f"[OK] Selected pexels:{pexels_id} for {episode_id}/{chapter_id}{locked_msg}"
+            )
+        except Exception as e:
+            click.echo(f"[FAIL] {e}", err=True)
 
 
 @stock.command(name="rank")
@@ -1551,19 +1790,17 @@ def stock_rank(ctx: click.Context, episode_id: str, force: bool, dry_run: bool)
 
     settings = ctx.obj["settings"]
     if dry_run:
-        settings.dry_run = True
-    session = ctx.obj["session_factory"]()
-    try:
-        result = rank_candidates(session, episode_id, settings, force=force)
-        click.echo(
-            f"[OK] {episode_id} -> {result.chapters_ranked} ranked, "
-            f"{result.chapters_skipped} skipped, "
-            f"${result.total_cost_usd:.4f}"
-        )
-    except Exception as e:
-        click.echo(f"[FAIL] {e}", err=True)
-    finally:
-        session.close()
+        settings = settings.model_copy(update={"dry_run": True})
+    with ctx.obj["session_factory"]() as session:
+        try:
+            result = rank_candidates(session, episode_id, settings, force=force)
+            click.echo(
+                f"[OK] {episode_id} -> {result.chapters_ranked} ranked, "
+                f"{result.chapters_skipped} skipped, "
+                f"${result.total_cost_usd:.4f}"
+            )
+        except Exception as e:
+            click.echo(f"[FAIL] {e}", err=True)
 
 
 @stock.command(name="auto-select")
@@ -1574,17 +1811,15 @@ def stock_auto_select(ctx: click.Context, episode_id: str) -> None:
     from btcedu.core.stock_images import auto_select_best
 
     settings = ctx.obj["settings"]
-    session = ctx.obj["session_factory"]()
-    try:
-        result = auto_select_best(session, episode_id, settings)
-        click.echo(
-            f"[OK] {episode_id} -> {result.selected_count} selected, "
-            f"{result.placeholder_count} placeholders"
-        )
-    except Exception as e:
-        click.echo(f"[FAIL] {e}", err=True)
-    finally:
-        session.close()
+    with ctx.obj["session_factory"]() as session:
+        try:
+            result = auto_select_best(session, episode_id, settings)
+            click.echo(
+                f"[OK] {episode_id} -> {result.selected_count} selected, "
+                f"{result.placeholder_count} placeholders"
+            )
+        except Exception as e:
+            click.echo(f"[FAIL] {e}", err=True)
 
 
 @cli.group()
@@ -1789,6 +2024,7 @@ def smoke_test_video(ctx: click.Context, resolution: str | None, keep: bool) ->
     import shutil
     import sys
     import tempfile
+    from pathlib import Path
 
     from btcedu.services.ffmpeg_service import (
         create_video_segment,
@@ -1918,17 +2154,21 @@ def llm_report(ctx: click.Context, json_only: bool, output: str | None) -> None:
 
     Note: This command does not require database access.
     """
+    from pathlib import Path
+
+    from btcedu.utils.jsonio import dumps
     from btcedu.utils.llm_introspection import format_full_report, generate_json_summary
 
+    # Both forms end up as UTF-8 bytes; the JSON one is serialised straight to bytes
     if json_only:
-        content = json.dumps(generate_json_summary(), indent=2, ensure_ascii=False)
+        content = dumps(generate_json_summary(), indent=True)
     else:
-        content = format_full_report()
+        content = format_full_report().encode("utf-8")
 
     if output:
         output_path = Path(output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content, encoding="utf-8")
+        output_path.write_bytes(content)
         click.echo(f"Report written to: {output_path}")
     else:
         click.echo(content)
@@ -1955,6 +2195,7 @@ def llm_report(ctx: click.Context, json_only: bool, output: str | None) -> None:
     default=None,
     help="Override privacy setting (default: youtube_default_privacy from config).",
 )
+@_concurrency_option
 @click.pass_context
 def publish(
     ctx: click.Context,
@@ -1962,31 +2203,28 @@ def publish(
     force: bool,
     dry_run: bool,
     privacy: str | None,
+    concurrency: int,
 ) -> None:
     """Publish approved episode video to YouTube (v2 pipeline, Sprint 11)."""
-    from btcedu.core.publisher import publish_video
+    from btcedu.core.publisher import build_youtube_service, publish_video
 
     settings = ctx.obj["settings"]
     if dry_run:
-        settings.dry_run = True
+        settings = settings.model_copy(update={"dry_run": True})
+    # One service for all episodes: OAuth2 credentials are loaded once
+    youtube_service = build_youtube_service(settings)
 
-    session = ctx.obj["session_factory"]()
-    try:
-        for eid in episode_ids:
-            try:
-                result = publish_video(session, eid, settings, force=force, privacy=privacy)
-                if result.skipped:
-                    click.echo(f"[SKIP] {eid} -> already published at {result.youtube_url}")
-                elif result.dry_run:
-                    click.echo(
-                        f"[DRY-RUN] {eid} -> would publish (video_id={result.youtube_video_id})"
-                    )
-                else:
-                    click.echo(f"[OK] {eid} -> {result.youtube_url}")
-            except Exception as e:
-                click.echo(f"[FAIL] {eid}: {e}", err=True)
-    finally:
-        session.close()
+    def process(session, eid):
+        result = publish_video(
+            session, eid, settings, force=force, privacy=privacy, youtube_service=youtube_service
+        )
+        if result.skipped:
+            return f"[SKIP] {eid} -> already published at {result.youtube_url}"
+        if result.dry_run:
+            return f"[DRY-RUN] {eid} -> would publish (video_id={result.youtube_video_id})"
+        return f"[OK] {eid} -> {result.youtube_url}"
+
+    _for_each_episode(ctx, episode_ids, process, concurrency)
 
 
 @cli.command(name="youtube-auth")
@@ -1,5 +1,6 @@
 import logging
 import warnings
+from functools import lru_cache
 
 from pydantic import model_validator
 from pydantic_settings import BaseSettings
@@ -68,6 +69,10 @@ class Settings(BaseSettings):
     retry_max_delay: float = 60.0  # seconds, max backoff cap
     retry_jitter: bool = True  # add random jitter to prevent thundering herd
     max_stage_retries: int = 3  # max retries per stage on transient errors
+    correct_concurrency: int = 4  # parallel Claude calls for multi-segment corrections
+    adapt_concurrency: int = 4  # parallel Claude calls for multi-segment adaptations
+    chapterize_concurrency: int = 4  # parallel Claude calls for multi-segment chapterization
+    chapterize_overlap_chars: int = 0  # previous-segment context shown to chapterize (0 = off)
     dry_run: bool = False
 
     # Pipeline Version Control
@@ -202,5 +207,11 @@ class Settings(BaseSettings):
         return self.whisper_api_key or self.openai_api_key
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
+    """Return the process-wide Settings, parsed from env/.env on first call.
+
+    The instance is shared: derive per-command overrides with
+    ``settings.model_copy(update={...})`` instead of mutating it.
+    """
     return Settings()
@@ -5,13 +5,17 @@ import json
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
 from sqlalchemy.orm import Session
 
 from btcedu.config import Settings
+from btcedu.core import reviewer
+from btcedu.core.batching import run_stage_batch
 from btcedu.core.prompt_registry import TEMPLATES_DIR, PromptRegistry
 from btcedu.models.content_artifact import ContentArtifact
 from btcedu.models.episode import (
@@ -21,18 +25,90 @@ from btcedu.models.episode import (
     PipelineStage,
     RunStatus,
 )
+from btcedu.models.prompt_version import PromptVersion
+from btcedu.models.review import ReviewStatus, ReviewTask
 from btcedu.services.claude_service import ClaudeResponse, call_claude
+from btcedu.utils import jsonio
 
 logger = logging.getLogger(__name__)
 
 # Texts longer than this (in characters) are split into segments
 SEGMENT_CHAR_LIMIT = 15_000
 
+# Shared threads for writing the diff and provenance JSON alongside the script
+_writer_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="adapt-writer")
+
+# Characters of surrounding text kept on each side of an adaptation tag
+ADAPTATION_CONTEXT_CHARS = 50
+
+# Matches [T1: ...] or [T2: ...] adaptation tags
+_TAG_RE = re.compile(r"\[(T1|T2):\s*([^\]]+)\]")
+# A paragraph: consecutive non-empty lines, ended by a blank line
+_PARAGRAPH_RE = re.compile(r"[^\n]+(?:\n(?!\n)[^\n]+)*")
+# {{ name }} placeholders in the adapt prompt template
+_PLACEHOLDER_RE = re.compile(r"\{\{ (\w+) \}\}")
+# Separator in "original → adapted" tag content
+_ARROW_RE = re.compile(r"\s*→\s*")
+
+# Keywords per adaptation category, in precedence order: when the content
+# matches several categories the first one listed wins.
+_CATEGORY_KEYWORDS = {
+    "legal_removal": ["kaldırıldı", "[removed"],
+    "tone_adjustment": ["ton düzeltmesi", "tone"],
+    "cultural_reference": ["kültürel", "cultural"],
+    "institution_replacement": ["bafin", "sparkasse", "bundesbank", "spk", "merkez bankası"],
+    "currency_conversion": ["eur", "usd", "tl", "€", "$", "₺"],
+    "regulatory_context": ["düzenleme", "mevzuat", "regulat"],
+}
+# One pattern per category, searched in precedence order. A single
+# alternation would miss keywords that overlap a lower-ranked match
+# ("mevzuatla" hides the "tl" inside it).
+_CATEGORY_RES = [
+    (category, re.compile("|".join(map(re.escape, keywords))))
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+]
+
 
 def _utcnow() -> datetime:
     return datetime.now(UTC)
 
 
+@lru_cache(maxsize=256)
+def _hash_file(path: str, mtime_ns: int, size: int) -> str:
+    """SHA-256 of a file's bytes; cached while its mtime and size are unchanged."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _file_hash(path: Path) -> str:
+    stat = path.stat()
+    return _hash_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _write_segments(path: Path, segments: list[str]) -> None:
+    """Write *segments* joined by blank lines, encoding one segment at a time."""
+    with path.open("wb") as f:
+        for i, segment in enumerate(segments):
+            if i:
+                f.write(b"\n\n")
+            f.write(segment.encode("utf-8"))
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.write_bytes(jsonio.dumps(data, indent=True))
+
+
+def _ok_marker_path(adapted_path: Path) -> Path:
+    return adapted_path.parent / (adapted_path.name + ".ok")
+
+
+def _combined_hash(translation_hash: str, german_hash: str, prompt_content_hash: str) -> str:
+    """Single hash over all adaptation inputs, as stored in the .ok marker."""
+    return hashlib.sha256(
+        (translation_hash + german_hash + prompt_content_hash).encode("utf-8")
+    ).hexdigest()
+
+
 @dataclass
 class AdaptationResult:
     """Summary of adaptation operation for one episode."""
@@ -77,6 +153,81 @@ def adapt_script(
         ValueError: If episode not found or not in correct status.
         FileNotFoundError: If translation or corrected transcript missing.
     """
+    job = _prepare_adaptation(session, episode_id, settings, force)
+    if isinstance(job, AdaptationResult):
+        return job
+
+    try:
+        responses = _adapt_segments(job, settings)
+        return _finish_adaptation(session, job, responses, settings)
+    except Exception as e:
+        _fail_adaptation(session, job.episode, job.pipeline_run, e)
+        raise
+
+
+def adapt_scripts_batch(
+    session: Session,
+    episode_ids: list[str],
+    settings: Settings,
+    force: bool = False,
+) -> dict[str, AdaptationResult | Exception]:
+    """Adapt several episodes through one Anthropic Message Batch.
+
+    Same checks, outputs and idempotency as :func:`adapt_script`, but the
+    segments of every episode that needs adapting are submitted together
+    at the batch discount. This blocks until the batch has ended, which can
+    take much longer than synchronous calls, so it suits catalog re-runs
+    rather than interactive use.
+
+    Returns a result per episode ID, in input order: an AdaptationResult,
+    or the exception that made that episode fail.
+    """
+    return run_stage_batch(
+        session,
+        episode_ids,
+        settings,
+        force,
+        label="Adaptation",
+        result_type=AdaptationResult,
+        prepare=_prepare_adaptation,
+        finish=_finish_adaptation,
+        fail=_fail_adaptation,
+    )
+
+
+@dataclass
+class _AdaptJob:
+    """An episode that passed the adapt checks and is ready for the LLM calls."""
+
+    episode: Episode
+    pipeline_run: PipelineRun
+    started: float
+    translation_path: Path
+    corrected_path: Path
+    adapted_path: Path
+    diff_path: Path
+    provenance_path: Path
+    translation_text: str
+    translation_hash: str
+    german_hash: str
+    prompt_version: PromptVersion
+    prompt_content_hash: str
+    system_prompt: str
+    user_messages: list[str]
+    dry_run_paths: list[Path | None]
+
+
+def _prepare_adaptation(
+    session: Session,
+    episode_id: str,
+    settings: Settings,
+    force: bool,
+) -> AdaptationResult | _AdaptJob:
+    """Validate *episode_id* and build its adapt requests.
+
+    Returns the skipped AdaptationResult when the existing adaptation is
+    current, otherwise an _AdaptJob with a RUNNING PipelineRun.
+    """
     episode = session.query(Episode).filter(Episode.episode_id == episode_id).first()
     if not episode:
         raise ValueError(f"Episode not found: {episode_id}")
@@ -90,11 +241,8 @@ def adapt_script(
 
     # Check Review Gate 1 approval (correction must be approved)
     if episode.status == EpisodeStatus.TRANSLATED and not force:
-        from btcedu.core.reviewer import has_pending_review
-        from btcedu.models.review import ReviewStatus, ReviewTask
-
         # Check if there's a pending review for correction
-        if has_pending_review(session, episode_id):
+        if reviewer.has_pending_review(session, episode_id):
             raise ValueError(
                 f"Episode {episode_id} has pending review. "
                 "Adaptation cannot proceed until reviews are resolved."
@@ -143,27 +291,32 @@ def adapt_script(
     _, template_body = registry.load_template(template_file)
     prompt_content_hash = registry.compute_hash(template_body)
 
-    # Compute input content hashes for idempotency
-    translation_text = translation_path.read_text(encoding="utf-8")
-    german_text = corrected_path.read_text(encoding="utf-8")
-
-    translation_hash = hashlib.sha256(translation_text.encode("utf-8")).hexdigest()
-    german_hash = hashlib.sha256(german_text.encode("utf-8")).hexdigest()
+    # Compute input content hashes for idempotency (hashes are cached per
+    # file mtime/size, so the skip path does not re-read unchanged inputs)
+    translation_hash = _file_hash(translation_path)
+    german_hash = _file_hash(corrected_path)
 
     # Idempotency check
-    if not force and _is_adaptation_current(
-        adapted_path,
-        provenance_path,
-        translation_hash,
-        german_hash,
-        prompt_content_hash,
-    ):
+    if force:
+        current, existing_provenance = False, None
+    else:
+        current, existing_provenance = _is_adaptation_current(
+            adapted_path,
+            provenance_path,
+            translation_hash,
+            german_hash,
+            prompt_content_hash,
+        )
+    if current:
         logger.info("Adaptation is current for %s (use --force to re-adapt)", episode_id)
-        existing_adapted = adapted_path.read_text(encoding="utf-8")
-        existing_diff = {}
-        if diff_path.exists():
-            existing_diff = json.loads(diff_path.read_text(encoding="utf-8"))
-        existing_provenance = json.loads(provenance_path.read_text(encoding="utf-8"))
+        if existing_provenance is None:
+            existing_provenance = jsonio.loads(provenance_path.read_bytes())
+        summary = existing_provenance.get("adaptation_summary")
+        if summary is None:
+            # Provenance written before the summary was recorded there
+            summary = {}
+            if diff_path.exists():
+                summary = jsonio.loads(diff_path.read_bytes()).get("summary", {})
 
         return AdaptationResult(
             episode_id=episode_id,
@@ -173,15 +326,23 @@ def adapt_script(
             input_tokens=existing_provenance.get("input_tokens", 0),
             output_tokens=existing_provenance.get("output_tokens", 0),
             cost_usd=existing_provenance.get("cost_usd", 0.0),
-            input_char_count=len(translation_text),
-            output_char_count=len(existing_adapted),
-            adaptation_count=existing_diff.get("summary", {}).get("total_adaptations", 0),
-            tier1_count=existing_diff.get("summary", {}).get("tier1_count", 0),
-            tier2_count=existing_diff.get("summary", {}).get("tier2_count", 0),
+            # Older provenance lacks the counts: fall back to byte sizes
+            input_char_count=existing_provenance.get(
+                "input_char_count", translation_path.stat().st_size
+            ),
+            output_char_count=existing_provenance.get(
+                "output_char_count", adapted_path.stat().st_size
+            ),
+            adaptation_count=summary.get("total_adaptations", 0),
+            tier1_count=summary.get("tier1_count", 0),
+            tier2_count=summary.get("tier2_count", 0),
             segments_processed=existing_provenance.get("segments_processed", 1),
             skipped=True,
         )
 
+    translation_text = translation_path.read_text(encoding="utf-8")
+    german_text = corrected_path.read_text(encoding="utf-8")
+
     # Create PipelineRun
     pipeline_run = PipelineRun(
         episode_id=episode.id,
@@ -189,15 +350,15 @@ def adapt_script(
         status=RunStatus.RUNNING,
     )
     session.add(pipeline_run)
-    session.flush()
+    # Committed (not just flushed) so concurrent workers are not locked
+    # out of SQLite while the LLM calls run.
+    session.commit()
 
     t0 = time.monotonic()
 
     try:
         # Inject reviewer feedback if available (from request_changes)
-        from btcedu.core.reviewer import get_latest_reviewer_feedback
-
-        reviewer_feedback = get_latest_reviewer_feedback(session, episode_id, "adapt")
+        reviewer_feedback = reviewer.get_latest_reviewer_feedback(session, episode_id, "adapt")
         if reviewer_feedback:
             feedback_block = (
                 "## Revisor Geri Bildirimi (lütfen bu düzeltmeleri uygulayın)\n\n"
@@ -205,9 +366,9 @@ def adapt_script(
                 "Önemli: Bu geri bildirimi çıktıda aynen aktarmayın, "
                 "yalnızca düzeltme kılavuzu olarak kullanın."
             )
-            template_body = template_body.replace("{{ reviewer_feedback }}", feedback_block)
         else:
-            template_body = template_body.replace("{{ reviewer_feedback }}", "")
+            feedback_block = ""
+        template_body = _fill_placeholders(template_body, reviewer_feedback=feedback_block)
 
         # Split prompt template into system and user parts
         system_prompt, user_template = _split_prompt(template_body)
@@ -215,178 +376,246 @@ def adapt_script(
         # Segment text if needed
         segments = _segment_text(translation_text)
 
-        # Process each segment
-        total_input_tokens = 0
-        total_output_tokens = 0
-        total_cost = 0.0
-        adapted_segments: list[str] = []
-
-        for i, segment in enumerate(segments):
-            # For multi-segment: include full German text as reference (simplification)
-            # A more sophisticated implementation would align German segments with Turkish segments
-            user_message = user_template.replace("{{ translation }}", segment).replace(
-                "{{ original_german }}", german_text
-            )
-
-            # Dry-run path
-            dry_run_path = (
-                Path(settings.outputs_dir) / episode_id / f"dry_run_adapt_{i}.json"
-                if settings.dry_run
-                else None
-            )
+        # For multi-segment: include full German text as reference (simplification)
+        # A more sophisticated implementation would align German segments with Turkish segments
+        user_messages = [
+            _fill_placeholders(user_template, translation=segment, original_german=german_text)
+            for segment in segments
+        ]
+        dry_run_paths = [
+            Path(settings.outputs_dir) / episode_id / f"dry_run_adapt_{i}.json"
+            if settings.dry_run
+            else None
+            for i in range(len(segments))
+        ]
+    except Exception as e:
+        _fail_adaptation(session, episode, pipeline_run, e)
+        raise
 
-            response: ClaudeResponse = call_claude(
-                system_prompt=system_prompt,
-                user_message=user_message,
-                settings=settings,
-                dry_run_path=dry_run_path,
-            )
+    return _AdaptJob(
+        episode=episode,
+        pipeline_run=pipeline_run,
+        started=t0,
+        translation_path=translation_path,
+        corrected_path=corrected_path,
+        adapted_path=adapted_path,
+        diff_path=diff_path,
+        provenance_path=provenance_path,
+        translation_text=translation_text,
+        translation_hash=translation_hash,
+        german_hash=german_hash,
+        prompt_version=prompt_version,
+        prompt_content_hash=prompt_content_hash,
+        system_prompt=system_prompt,
+        user_messages=user_messages,
+        dry_run_paths=dry_run_paths,
+    )
 
-            adapted_segments.append(response.text)
-            total_input_tokens += response.input_tokens
-            total_output_tokens += response.output_tokens
-            total_cost += response.cost_usd
-
-            logger.info(
-                "Segment %d/%d: %d in, %d out, $%.4f",
-                i + 1,
-                len(segments),
-                response.input_tokens,
-                response.output_tokens,
-                response.cost_usd,
-            )
 
-        # Reassemble adapted text
-        adapted_text = "\n\n".join(adapted_segments)
+def _adapt_segments(job: _AdaptJob, settings: Settings) -> list[ClaudeResponse]:
+    """Call the LLM for each segment of *job*, returning responses in order."""
+    count = len(job.user_messages)
 
-        # Compute adaptation diff
-        diff_data = compute_adaptation_diff(translation_text, adapted_text, episode_id)
+    # Every segment shares the system prompt: with several segments it is
+    # sent for prompt caching, so only the first call pays for it in full.
+    cache_system_prompt = count > 1
 
-        adaptation_count = diff_data["summary"]["total_adaptations"]
-        tier1_count = diff_data["summary"]["tier1_count"]
-        tier2_count = diff_data["summary"]["tier2_count"]
+    # Segments are independent: adapt them concurrently, keeping order
+    def adapt_segment(i: int) -> ClaudeResponse:
+        response: ClaudeResponse = call_claude(
+            system_prompt=job.system_prompt,
+            user_message=job.user_messages[i],
+            settings=settings,
+            dry_run_path=job.dry_run_paths[i],
+            cache_system_prompt=cache_system_prompt,
+        )
 
         logger.info(
-            "Adaptation complete: %d adaptations (T1: %d, T2: %d)",
-            adaptation_count,
-            tier1_count,
-            tier2_count,
+            "Segment %d/%d: %d in, %d out, $%.4f",
+            i + 1,
+            count,
+            response.input_tokens,
+            response.output_tokens,
+            response.cost_usd,
         )
+        return response
 
-        # Write output files
-        adapted_path.parent.mkdir(parents=True, exist_ok=True)
-        adapted_path.write_text(adapted_text, encoding="utf-8")
-
-        diff_path.parent.mkdir(parents=True, exist_ok=True)
-        diff_path.write_text(json.dumps(diff_data, ensure_ascii=False, indent=2), encoding="utf-8")
-
-        # Write provenance
-        elapsed = time.monotonic() - t0
-        provenance = {
-            "stage": "adapt",
-            "episode_id": episode_id,
-            "timestamp": _utcnow().isoformat(),
-            "prompt_name": "adapt",
-            "prompt_version": prompt_version.version,
-            "prompt_hash": prompt_content_hash,
-            "model": settings.claude_model,
-            "model_params": {
-                "temperature": settings.claude_temperature,
-                "max_tokens": settings.claude_max_tokens,
-            },
-            "input_files": [str(translation_path), str(corrected_path)],
-            "input_content_hashes": {
-                "translation": translation_hash,
-                "german": german_hash,
-            },
-            "output_files": [str(adapted_path), str(diff_path)],
-            "input_tokens": total_input_tokens,
-            "output_tokens": total_output_tokens,
-            "cost_usd": total_cost,
-            "duration_seconds": round(elapsed, 2),
-            "segments_processed": len(segments),
-            "adaptation_summary": {
-                "total_adaptations": adaptation_count,
-                "tier1_count": tier1_count,
-                "tier2_count": tier2_count,
-            },
-        }
+    # The first call runs alone so it writes the prompt cache the others read
+    responses = [adapt_segment(0)]
+    workers = max(1, min(settings.adapt_concurrency, count - 1))
+    if workers == 1:
+        responses += [adapt_segment(i) for i in range(1, count)]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses += executor.map(adapt_segment, range(1, count))
+    return responses
 
-        provenance_path.parent.mkdir(parents=True, exist_ok=True)
-        provenance_path.write_text(
-            json.dumps(provenance, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
 
-        # Persist ContentArtifact
-        artifact = ContentArtifact(
-            episode_id=episode_id,
-            artifact_type="adapt",
-            file_path=str(adapted_path),
-            model=settings.claude_model,
-            prompt_hash=prompt_content_hash,
-            retrieval_snapshot_path=None,
-        )
-        session.add(artifact)
-
-        # Update PipelineRun
-        pipeline_run.status = RunStatus.SUCCESS
-        pipeline_run.completed_at = _utcnow()
-        pipeline_run.input_tokens = total_input_tokens
-        pipeline_run.output_tokens = total_output_tokens
-        pipeline_run.estimated_cost_usd = total_cost
-
-        # Update Episode
-        episode.status = EpisodeStatus.ADAPTED
-        episode.error_message = None
-        session.commit()
-
-        # Mark downstream chapterization as stale if it exists
-        chapters_path = Path(settings.outputs_dir) / episode_id / "chapters.json"
-        if chapters_path.exists():
-            stale_marker = chapters_path.parent / (chapters_path.name + ".stale")
-            stale_data = {
-                "invalidated_at": _utcnow().isoformat(),
-                "invalidated_by": "adapt",
-                "reason": "adapted_script_changed",
-            }
-            stale_marker.write_text(json.dumps(stale_data, indent=2), encoding="utf-8")
-            logger.info("Marked downstream chapterization as stale: %s", chapters_path.name)
+def _finish_adaptation(
+    session: Session,
+    job: _AdaptJob,
+    responses: list[ClaudeResponse],
+    settings: Settings,
+) -> AdaptationResult:
+    """Write outputs and provenance for *job* and mark the run successful."""
+    episode_id = job.episode.episode_id
 
-        logger.info(
-            "Adapted %s (%d→%d chars, %d adaptations, $%.4f)",
-            episode_id,
-            len(translation_text),
-            len(adapted_text),
-            adaptation_count,
-            total_cost,
-        )
+    adapted_segments = [r.text for r in responses]
+    total_input_tokens = sum(r.input_tokens for r in responses)
+    total_output_tokens = sum(r.output_tokens for r in responses)
+    total_cost = sum(r.cost_usd for r in responses)
 
-        return AdaptationResult(
-            episode_id=episode_id,
-            adapted_path=str(adapted_path),
-            diff_path=str(diff_path),
-            provenance_path=str(provenance_path),
-            input_tokens=total_input_tokens,
-            output_tokens=total_output_tokens,
-            cost_usd=total_cost,
-            input_char_count=len(translation_text),
-            output_char_count=len(adapted_text),
-            adaptation_count=adaptation_count,
-            tier1_count=tier1_count,
-            tier2_count=tier2_count,
-            segments_processed=len(segments),
-            skipped=False,
-        )
+    # Reassemble adapted text
+    adapted_text = "\n\n".join(adapted_segments)
 
-    except Exception as e:
-        pipeline_run.status = RunStatus.FAILED
-        pipeline_run.completed_at = _utcnow()
-        pipeline_run.error_message = str(e)
-        episode.error_message = f"Adaptation failed: {e}"
-        session.commit()
-        logger.error("Adaptation failed for %s: %s", episode_id, e)
+    # Compute adaptation diff
+    diff_data = compute_adaptation_diff(job.translation_text, adapted_text, episode_id)
+
+    adaptation_count = diff_data["summary"]["total_adaptations"]
+    tier1_count = diff_data["summary"]["tier1_count"]
+    tier2_count = diff_data["summary"]["tier2_count"]
+
+    logger.info(
+        "Adaptation complete: %d adaptations (T1: %d, T2: %d)",
+        adaptation_count,
+        tier1_count,
+        tier2_count,
+    )
+
+    # Write output files
+    for out_dir in {job.adapted_path.parent, job.diff_path.parent, job.provenance_path.parent}:
+        out_dir.mkdir(parents=True, exist_ok=True)
+    # The diff and provenance are serialised and written on background
+    # threads while the provenance is built and the script is written.
+    diff_written = _writer_pool.submit(_write_json, job.diff_path, diff_data)
+
+    # Write provenance
+    elapsed = time.monotonic() - job.started
+    provenance = {
+        "stage": "adapt",
+        "episode_id": episode_id,
+        "timestamp": _utcnow().isoformat(),
+        "prompt_name": "adapt",
+        "prompt_version": job.prompt_version.version,
+        "prompt_hash": job.prompt_content_hash,
+        "model": settings.claude_model,
+        "model_params": {
+            "temperature": settings.claude_temperature,
+            "max_tokens": settings.claude_max_tokens,
+        },
+        "input_files": [str(job.translation_path), str(job.corrected_path)],
+        "input_content_hashes": {
+            "translation": job.translation_hash,
+            "german": job.german_hash,
+        },
+        "output_files": [str(job.adapted_path), str(job.diff_path)],
+        "input_tokens": total_input_tokens,
+        "output_tokens": total_output_tokens,
+        "cost_usd": total_cost,
+        "duration_seconds": round(elapsed, 2),
+        "segments_processed": len(responses),
+        "input_char_count": len(job.translation_text),
+        "output_char_count": len(adapted_text),
+        "adaptation_summary": {
+            "total_adaptations": adaptation_count,
+            "tier1_count": tier1_count,
+            "tier2_count": tier2_count,
+        },
+    }
+
+    provenance_written = _writer_pool.submit(_write_json, job.provenance_path, provenance)
+    try:
+        _write_segments(job.adapted_path, adapted_segments)
+        # Every output must be on disk (write errors re-raised) before any
+        # DB row is touched; the .ok marker goes last.
+        diff_written.result()
+        provenance_written.result()
+    except BaseException:
+        # Nothing may vouch for outputs that were not fully written, or the
+        # next run would skip them as current: let the background writes
+        # settle, then drop them and the previous run's .ok marker.
+        diff_written.exception()
+        provenance_written.exception()
+        for path in (job.provenance_path, job.diff_path, _ok_marker_path(job.adapted_path)):
+            path.unlink(missing_ok=True)
         raise
 
+    ok_hash = _combined_hash(job.translation_hash, job.german_hash, job.prompt_content_hash)
+    _ok_marker_path(job.adapted_path).write_bytes(ok_hash.encode("ascii"))
+
+    # Persist ContentArtifact
+    artifact = ContentArtifact(
+        episode_id=episode_id,
+        artifact_type="adapt",
+        file_path=str(job.adapted_path),
+        model=settings.claude_model,
+        prompt_hash=job.prompt_content_hash,
+        retrieval_snapshot_path=None,
+    )
+    session.add(artifact)
+
+    # Update PipelineRun
+    job.pipeline_run.status = RunStatus.SUCCESS
+    job.pipeline_run.completed_at = _utcnow()
+    job.pipeline_run.input_tokens = total_input_tokens
+    job.pipeline_run.output_tokens = total_output_tokens
+    job.pipeline_run.estimated_cost_usd = total_cost
+
+    # Update Episode
+    job.episode.status = EpisodeStatus.ADAPTED
+    job.episode.error_message = None
+    session.commit()
+
+    # Mark downstream chapterization as stale if it exists
+    chapters_path = Path(settings.outputs_dir) / episode_id / "chapters.json"
+    if chapters_path.exists():
+        stale_marker = chapters_path.parent / (chapters_path.name + ".stale")
+        stale_data = {
+            "invalidated_at": _utcnow().isoformat(),
+            "invalidated_by": "adapt",
+            "reason": "adapted_script_changed",
+        }
+        stale_marker.write_text(json.dumps(stale_data, indent=2), encoding="utf-8")
+        logger.info("Marked downstream chapterization as stale: %s", chapters_path.name)
+
+    logger.info(
+        "Adapted %s (%d→%d chars, %d adaptations, $%.4f)",
+        episode_id,
+        len(job.translation_text),
+        len(adapted_text),
+        adaptation_count,
+        total_cost,
+    )
+
+    return AdaptationResult(
+        episode_id=episode_id,
+        adapted_path=str(job.adapted_path),
+        diff_path=str(job.diff_path),
+        provenance_path=str(job.provenance_path),
+        input_tokens=total_input_tokens,
+        output_tokens=total_output_tokens,
+        cost_usd=total_cost,
+        input_char_count=len(job.translation_text),
+        output_char_count=len(adapted_text),
+        adaptation_count=adaptation_count,
+        tier1_count=tier1_count,
+        tier2_count=tier2_count,
+        segments_processed=len(responses),
+        skipped=False,
+    )
+
+
+def _fail_adaptation(
+    session: Session, episode: Episode, pipeline_run: PipelineRun, error: Exception
+) -> None:
+    """Record *error* on the adapt PipelineRun and the episode."""
+    pipeline_run.status = RunStatus.FAILED
+    pipeline_run.completed_at = _utcnow()
+    pipeline_run.error_message = str(error)
+    episode.error_message = f"Adaptation failed: {error}"
+    session.commit()
+    logger.error("Adaptation failed for %s: %s", episode.episode_id, error)
+
 
 def _is_adaptation_current(
     adapted_path: Path,
@@ -394,48 +623,77 @@ def _is_adaptation_current(
     translation_hash: str,
     german_hash: str,
     prompt_content_hash: str,
-) -> bool:
+) -> tuple[bool, dict | None]:
     """Check if existing adaptation is still valid.
 
-    Returns True (skip) if ALL of:
+    Returns ``(current, provenance)``. The parsed provenance is passed back
+    so the caller does not read it twice; it is ``None`` when the check did
+    not need to parse it.
+
+    The adaptation is current (skip) if ALL of:
     1. adapted_path exists
     2. No .stale marker exists
     3. provenance_path exists and its prompt_hash matches
     4. provenance_path's input_content_hashes match
+
+    Steps 3 and 4 are answered by the .ok marker when its combined hash
+    matches; the provenance JSON is only parsed otherwise.
     """
     if not adapted_path.exists():
-        return False
+        return False, None
 
     # Check for stale marker
     stale_marker = adapted_path.parent / (adapted_path.name + ".stale")
     if stale_marker.exists():
         logger.info("Adaptation marked stale (upstream change), will reprocess")
         stale_marker.unlink()  # Consume marker
-        return False
+        return False, None
 
     if not provenance_path.exists():
-        return False
+        return False, None
 
+    # Fast path: the .ok marker written after the last successful run holds
+    # a hash over all inputs, so the provenance JSON need not be parsed.
+    ok_marker = _ok_marker_path(adapted_path)
     try:
-        provenance = json.loads(provenance_path.read_text(encoding="utf-8"))
+        if ok_marker.read_text(encoding="utf-8") == _combined_hash(
+            translation_hash, german_hash, prompt_content_hash
+        ):
+            return True, None
+    except OSError:
+        pass
+
+    try:
+        provenance = jsonio.loads(provenance_path.read_bytes())
     except (json.JSONDecodeError, OSError):
         logger.warning("Provenance file corrupt or missing, will reprocess")
-        return False
+        return False, None
 
     if provenance.get("prompt_hash") != prompt_content_hash:
         logger.info("Prompt hash mismatch (prompt was updated)")
-        return False
+        return False, None
 
     stored_hashes = provenance.get("input_content_hashes", {})
     if stored_hashes.get("translation") != translation_hash:
         logger.info("Translation content hash mismatch (translation was updated)")
-        return False
+        return False, None
 
     if stored_hashes.get("german") != german_hash:
         logger.info("German content hash mismatch (corrected transcript was updated)")
-        return False
+        return False, None
+
+    return True, provenance
 
-    return True
+
+def _fill_placeholders(template: str, **values: str) -> str:
+    """Substitute ``{{ name }}`` placeholders from *values* in one pass.
+
+    Unknown placeholders are left as they are, and substituted text is
+    never scanned again (a transcript containing ``{{ ... }}`` stays
+    intact). str.format/string.Template are not used because prompts
+    contain literal braces and ``$`` signs.
+    """
+    return _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), template)
 
 
 def _split_prompt(template_body: str) -> tuple[str, str]:
@@ -473,15 +731,13 @@ def _segment_text(text: str, limit: int = SEGMENT_CHAR_LIMIT) -> list[str]:
     if len(text) <= limit:
         return [text]
 
-    # Split into paragraphs
-    paragraphs = text.split("\n\n")
-
     segments = []
     current_segment = []
     current_length = 0
 
-    for para in paragraphs:
-        para = para.strip()
+    # Walk paragraphs lazily rather than materialising the whole split list
+    for match in _PARAGRAPH_RE.finditer(text):
+        para = match.group().strip()
         if not para:
             continue
 
@@ -542,9 +798,14 @@ def compute_adaptation_diff(
     translation: str,
     adapted: str,
     episode_id: str,
+    context_chars: int = ADAPTATION_CONTEXT_CHARS,
 ) -> dict:
     """Compute adaptation diff by parsing [T1]/[T2] tags in adapted text.
 
+    Each adaptation carries up to *context_chars* characters of the adapted
+    text on either side of its tag (shown in the review UI); with
+    ``context_chars=0`` the context is left empty and no slices are made.
+
     Returns:
         {
             "episode_id": str,
@@ -570,29 +831,33 @@ def compute_adaptation_diff(
         }
     """
     adaptations = []
+    tier1_count = tier2_count = 0
+    by_category: dict[str, int] = {}
 
-    # Regex to match [T1: ...] or [T2: ...]
-    pattern = r"\[(T1|T2):\s*([^\]]+)\]"
-
-    for match in re.finditer(pattern, adapted):
+    for match in _TAG_RE.finditer(adapted):
         tier = match.group(1)
         content = match.group(2).strip()
         start = match.start()
         end = match.end()
 
-        # Extract context (50 chars before/after)
-        context_start = max(0, start - 50)
-        context_end = min(len(adapted), end + 50)
-        context = adapted[context_start:context_end]
+        # Extract context around the tag
+        context = (
+            adapted[max(0, start - context_chars) : end + context_chars] if context_chars else ""
+        )
 
         # Classify category from content
         category = _classify_adaptation(content)
+        by_category[category] = by_category.get(category, 0) + 1
+        if tier == "T1":
+            tier1_count += 1
+        else:
+            tier2_count += 1
 
         # Extract original vs adapted (if format is "original → adapted")
-        if "→" in content:
-            parts = content.split("→", 1)
-            original_text = parts[0].strip().strip('"').strip("'")
-            adapted_text = parts[1].strip().strip('"').strip("'")
+        parts = _ARROW_RE.split(content, maxsplit=1)
+        if len(parts) == 2:
+            original_text = parts[0].strip('"').strip("'")
+            adapted_text = parts[1].strip('"').strip("'")
         else:
             # No arrow: content is the adapted replacement
             original_text = ""
@@ -610,15 +875,6 @@ def compute_adaptation_diff(
             }
         )
 
-    # Summarize
-    tier1_count = sum(1 for a in adaptations if a["tier"] == "T1")
-    tier2_count = sum(1 for a in adaptations if a["tier"] == "T2")
-
-    by_category: dict[str, int] = {}
-    for a in adaptations:
-        cat = a["category"]
-        by_category[cat] = by_category.get(cat, 0) + 1
-
     return {
         "episode_id": episode_id,
         "original_length": len(translation),
@@ -646,21 +902,7 @@ def _classify_adaptation(content: str) -> str:
     - other: fallback
     """
     content_lower = content.lower()
-
-    if "kaldırıldı" in content_lower or "[removed" in content_lower:
-        return "legal_removal"
-    elif "ton düzeltmesi" in content_lower or "tone" in content_lower:
-        return "tone_adjustment"
-    elif "kültürel" in content_lower or "cultural" in content_lower:
-        return "cultural_reference"
-    elif any(
-        inst in content_lower
-        for inst in ["bafin", "sparkasse", "bundesbank", "spk", "merkez bankası"]
-    ):
-        return "institution_replacement"
-    elif any(curr in content_lower for curr in ["eur", "usd", "tl", "€", "$", "₺"]):
-        return "currency_conversion"
-    elif "düzenleme" in content_lower or "mevzuat" in content_lower or "regulat" in content_lower:
-        return "regulatory_context"
-    else:
-        return "other"
+    for category, pattern in _CATEGORY_RES:
+        if pattern.search(content_lower):
+            return category
+    return "other"
@@ -0,0 +1,96 @@
+"""Shared Message Batch driver for stages that support batch submission."""
+
+import logging
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Protocol
+
+from sqlalchemy.orm import Session
+
+from btcedu.config import Settings
+from btcedu.models.episode import Episode, PipelineRun
+from btcedu.services.claude_service import ClaudeResponse, call_claude_batch
+
+logger = logging.getLogger(__name__)
+
+
+class BatchJob(Protocol):
+    """An episode prepared by a stage and ready for its LLM requests."""
+
+    episode: Episode
+    pipeline_run: PipelineRun
+    system_prompt: str
+    user_messages: list[str]
+    dry_run_paths: list[Path | None]
+
+
+def run_stage_batch(
+    session: Session,
+    episode_ids: list[str],
+    settings: Settings,
+    force: bool,
+    *,
+    label: str,
+    result_type: type,
+    prepare: Callable[[Session, str, Settings, bool], Any],
+    finish: Callable[[Session, Any, list[ClaudeResponse], Settings], Any],
+    fail: Callable[[Session, Episode, PipelineRun, Exception], None],
+) -> dict[str, Any]:
+    """Run one stage for several episodes through one Message Batch.
+
+    ``prepare`` returns either a ``result_type`` instance (nothing to do)
+    or a :class:`BatchJob`. The requests of every job are submitted
+    together; each job's responses are then handed to ``finish``. A job
+    owning a request that failed in the batch is passed to ``fail``
+    without affecting the others.
+
+    Returns a result per episode ID, in input order: the stage result, or
+    the exception that made that episode fail.
+    """
+    results: dict[str, Any] = {}
+    jobs: list[BatchJob] = []
+    for episode_id in episode_ids:
+        try:
+            prepared = prepare(session, episode_id, settings, force)
+        except Exception as e:
+            logger.error("%s failed for %s: %s", label, episode_id, e)
+            results[episode_id] = e
+            continue
+        if isinstance(prepared, result_type):
+            results[episode_id] = prepared
+        else:
+            results[episode_id] = None
+            jobs.append(prepared)
+
+    # Commit the RUNNING pipeline runs so the database is not held in a
+    # write transaction while the batch is processed.
+    session.commit()
+
+    requests = [(job.system_prompt, message) for job in jobs for message in job.user_messages]
+    try:
+        responses = call_claude_batch(
+            requests,
+            settings,
+            dry_run_paths=[path for job in jobs for path in job.dry_run_paths],
+            cache_system_prompt=len(requests) > 1,
+        )
+    except Exception as e:
+        for job in jobs:
+            fail(session, job.episode, job.pipeline_run, e)
+            results[job.episode.episode_id] = e
+        return results
+
+    offset = 0
+    for job in jobs:
+        job_responses = responses[offset : offset + len(job.user_messages)]
+        offset += len(job.user_messages)
+        try:
+            # Only the episode owning a failed request fails
+            for response in job_responses:
+                if isinstance(response, Exception):
+                    raise response
+            results[job.episode.episode_id] = finish(session, job, job_responses, settings)
+        except Exception as e:
+            fail(session, job.episode, job.pipeline_run, e)
+            results[job.episode.episode_id] = e
+    return results
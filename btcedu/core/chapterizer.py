@@ -3,9 +3,13 @@
 import hashlib
 import json
 import logging
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
 from pydantic import ValidationError
@@ -24,12 +28,50 @@ from btcedu.models.episode import (
 )
 from btcedu.models.review import ReviewStatus, ReviewTask
 from btcedu.services.claude_service import ClaudeResponse, call_claude
+from btcedu.utils import jsonio
 
 logger = logging.getLogger(__name__)
 
 # Texts longer than this (in characters) are split into segments
 SEGMENT_CHAR_LIMIT = 15_000
 
+# Appended to a segment's user message when chapterize_overlap_chars > 0:
+# the end of the previous segment, for continuity only
+_CONTEXT_BLOCK = """
+
+## Previous Segment Ending (context only, do not chapterize)
+The script above continues from the text below, which belongs to an earlier
+segment that is chapterized separately. Use it only to understand how this
+segment begins. Do not create chapters, narration or visuals from it.
+```
+{context}
+```
+"""
+
+# Narration duration of a Chapter, read in C when summing
+_chapter_duration = attrgetter("narration.estimated_duration_seconds")
+
+# Shared thread for writing provenance alongside chapters.json
+_writer_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chapterize-writer")
+
+# LLM JSON cleanup: trailing commas before } or ]
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+# Tokens for // comment stripping, scanned left to right. String literals
+# (which end at the line end if unterminated) and backslash escapes are
+# matched so their contents are skipped; whole-line comments are removed with
+# their newline and inline ones with the whitespace before them.
+_JSON_COMMENT_RE = re.compile(
+    r"^[^\S\n]*//[^\n]*(?:\n|\Z)"
+    r'|"(?:[^"\\\n]|\\[^\n]?)*+"?'
+    r"|\\(?![^\S\n]+//)[^\n]?"
+    r"|[^\S\n]*//[^\n]*",
+    re.MULTILINE,
+)
+# {{name}} placeholders in the chapterize prompt
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+# A paragraph: consecutive non-empty lines, ended by a blank line
+_PARAGRAPH_RE = re.compile(r"[^\n]+(?:\n(?!\n)[^\n]+)*")
+
 
 def _utcnow() -> datetime:
     return datetime.now(UTC)
@@ -98,24 +140,26 @@ def chapterize_script(
 
     # Check Review Gate 2 approval (adaptation must be approved) — only for adapted path
     if episode.status == EpisodeStatus.ADAPTED and not force and not use_story_mode:
-        from btcedu.core.reviewer import has_pending_review
+        # One query over the episode's (few) review tasks answers both gate
+        # checks: nothing pending, and the adaptation approved
+        review_states = (
+            session.query(ReviewTask.stage, ReviewTask.status)
+            .filter(ReviewTask.episode_id == episode_id)
+            .all()
+        )
 
         # Check if there's a pending review for adaptation
-        if has_pending_review(session, episode_id):
+        open_statuses = {ReviewStatus.PENDING.value, ReviewStatus.IN_REVIEW.value}
+        if any(status in open_statuses for _, status in review_states):
             raise ValueError(
                 f"Episode {episode_id} has pending review. "
                 "Chapterization cannot proceed until reviews are resolved."
             )
 
         # Verify adaptation was approved
-        approved_adapt = (
-            session.query(ReviewTask)
-            .filter(
-                ReviewTask.episode_id == episode_id,
-                ReviewTask.stage == "adapt",
-                ReviewTask.status == ReviewStatus.APPROVED.value,
-            )
-            .first()
+        approved_adapt = any(
+            stage == "adapt" and status == ReviewStatus.APPROVED.value
+            for stage, status in review_states
         )
 
         if not approved_adapt:
@@ -180,15 +224,21 @@ def chapterize_script(
     prompt_content_hash = registry.compute_hash(template_body)
 
     # Compute input content hash for idempotency
-    adapted_text = adapted_path.read_text(encoding="utf-8")
-    adapted_hash = hashlib.sha256(adapted_text.encode("utf-8")).hexdigest()
+    adapted_bytes = adapted_path.read_bytes()
+    if b"\r" in adapted_bytes:
+        # Same newline translation read_text() applies, so the hash is unchanged
+        adapted_bytes = adapted_bytes.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    adapted_hash = hashlib.sha256(adapted_bytes).hexdigest()
 
     # Idempotency check
-    if not force and _is_chapterization_current(
-        chapters_path, provenance_path, adapted_hash, prompt_content_hash
-    ):
+    if force:
+        current, existing_provenance = False, None
+    else:
+        current, existing_provenance = _is_chapterization_current(
+            chapters_path, provenance_path, adapted_hash, prompt_content_hash
+        )
+    if current:
         logger.info("Chapterization is current for %s (use --force to re-chapterize)", episode_id)
-        existing_provenance = json.loads(provenance_path.read_text(encoding="utf-8"))
 
         return ChapterizationResult(
             episode_id=episode_id,
@@ -210,27 +260,36 @@ def chapterize_script(
         status=RunStatus.RUNNING,
     )
     session.add(pipeline_run)
-    session.flush()
+    # Commit so the SQLite write lock is released before the LLM calls.
+    session.commit()
 
     t0 = time.monotonic()
 
     try:
+        # Decoded only now: the idempotency check above needs just the hash
+        adapted_text = adapted_bytes.decode("utf-8")
+
         # Split prompt template into system and user parts
         system_prompt, user_template = _split_prompt(template_body)
 
         # Segment text if needed (unlikely for adapted scripts, but handle it)
         segments = _segment_script(adapted_text)
 
-        # Process each segment
-        total_input_tokens = 0
-        total_output_tokens = 0
-        total_cost = 0.0
-        all_chapters = []
-
-        for i, segment in enumerate(segments):
-            user_message = user_template.replace("{{episode_id}}", episode_id).replace(
-                "{{adapted_script}}", segment
+        # Segments are independent: chapterize them concurrently, keeping order
+        def chapterize_segment(i: int) -> tuple[ChapterDocument, ClaudeResponse]:
+            segment = segments[i]
+            user_message = _fill_placeholders(
+                user_template, episode_id=episode_id, adapted_script=segment
+            )
+            # The end of the previous segment goes in its own block, marked
+            # as context, so it is not chapterized a second time
+            context = (
+                _overlap_context(segments[i - 1], settings.chapterize_overlap_chars)
+                if i > 0 and settings.chapterize_overlap_chars > 0
+                else ""
             )
+            if context:
+                user_message += _CONTEXT_BLOCK.format(context=context)
 
             # Dry-run path
             dry_run_path = (
@@ -267,16 +326,6 @@ def chapterize_script(
                 # Validate retry
                 chapter_doc = ChapterDocument.model_validate(chapter_data)
 
-            # For multi-segment: merge chapters
-            if len(segments) > 1:
-                all_chapters.extend(chapter_doc.chapters)
-            else:
-                all_chapters = chapter_doc.chapters
-
-            total_input_tokens += response.input_tokens
-            total_output_tokens += response.output_tokens
-            total_cost += response.cost_usd
-
             logger.info(
                 "Segment %d/%d: %d chapters, %d in, %d out, $%.4f",
                 i + 1,
@@ -286,6 +335,31 @@ def chapterize_script(
                 response.output_tokens,
                 response.cost_usd,
             )
+            return chapter_doc, response
+
+        workers = min(settings.chapterize_concurrency, len(segments)) if len(segments) > 1 else 1
+        if workers <= 1:
+            results = [chapterize_segment(i) for i in range(len(segments))]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(chapterize_segment, range(len(segments))))
+
+        # Merge segment results in order
+        total_input_tokens = 0
+        total_output_tokens = 0
+        total_cost = 0.0
+        all_chapters = []
+
+        for chapter_doc, response in results:
+            # For multi-segment: merge chapters
+            if len(segments) > 1:
+                all_chapters.extend(chapter_doc.chapters)
+            else:
+                all_chapters = chapter_doc.chapters
+
+            total_input_tokens += response.input_tokens
+            total_output_tokens += response.output_tokens
+            total_cost += response.cost_usd
 
         # Reassemble if multi-segment: re-number chapters sequentially
         if len(segments) > 1:
@@ -293,9 +367,11 @@ def chapterize_script(
                 ch.order = idx + 1
                 ch.chapter_id = f"ch{ch.order:02d}"
 
-            # Build final document
-            total_duration = sum(ch.narration.estimated_duration_seconds for ch in all_chapters)
-            final_chapter_doc = ChapterDocument(
+            # Build final document. Each chapter was validated with its segment
+            # and the document invariants (count, unique sequential ids, summed
+            # duration) hold by construction, so validation is skipped.
+            total_duration = sum(map(_chapter_duration, all_chapters))
+            final_chapter_doc = ChapterDocument.model_construct(
                 schema_version="1.0",
                 episode_id=episode_id,
                 title=chapter_doc.title,  # Use title from first segment
@@ -306,9 +382,10 @@ def chapterize_script(
         else:
             final_chapter_doc = chapter_doc
 
-        # Validate duration estimates (recalculate from word count)
+        # Validate duration estimates. _fix_chapter_data already set word_count
+        # from the narration text, so it is not re-split here.
         for ch in final_chapter_doc.chapters:
-            actual_word_count = len(ch.narration.text.split())
+            actual_word_count = ch.narration.word_count
             expected_duration = _compute_duration_estimate(actual_word_count)
             # If LLM's estimate is off by >20%, log warning
             if abs(ch.narration.estimated_duration_seconds - expected_duration) > (
@@ -328,13 +405,6 @@ def chapterize_script(
             final_chapter_doc.estimated_duration_seconds,
         )
 
-        # Write chapters.json
-        chapters_path.parent.mkdir(parents=True, exist_ok=True)
-        chapters_json = final_chapter_doc.model_dump(mode="json", by_alias=True)
-        chapters_path.write_text(
-            json.dumps(chapters_json, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
-
         # Write provenance
         elapsed = time.monotonic() - t0
         provenance = {
@@ -362,10 +432,27 @@ def chapterize_script(
             "schema_version": "1.0",
         }
 
+        # Provenance is serialised and written on a background thread while
+        # chapters.json is written here
         provenance_path.parent.mkdir(parents=True, exist_ok=True)
-        provenance_path.write_text(
-            json.dumps(provenance, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        provenance_written = _writer_pool.submit(_write_json, provenance_path, provenance)
+
+        # Write chapters.json
+        try:
+            chapters_path.parent.mkdir(parents=True, exist_ok=True)
+            chapters_path.write_bytes(
+                final_chapter_doc.model_dump_json(by_alias=True, indent=2).encode("utf-8")
+            )
+        except BaseException:
+            # The new provenance must not vouch for a chapters.json that was
+            # not written, or the next run would skip as "current"
+            provenance_written.exception()  # wait for the write to settle
+            provenance_path.unlink(missing_ok=True)
+            raise
+
+        # Both files must be on disk (write errors re-raised) before any DB
+        # row is touched
+        provenance_written.result()
 
         # Persist ContentArtifact
         artifact = ContentArtifact(
@@ -424,56 +511,83 @@ def chapterize_script(
         raise
 
 
+def _write_json(path: Path, data: dict) -> None:
+    path.write_bytes(jsonio.dumps(data, indent=True))
+
+
+@lru_cache(maxsize=64)
+def _decode_provenance(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a provenance file; cached on its stat so unchanged files are decoded once."""
+    return jsonio.loads(Path(path).read_bytes())
+
+
 def _is_chapterization_current(
     chapters_path: Path,
     provenance_path: Path,
     adapted_hash: str,
     prompt_content_hash: str,
-) -> bool:
+) -> tuple[bool, dict | None]:
     """Check if existing chapterization is still valid.
 
-    Returns True (skip) if ALL of:
+    Returns ``(current, provenance)``; the parsed provenance is passed back
+    on a hit so the caller does not read the file again.
+
+    The chapterization is current (skip) if ALL of:
     1. chapters_path exists
     2. No .stale marker exists
     3. provenance_path exists and its prompt_hash matches
     4. provenance_path's input_content_hash matches
     """
     if not chapters_path.exists():
-        return False
+        return False, None
 
-    # Check for stale marker
+    # Check for stale marker: consuming it directly is one syscall either way
     stale_marker = chapters_path.parent / (chapters_path.name + ".stale")
-    if stale_marker.exists():
+    try:
+        stale_marker.unlink()
+    except FileNotFoundError:
+        pass
+    else:
         logger.info("Chapterization marked stale (upstream change), will reprocess")
-        stale_marker.unlink()  # Consume marker
-        return False
-
-    if not provenance_path.exists():
-        return False
+        return False, None
 
     try:
-        provenance = json.loads(provenance_path.read_text(encoding="utf-8"))
+        stat = provenance_path.stat()
+        provenance = dict(_decode_provenance(str(provenance_path), stat.st_mtime_ns, stat.st_size))
+    except FileNotFoundError:
+        return False, None
     except (json.JSONDecodeError, OSError):
         logger.warning("Provenance file corrupt or missing, will reprocess")
-        return False
+        return False, None
 
     if provenance.get("prompt_hash") != prompt_content_hash:
         logger.info("Prompt hash mismatch (prompt was updated)")
-        return False
+        return False, None
 
     if provenance.get("input_content_hash") != adapted_hash:
         logger.info("Adapted script content hash mismatch (adapted script was updated)")
-        return False
+        return False, None
+
+    return True, provenance
 
-    return True
 
+def _fill_placeholders(template: str, **values: str) -> str:
+    """Substitute ``{{name}}`` placeholders from *values* in one pass.
 
+    Unknown placeholders are left as they are, and substituted text is never
+    scanned again, so a script containing ``{{...}}`` stays intact.
+    """
+    return _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), template)
+
+
+@lru_cache(maxsize=4)
 def _split_prompt(template_body: str) -> tuple[str, str]:
     """Split rendered template into system prompt and user message.
 
     The template is split at the '# Input' header.
     Everything before it becomes the system prompt.
     Everything from '# Input' onward becomes the user message.
+    Memoised, since every episode in a batch uses the same template body.
     """
     marker = "# Input"
     idx = template_body.find(marker)
@@ -503,27 +617,26 @@ def _segment_script(text: str, limit: int = SEGMENT_CHAR_LIMIT) -> list[str]:
     if len(text) <= limit:
         return [text]
 
-    # Split into paragraphs
-    paragraphs = text.split("\n\n")
+    # Strip paragraphs once; segments are packed as index ranges over this
+    # list and each one is joined exactly once when it is flushed.
+    paragraphs = [
+        para for para in (m.group().strip() for m in _PARAGRAPH_RE.finditer(text)) if para
+    ]
 
     segments = []
-    current_segment = []
+    seg_start = 0  # index of the first paragraph in the pending segment
     current_length = 0
 
-    for para in paragraphs:
-        para = para.strip()
-        if not para:
-            continue
-
+    for i, para in enumerate(paragraphs):
         para_len = len(para)
 
         # If single paragraph exceeds limit, split by sentences
         if para_len > limit:
             # Flush current segment
-            if current_segment:
-                segments.append("\n\n".join(current_segment))
-                current_segment = []
-                current_length = 0
+            if i > seg_start:
+                segments.append("\n\n".join(paragraphs[seg_start:i]))
+            seg_start = i + 1
+            current_length = 0
 
             # Split long paragraph by sentences (approximate with ". ")
             sentences = para.split(". ")
@@ -531,8 +644,8 @@ def _segment_script(text: str, limit: int = SEGMENT_CHAR_LIMIT) -> list[str]:
             # If no sentence breaks found, fall back to character-based splitting
             if len(sentences) == 1:
                 # No sentence breaks, split by chunks
-                for i in range(0, para_len, limit):
-                    segments.append(para[i : i + limit])
+                for j in range(0, para_len, limit):
+                    segments.append(para[j : j + limit])
             else:
                 # Has sentence breaks, split by sentences
                 sent_segment = []
@@ -551,23 +664,36 @@ def _segment_script(text: str, limit: int = SEGMENT_CHAR_LIMIT) -> list[str]:
 
         # Normal paragraph fits in current segment
         elif current_length + para_len + 2 <= limit:
-            current_segment.append(para)
             current_length += para_len + 2
 
         # Start new segment
         else:
-            if current_segment:
-                segments.append("\n\n".join(current_segment))
-            current_segment = [para]
+            if i > seg_start:
+                segments.append("\n\n".join(paragraphs[seg_start:i]))
+            seg_start = i
             current_length = para_len
 
     # Flush remaining
-    if current_segment:
-        segments.append("\n\n".join(current_segment))
+    if seg_start < len(paragraphs):
+        segments.append("\n\n".join(paragraphs[seg_start:]))
 
     return segments if segments else [text]  # Fallback: return original as single segment
 
 
+def _overlap_context(segment: str, overlap_chars: int) -> str:
+    """Return the trailing paragraphs of *segment* that fit in *overlap_chars*.
+
+    Empty if even the last paragraph is too long.
+    """
+    paragraphs = segment.split("\n\n")
+    start = len(paragraphs)
+    size = -2  # no separator before the first paragraph taken
+    while start > 0 and size + 2 + len(paragraphs[start - 1]) <= overlap_chars:
+        start -= 1
+        size += 2 + len(paragraphs[start])
+    return "\n\n".join(paragraphs[start:])
+
+
 def _compute_duration_estimate(word_count: int) -> int:
     """Estimate narration duration in seconds from Turkish word count.
 
@@ -651,42 +777,21 @@ def _clean_json(text: str) -> str:
     - Single-line // comments
     - Trailing commas before } or ]
     """
-    import re
-
-    # Remove single-line // comments (but not inside strings)
-    # Simple heuristic: remove // comments only when preceded by whitespace or start of line
-    lines = []
-    for line in text.split("\n"):
-        # Skip full-line comments
-        stripped = line.lstrip()
-        if stripped.startswith("//"):
-            continue
-        # Remove inline // comments (rough: only if not inside a string value)
-        # Find // that's not inside quotes
-        in_string = False
-        escape_next = False
-        cut_pos = None
-        for i, ch in enumerate(line):
-            if escape_next:
-                escape_next = False
-                continue
-            if ch == "\\":
-                escape_next = True
-                continue
-            if ch == '"':
-                in_string = not in_string
-            elif ch == "/" and not in_string and i + 1 < len(line) and line[i + 1] == "/":
-                cut_pos = i
-                break
-        if cut_pos is not None:
-            line = line[:cut_pos].rstrip()
-        lines.append(line)
-    text = "\n".join(lines)
+    if "//" in text:
+        text = _strip_json_comments(text)
 
     # Remove trailing commas: ,  followed by } or ]
-    text = re.sub(r",\s*([}\]])", r"\1", text)
+    return _TRAILING_COMMA_RE.sub(r"\1", text)
+
 
-    return text
+def _strip_json_comments(text: str) -> str:
+    """Remove // comments that are not inside a string value."""
+    return _JSON_COMMENT_RE.sub(_drop_comment, text)
+
+
+def _drop_comment(match: re.Match) -> str:
+    # String literals and escapes are kept; whole-line and inline comments go
+    return match.group() if match.group()[0] in '"\\' else ""
 
 
 _VALID_VISUAL_TYPES = {"title_card", "diagram", "b_roll", "talking_head", "screen_share"}
@@ -857,12 +962,17 @@ def _mark_downstream_stale(episode_id: str, settings: Settings) -> None:
     imagegen_marker_path = Path(settings.outputs_dir) / episode_id / "images" / ".stale"
     tts_marker_path = Path(settings.outputs_dir) / episode_id / "tts" / ".stale"
 
+    # Every marker carries the same payload: serialise it once
+    stale_data = {
+        "invalidated_at": _utcnow().isoformat(),
+        "invalidated_by": "chapterize",
+        "reason": "chapters_changed",
+    }
+    marker_bytes = jsonio.dumps(stale_data, indent=True)
+
     for marker_path in [imagegen_marker_path, tts_marker_path]:
-        if marker_path.parent.exists():
-            stale_data = {
-                "invalidated_at": _utcnow().isoformat(),
-                "invalidated_by": "chapterize",
-                "reason": "chapters_changed",
-            }
-            marker_path.write_text(json.dumps(stale_data, indent=2), encoding="utf-8")
-            logger.info("Marked downstream stage as stale: %s", marker_path.parent.name)
+        try:
+            marker_path.write_bytes(marker_bytes)
+        except FileNotFoundError:
+            continue  # Stage has not produced output yet
+        logger.info("Marked downstream stage as stale: %s", marker_path.parent.name)
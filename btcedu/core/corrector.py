@@ -4,14 +4,20 @@ import hashlib
 import json
 import logging
 import time
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from difflib import SequenceMatcher
+from itertools import accumulate
 from pathlib import Path
 
 from sqlalchemy.orm import Session
 
 from btcedu.config import Settings
+from btcedu.core.batching import run_stage_batch
 from btcedu.core.prompt_registry import TEMPLATES_DIR, PromptRegistry
 from btcedu.models.content_artifact import ContentArtifact
 from btcedu.models.episode import (
@@ -21,7 +27,9 @@ from btcedu.models.episode import (
     PipelineStage,
     RunStatus,
 )
+from btcedu.models.prompt_version import PromptVersion
 from btcedu.services.claude_service import ClaudeResponse, call_claude
+from btcedu.utils import jsonio
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +41,10 @@ def _utcnow() -> datetime:
     return datetime.now(UTC)
 
 
+def _write_json(path: Path, data: dict) -> None:
+    path.write_bytes(jsonio.dumps(data, indent=True))
+
+
 @dataclass
 class CorrectionResult:
     """Summary of transcript correction for one episode."""
@@ -73,6 +85,78 @@ def correct_transcript(
     Raises:
         ValueError: If episode not found or not in correct status.
     """
+    job = _prepare_correction(session, episode_id, settings, force)
+    if isinstance(job, CorrectionResult):
+        return job
+
+    try:
+        responses = _correct_segments(job, settings)
+        return _finish_correction(session, job, responses, settings)
+    except Exception as e:
+        _fail_correction(session, job.episode, job.pipeline_run, e)
+        raise
+
+
+def correct_transcripts_batch(
+    session: Session,
+    episode_ids: list[str],
+    settings: Settings,
+    force: bool = False,
+) -> dict[str, CorrectionResult | Exception]:
+    """Correct several transcripts through one Anthropic Message Batch.
+
+    Same checks, outputs and idempotency as :func:`correct_transcript`, but
+    the segments of every episode that needs correcting are submitted
+    together at the batch discount. This blocks until the batch has ended,
+    so it suits backfills rather than interactive use.
+
+    Returns a result per episode ID, in input order: a CorrectionResult,
+    or the exception that made that episode fail.
+    """
+    return run_stage_batch(
+        session,
+        episode_ids,
+        settings,
+        force,
+        label="Correction",
+        result_type=CorrectionResult,
+        prepare=_prepare_correction,
+        finish=_finish_correction,
+        fail=_fail_correction,
+    )
+
+
+@dataclass
+class _CorrectJob:
+    """An episode that passed the correct checks and is ready for the LLM calls."""
+
+    episode: Episode
+    pipeline_run: PipelineRun
+    started: float
+    transcript_path: Path
+    corrected_path: Path
+    diff_path: Path
+    provenance_path: Path
+    original_text: str
+    input_content_hash: str
+    prompt_version: PromptVersion
+    prompt_content_hash: str
+    system_prompt: str
+    user_messages: list[str]
+    dry_run_paths: list[Path | None]
+
+
+def _prepare_correction(
+    session: Session,
+    episode_id: str,
+    settings: Settings,
+    force: bool,
+) -> CorrectionResult | _CorrectJob:
+    """Validate *episode_id* and build its correction requests.
+
+    Returns the existing CorrectionResult when the correction is current,
+    otherwise a _CorrectJob with a RUNNING PipelineRun.
+    """
     episode = session.query(Episode).filter(Episode.episode_id == episode_id).first()
     if not episode:
         raise ValueError(f"Episode not found: {episode_id}")
@@ -119,27 +203,47 @@ def correct_transcript(
     _, template_body = registry.load_template(template_file)
     prompt_content_hash = registry.compute_hash(template_body)
 
-    # Compute input content hash for idempotency
-    original_text = transcript_path.read_text(encoding="utf-8")
-    input_content_hash = hashlib.sha256(original_text.encode("utf-8")).hexdigest()
+    # Compute input content hash for idempotency, straight from the file's
+    # bytes: the text is only decoded once we know it is needed.
+    original_bytes = transcript_path.read_bytes()
+    if b"\r" in original_bytes:
+        # Same newline translation read_text() applies, so the hash is unchanged
+        original_bytes = original_bytes.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    input_content_hash = hashlib.sha256(original_bytes).hexdigest()
 
     # Idempotency check
-    if not force and _is_correction_current(
-        corrected_path, provenance_path, input_content_hash, prompt_content_hash
-    ):
+    current, existing_provenance = (
+        (False, None)
+        if force
+        else _is_correction_current(
+            corrected_path, provenance_path, input_content_hash, prompt_content_hash
+        )
+    )
+    if current:
         logger.info("Correction is current for %s (use --force to re-correct)", episode_id)
-        existing_corrected = corrected_path.read_text(encoding="utf-8")
-        existing_diff = json.loads(diff_path.read_text(encoding="utf-8"))
+        change_count = existing_provenance.get("change_count")
+        if change_count is None:
+            # Provenance written before the counts were recorded there
+            existing_diff = jsonio.loads(diff_path.read_bytes())
+            change_count = existing_diff.get("summary", {}).get("total_changes", 0)
+        output_char_count = existing_provenance.get("output_char_count")
+        if output_char_count is None:
+            output_char_count = len(corrected_path.read_text(encoding="utf-8"))
+        input_char_count = existing_provenance.get("input_char_count")
+        if input_char_count is None:
+            input_char_count = len(original_bytes.decode("utf-8"))
         return CorrectionResult(
             episode_id=episode_id,
             corrected_path=str(corrected_path),
             diff_path=str(diff_path),
             provenance_path=str(provenance_path),
-            change_count=existing_diff.get("summary", {}).get("total_changes", 0),
-            input_char_count=len(original_text),
-            output_char_count=len(existing_corrected),
+            change_count=change_count,
+            input_char_count=input_char_count,
+            output_char_count=output_char_count,
         )
 
+    original_text = original_bytes.decode("utf-8")
+
     # Create PipelineRun
     pipeline_run = PipelineRun(
         episode_id=episode.id,
@@ -147,7 +251,9 @@ def correct_transcript(
         status=RunStatus.RUNNING,
     )
     session.add(pipeline_run)
-    session.flush()
+    # Commit, not flush: an open write transaction would hold SQLite's
+    # write lock through the LLM calls and block concurrent workers.
+    session.commit()
 
     t0 = time.monotonic()
 
@@ -172,138 +278,191 @@ def correct_transcript(
         # Segment transcript if needed
         segments = _segment_transcript(original_text)
 
-        # Process each segment
-        total_input_tokens = 0
-        total_output_tokens = 0
-        total_cost = 0.0
-        corrected_segments: list[str] = []
+        # Split the template at its placeholder once; each message is then
+        # a single join sized to its output instead of a rescan per segment.
+        template_parts = user_template.split("{{ transcript }}")
+        user_messages = [segment.join(template_parts) for segment in segments]
+        dry_run_paths = [
+            Path(settings.outputs_dir) / episode_id / f"dry_run_correct_{i}.json"
+            if settings.dry_run
+            else None
+            for i in range(len(segments))
+        ]
+    except Exception as e:
+        _fail_correction(session, episode, pipeline_run, e)
+        raise
 
-        for i, segment in enumerate(segments):
-            user_message = user_template.replace("{{ transcript }}", segment)
+    return _CorrectJob(
+        episode=episode,
+        pipeline_run=pipeline_run,
+        started=t0,
+        transcript_path=transcript_path,
+        corrected_path=corrected_path,
+        diff_path=diff_path,
+        provenance_path=provenance_path,
+        original_text=original_text,
+        input_content_hash=input_content_hash,
+        prompt_version=prompt_version,
+        prompt_content_hash=prompt_content_hash,
+        system_prompt=system_prompt,
+        user_messages=user_messages,
+        dry_run_paths=dry_run_paths,
+    )
 
-            # Dry-run path
-            dry_run_path = (
-                Path(settings.outputs_dir) / episode_id / f"dry_run_correct_{i}.json"
-                if settings.dry_run
-                else None
-            )
 
-            response: ClaudeResponse = call_claude(
-                system_prompt=system_prompt,
-                user_message=user_message,
-                settings=settings,
-                dry_run_path=dry_run_path,
-            )
+def _correct_segments(job: _CorrectJob, settings: Settings) -> list[ClaudeResponse]:
+    """Call the LLM for each segment of *job*, returning responses in order."""
+    count = len(job.user_messages)
 
-            corrected_segments.append(response.text)
-            total_input_tokens += response.input_tokens
-            total_output_tokens += response.output_tokens
-            total_cost += response.cost_usd
-
-        # Reassemble corrected text
-        corrected_text = "\n\n".join(corrected_segments)
-
-        # Compute diff
-        diff_data = compute_correction_diff(original_text, corrected_text, episode_id)
-
-        # Write output files
-        corrected_path.parent.mkdir(parents=True, exist_ok=True)
-        corrected_path.write_text(corrected_text, encoding="utf-8")
-
-        diff_path.parent.mkdir(parents=True, exist_ok=True)
-        diff_path.write_text(json.dumps(diff_data, ensure_ascii=False, indent=2), encoding="utf-8")
-
-        # Mark downstream translation as stale if it exists (cascade invalidation)
-        translated_path = Path(settings.transcripts_dir) / episode_id / "transcript.tr.txt"
-        if translated_path.exists():
-            stale_marker = translated_path.parent / (translated_path.name + ".stale")
-            stale_data = {
-                "invalidated_at": _utcnow().isoformat(),
-                "invalidated_by": "correct",
-                "reason": "correction_changed",
-            }
-            stale_marker.parent.mkdir(parents=True, exist_ok=True)
-            stale_marker.write_text(json.dumps(stale_data, indent=2), encoding="utf-8")
-            logger.info("Marked downstream translation as stale: %s", translated_path.name)
-
-        # Write provenance
-        elapsed = time.monotonic() - t0
-        provenance = {
-            "stage": "correct",
-            "episode_id": episode_id,
-            "timestamp": _utcnow().isoformat(),
-            "prompt_name": "correct_transcript",
-            "prompt_version": prompt_version.version,
-            "prompt_hash": prompt_content_hash,
-            "model": settings.claude_model,
-            "model_params": {
-                "temperature": settings.claude_temperature,
-                "max_tokens": settings.claude_max_tokens,
-            },
-            "input_files": [str(transcript_path)],
-            "input_content_hash": input_content_hash,
-            "output_files": [str(corrected_path), str(diff_path)],
-            "input_tokens": total_input_tokens,
-            "output_tokens": total_output_tokens,
-            "cost_usd": total_cost,
-            "duration_seconds": round(elapsed, 2),
-            "segments_processed": len(segments),
-        }
+    # Every segment shares the system prompt: with several segments it is
+    # sent for prompt caching, so only the first call pays for it in full.
+    cache_system_prompt = count > 1
 
-        provenance_path.parent.mkdir(parents=True, exist_ok=True)
-        provenance_path.write_text(
-            json.dumps(provenance, ensure_ascii=False, indent=2), encoding="utf-8"
+    # Segments are independent: correct them concurrently, keeping order
+    def correct_segment(i: int) -> ClaudeResponse:
+        return call_claude(
+            system_prompt=job.system_prompt,
+            user_message=job.user_messages[i],
+            settings=settings,
+            dry_run_path=job.dry_run_paths[i],
+            cache_system_prompt=cache_system_prompt,
         )
 
-        # Persist ContentArtifact
-        artifact = ContentArtifact(
-            episode_id=episode_id,
-            artifact_type="correct",
-            file_path=str(corrected_path),
-            model=settings.claude_model,
-            prompt_hash=prompt_content_hash,
-            retrieval_snapshot_path=None,
-        )
-        session.add(artifact)
-
-        # Update PipelineRun
-        pipeline_run.status = RunStatus.SUCCESS
-        pipeline_run.completed_at = _utcnow()
-        pipeline_run.input_tokens = total_input_tokens
-        pipeline_run.output_tokens = total_output_tokens
-        pipeline_run.estimated_cost_usd = total_cost
-
-        # Update Episode
-        episode.status = EpisodeStatus.CORRECTED
-        session.commit()
-
-        logger.info(
-            "Corrected transcript for %s (%d changes, $%.4f)",
-            episode_id,
-            diff_data["summary"]["total_changes"],
-            total_cost,
-        )
+    # The first call runs alone so it writes the prompt cache the others read
+    responses = [correct_segment(0)]
+    workers = max(1, min(settings.correct_concurrency, count - 1))
+    if workers == 1:
+        responses += [correct_segment(i) for i in range(1, count)]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses += executor.map(correct_segment, range(1, count))
+    return responses
 
-        return CorrectionResult(
-            episode_id=episode_id,
-            corrected_path=str(corrected_path),
-            diff_path=str(diff_path),
-            provenance_path=str(provenance_path),
-            input_tokens=total_input_tokens,
-            output_tokens=total_output_tokens,
-            cost_usd=total_cost,
-            change_count=diff_data["summary"]["total_changes"],
-            input_char_count=len(original_text),
-            output_char_count=len(corrected_text),
-        )
 
-    except Exception as e:
-        pipeline_run.status = RunStatus.FAILED
-        pipeline_run.completed_at = _utcnow()
-        pipeline_run.error_message = str(e)
-        episode.error_message = str(e)
-        session.commit()
-        raise
+def _finish_correction(
+    session: Session,
+    job: _CorrectJob,
+    responses: list[ClaudeResponse],
+    settings: Settings,
+) -> CorrectionResult:
+    """Write the corrected transcript, diff and provenance, and mark success."""
+    episode_id = job.episode.episode_id
+    corrected_path = job.corrected_path
+    diff_path = job.diff_path
+
+    total_input_tokens = sum(response.input_tokens for response in responses)
+    total_output_tokens = sum(response.output_tokens for response in responses)
+    total_cost = sum(response.cost_usd for response in responses)
+
+    # Reassemble corrected text
+    corrected_text = "\n\n".join(response.text for response in responses)
+
+    # Compute diff
+    diff_data = compute_correction_diff(job.original_text, corrected_text, episode_id)
+
+    # Write output files
+    corrected_path.parent.mkdir(parents=True, exist_ok=True)
+    corrected_path.write_text(corrected_text, encoding="utf-8")
+
+    diff_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_json(diff_path, diff_data)
+
+    # Mark downstream translation as stale if it exists (cascade invalidation)
+    translated_path = Path(settings.transcripts_dir) / episode_id / "transcript.tr.txt"
+    if translated_path.exists():
+        stale_marker = translated_path.parent / (translated_path.name + ".stale")
+        stale_data = {
+            "invalidated_at": _utcnow().isoformat(),
+            "invalidated_by": "correct",
+            "reason": "correction_changed",
+        }
+        stale_marker.parent.mkdir(parents=True, exist_ok=True)
+        stale_marker.write_text(json.dumps(stale_data, indent=2), encoding="utf-8")
+        logger.info("Marked downstream translation as stale: %s", translated_path.name)
+
+    # Write provenance
+    elapsed = time.monotonic() - job.started
+    provenance = {
+        "stage": "correct",
+        "episode_id": episode_id,
+        "timestamp": _utcnow().isoformat(),
+        "prompt_name": "correct_transcript",
+        "prompt_version": job.prompt_version.version,
+        "prompt_hash": job.prompt_content_hash,
+        "model": settings.claude_model,
+        "model_params": {
+            "temperature": settings.claude_temperature,
+            "max_tokens": settings.claude_max_tokens,
+        },
+        "input_files": [str(job.transcript_path)],
+        "input_content_hash": job.input_content_hash,
+        "output_files": [str(corrected_path), str(diff_path)],
+        "input_tokens": total_input_tokens,
+        "output_tokens": total_output_tokens,
+        "cost_usd": total_cost,
+        "duration_seconds": round(elapsed, 2),
+        "segments_processed": len(responses),
+        "input_char_count": len(job.original_text),
+        "change_count": diff_data["summary"]["total_changes"],
+        "output_char_count": len(corrected_text),
+    }
+
+    job.provenance_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_json(job.provenance_path, provenance)
+
+    # Persist ContentArtifact
+    artifact = ContentArtifact(
+        episode_id=episode_id,
+        artifact_type="correct",
+        file_path=str(corrected_path),
+        model=settings.claude_model,
+        prompt_hash=job.prompt_content_hash,
+        retrieval_snapshot_path=None,
+    )
+    session.add(artifact)
+
+    # Update PipelineRun
+    pipeline_run = job.pipeline_run
+    pipeline_run.status = RunStatus.SUCCESS
+    pipeline_run.completed_at = _utcnow()
+    pipeline_run.input_tokens = total_input_tokens
+    pipeline_run.output_tokens = total_output_tokens
+    pipeline_run.estimated_cost_usd = total_cost
+
+    # Update Episode
+    job.episode.status = EpisodeStatus.CORRECTED
+    session.commit()
+
+    logger.info(
+        "Corrected transcript for %s (%d changes, $%.4f)",
+        episode_id,
+        diff_data["summary"]["total_changes"],
+        total_cost,
+    )
+
+    return CorrectionResult(
+        episode_id=episode_id,
+        corrected_path=str(corrected_path),
+        diff_path=str(diff_path),
+        provenance_path=str(job.provenance_path),
+        input_tokens=total_input_tokens,
+        output_tokens=total_output_tokens,
+        cost_usd=total_cost,
+        change_count=diff_data["summary"]["total_changes"],
+        input_char_count=len(job.original_text),
+        output_char_count=len(corrected_text),
+    )
+
+
+def _fail_correction(
+    session: Session, episode: Episode, pipeline_run: PipelineRun, error: Exception
+) -> None:
+    """Record *error* on the correct PipelineRun and the episode."""
+    pipeline_run.status = RunStatus.FAILED
+    pipeline_run.completed_at = _utcnow()
+    pipeline_run.error_message = str(error)
+    episode.error_message = str(error)
+    session.commit()
 
 
 def _is_correction_current(
@@ -311,38 +470,42 @@ def _is_correction_current(
     provenance_path: Path,
     input_content_hash: str,
     prompt_content_hash: str,
-) -> bool:
+) -> tuple[bool, dict | None]:
     """Check if existing correction is still valid.
 
-    Returns True (skip) if ALL of:
+    Returns ``(current, provenance)``. The parsed provenance is passed back
+    so the skip path can report its counts without reading the outputs;
+    it is ``None`` when the check did not get as far as parsing it.
+
+    The correction is current (skip) if ALL of:
     1. corrected_path exists
     2. No .stale marker exists
     3. provenance_path exists and its prompt_hash matches
     4. provenance_path's input_content_hash matches
     """
     if not corrected_path.exists():
-        return False
+        return False, None
 
     # Check for stale marker
     stale_marker = corrected_path.parent / (corrected_path.name + ".stale")
     if stale_marker.exists():
-        return False
+        return False, None
 
     if not provenance_path.exists():
-        return False
+        return False, None
 
     try:
-        provenance = json.loads(provenance_path.read_text(encoding="utf-8"))
+        provenance = jsonio.loads(provenance_path.read_bytes())
     except (json.JSONDecodeError, OSError):
-        return False
+        return False, None
 
     if provenance.get("prompt_hash") != prompt_content_hash:
-        return False
+        return False, provenance
 
     if provenance.get("input_content_hash") != input_content_hash:
-        return False
+        return False, provenance
 
-    return True
+    return True, provenance
 
 
 def _split_prompt(template_body: str) -> tuple[str, str]:
@@ -379,26 +542,20 @@ def _segment_transcript(text: str, limit: int = SEGMENT_CHAR_LIMIT) -> list[str]
     if len(text) <= limit:
         return [text]
 
-    paragraphs = text.split("\n\n")
+    # Paragraphs are packed greedily along a prefix sum of their lengths:
+    # ends[k] is the offset just past paragraph k plus its \n\n separator,
+    # so each segment is found with one bisect and sliced straight out of
+    # the text (paragraphs p..q span text[seg_start:ends[q] - 2]).
+    ends = list(accumulate(len(para) + 2 for para in text.split("\n\n")))
     segments: list[str] = []
-    current: list[str] = []
-    current_len = 0
-
-    for para in paragraphs:
-        para_len = len(para)
-        # Account for the \n\n separator
-        sep_len = 2 if current else 0
-
-        if current_len + sep_len + para_len > limit and current:
-            segments.append("\n\n".join(current))
-            current = [para]
-            current_len = para_len
-        else:
-            current.append(para)
-            current_len += sep_len + para_len
-
-    if current:
-        segments.append("\n\n".join(current))
+    p = 0
+    seg_start = 0
+    while p < len(ends):
+        # Last paragraph that still fits; always take at least one
+        q = max(bisect_right(ends, seg_start + limit + 2) - 1, p)
+        segments.append(text[seg_start : ends[q] - 2])
+        p = q + 1
+        seg_start = ends[q]
 
     # Handle edge case: a single paragraph longer than the limit
     # Split it at the character limit
@@ -414,6 +571,123 @@ def _segment_transcript(text: str, limit: int = SEGMENT_CHAR_LIMIT) -> list[str]
     return final_segments
 
 
+def _anchors(
+    a: Sequence[str], b: Sequence[str], a_lo: int, a_hi: int, b_lo: int, b_hi: int
+) -> list[tuple[int, int]]:
+    """Matching word positions to split a diff range at, as ``(i, j)`` pairs.
+
+    Prefers words occurring exactly once on both sides. Failing that (short
+    vocabularies, long ranges), the k-th occurrence of every word that has
+    the same count on both sides is paired with its k-th counterpart. Either
+    way only the longest subsequence increasing in both ``i`` and ``j`` is
+    kept (patience sorting), so the anchors never cross.
+    """
+    count_a = Counter(a[a_lo:a_hi])
+    count_b = Counter(b[b_lo:b_hi])
+    pos_b = {b[j]: j for j in range(b_lo, b_hi) if count_b[b[j]] == 1}
+    pairs = [
+        (i, pos_b[a[i]])
+        for i in range(a_lo, a_hi)
+        if count_a[a[i]] == 1 and a[i] in pos_b
+    ]
+    if not pairs:
+        occurrences: dict[str, list[int]] = {}
+        for j in range(b_lo, b_hi):
+            if count_a[b[j]] == count_b[b[j]]:
+                occurrences.setdefault(b[j], []).append(j)
+        seen: Counter[str] = Counter()
+        for i in range(a_lo, a_hi):
+            word = a[i]
+            if word in occurrences:
+                pairs.append((i, occurrences[word][seen[word]]))
+                seen[word] += 1
+
+    tails: list[int] = []
+    tail_idx: list[int] = []
+    prev = [-1] * len(pairs)
+    for n, (_, j) in enumerate(pairs):
+        k = bisect_left(tails, j)
+        if k:
+            prev[n] = tail_idx[k - 1]
+        if k == len(tails):
+            tails.append(j)
+            tail_idx.append(n)
+        else:
+            tails[k] = j
+            tail_idx[k] = n
+
+    anchors: list[tuple[int, int]] = []
+    n = tail_idx[-1] if tail_idx else -1
+    while n >= 0:
+        anchors.append(pairs[n])
+        n = prev[n]
+    anchors.reverse()
+    return anchors
+
+
+def _word_opcodes(a: Sequence[str], b: Sequence[str]) -> list[tuple[str, int, int, int, int]]:
+    """Word-level opcodes in ``SequenceMatcher.get_opcodes`` shape.
+
+    Corrected transcripts are near-identical to the original, so running
+    ``SequenceMatcher`` over a whole episode mostly re-matches long equal
+    stretches, at quadratic worst-case cost. This is a patience diff: trim
+    the common prefix/suffix, split the rest at anchor words, recurse into
+    the gaps, and only hand gaps without anchors to ``SequenceMatcher``.
+    """
+    opcodes: list[tuple[str, int, int, int, int]] = []
+
+    def emit(tag: str, i1: int, i2: int, j1: int, j2: int) -> None:
+        if opcodes and tag == "equal" and opcodes[-1][0] == "equal":
+            _, pi1, _, pj1, _ = opcodes[-1]
+            opcodes[-1] = ("equal", pi1, i2, pj1, j2)
+        else:
+            opcodes.append((tag, i1, i2, j1, j2))
+
+    # Explicit stack (no recursion limit) of ranges still to diff and
+    # ("equal", ...) opcodes to emit, popped in output order.
+    stack: list[tuple] = [(0, len(a), 0, len(b))]
+    while stack:
+        item = stack.pop()
+        if item[0] == "equal":
+            emit(*item)
+            continue
+        a_lo, a_hi, b_lo, b_hi = item
+        start_a, start_b = a_lo, b_lo
+        while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+            a_lo += 1
+            b_lo += 1
+        if a_lo > start_a:
+            emit("equal", start_a, a_lo, start_b, b_lo)
+        end_a, end_b = a_hi, b_hi
+        while a_hi > a_lo and b_hi > b_lo and a[a_hi - 1] == b[b_hi - 1]:
+            a_hi -= 1
+            b_hi -= 1
+        if a_hi < end_a:
+            stack.append(("equal", a_hi, end_a, b_hi, end_b))
+
+        if a_lo == a_hi or b_lo == b_hi:
+            if a_lo < a_hi:
+                emit("delete", a_lo, a_hi, b_lo, b_lo)
+            elif b_lo < b_hi:
+                emit("insert", a_lo, a_lo, b_lo, b_hi)
+        elif anchors := _anchors(a, b, a_lo, a_hi, b_lo, b_hi):
+            gaps = []
+            i, j = a_lo, b_lo
+            for ai, bj in anchors:
+                gaps.append((i, ai, j, bj))
+                gaps.append(("equal", ai, ai + 1, bj, bj + 1))
+                i, j = ai + 1, bj + 1
+            gaps.append((i, a_hi, j, b_hi))
+            stack.extend(reversed(gaps))
+        else:
+            # Gaps are short, so skip the "popular word" heuristic: it would
+            # junk filler words and report them as replaced.
+            matcher = SequenceMatcher(None, a[a_lo:a_hi], b[b_lo:b_hi], autojunk=False)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                emit(tag, a_lo + i1, a_lo + i2, b_lo + j1, b_lo + j2)
+    return opcodes
+
+
 def compute_correction_diff(
     original: str,
     corrected: str,
@@ -422,7 +696,7 @@ def compute_correction_diff(
 ) -> dict:
     """Compute structured diff between original and corrected transcript.
 
-    Uses difflib.SequenceMatcher on word-level tokens.
+    Diffs word-level tokens, anchored on unique words (see _word_opcodes).
 
     Args:
         original: The original transcript text.
@@ -433,13 +707,18 @@ def compute_correction_diff(
     Returns:
         Dict matching the correction_diff.json format from MASTERPLAN §5A.
     """
-    orig_words = original.split()
-    corr_words = corrected.split()
+    # Segments returned verbatim are common for clean transcripts: skip
+    # tokenising and diffing entirely when nothing changed.
+    if original == corrected:
+        opcodes = []
+    else:
+        orig_words = original.split()
+        corr_words = corrected.split()
+        opcodes = _word_opcodes(orig_words, corr_words)
 
-    matcher = SequenceMatcher(None, orig_words, corr_words)
     changes: list[dict] = []
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    for tag, i1, i2, j1, j2 in opcodes:
         if tag == "equal":
             continue
 
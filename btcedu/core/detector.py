@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
 from btcedu.config import Settings
@@ -16,6 +17,12 @@ from btcedu.services.feed_service import (
 
 logger = logging.getLogger(__name__)
 
+# Episode ids per IN (...) lookup, well under SQLite's bound-parameter limit
+_ID_LOOKUP_CHUNK = 500
+# Rows per multi-VALUES insert: up to twelve parameters each with column
+# defaults filled in, keeping a statement under SQLite's historic 999 limit
+_INSERT_CHUNK = 75
+
 
 def _resolve_channel_id(
     session: Session, settings: Settings, explicit_channel_id: str | None = None
@@ -50,6 +57,65 @@ def _resolve_channel_id(
     return None
 
 
+def _existing_episode_ids(session: Session, episode_ids: list[str]) -> set[str]:
+    """Return which of *episode_ids* are already in the DB.
+
+    Only the candidate ids are looked up, instead of loading every
+    episode_id in the table.
+    """
+    existing: set[str] = set()
+    for start in range(0, len(episode_ids), _ID_LOOKUP_CHUNK):
+        chunk = episode_ids[start : start + _ID_LOOKUP_CHUNK]
+        existing.update(
+            session.scalars(select(Episode.episode_id).where(Episode.episode_id.in_(chunk)))
+        )
+    return existing
+
+
+def _insert_new_episodes(session: Session, rows: list[dict]) -> int:
+    """Insert episode *rows*, skipping any whose episode_id already exists.
+
+    The unique episode_id index rejects duplicates atomically via
+    ``INSERT ... ON CONFLICT DO NOTHING`` (SQLite/PostgreSQL), so nothing
+    has to be looked up first and concurrent runs cannot race. Other
+    databases fall back to a feed-scoped lookup. Returns the number of
+    rows inserted.
+    """
+    if not rows:
+        return 0
+
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        existing_ids = _existing_episode_ids(session, [row["episode_id"] for row in rows])
+        rows = [row for row in rows if row["episode_id"] not in existing_ids]
+        if rows:
+            session.execute(insert(Episode), rows)
+        return len(rows)
+
+    inserted = 0
+    for start in range(0, len(rows), _INSERT_CHUNK):
+        stmt = (
+            dialect_insert(Episode)
+            .values(rows[start : start + _INSERT_CHUNK])
+            .on_conflict_do_nothing(index_elements=["episode_id"])
+        )
+        inserted += session.execute(stmt).rowcount
+    return inserted
+
+
+def _episode_count(session: Session) -> int:
+    """Total episodes, as a bare ``SELECT count(*)``.
+
+    ``Query.count()`` wraps the full entity SELECT in a subquery; counting
+    the table directly lets SQLite answer from its smallest index.
+    """
+    return session.scalar(select(func.count()).select_from(Episode))
+
+
 @dataclass
 class DetectResult:
     """Summary of a detection run."""
@@ -103,27 +169,24 @@ def detect_episodes(
 
     result = DetectResult(found=len(episodes))
 
-    existing_ids = {row[0] for row in session.query(Episode.episode_id).all()}
-
-    for ep_info in episodes:
-        if ep_info.episode_id in existing_ids:
-            continue
-        episode = Episode(
-            episode_id=ep_info.episode_id,
-            channel_id=resolved_channel_id,
-            source=ep_info.source,
-            title=ep_info.title,
-            url=ep_info.url,
-            published_at=ep_info.published_at,
-            status=EpisodeStatus.NEW,
-            content_profile=settings.default_content_profile,
-            pipeline_version=settings.pipeline_version,
-        )
-        session.add(episode)
-        result.new += 1
+    rows = [
+        {
+            "episode_id": ep_info.episode_id,
+            "channel_id": resolved_channel_id,
+            "source": ep_info.source,
+            "title": ep_info.title,
+            "url": ep_info.url,
+            "published_at": ep_info.published_at,
+            "status": EpisodeStatus.NEW,
+            "content_profile": settings.default_content_profile,
+            "pipeline_version": settings.pipeline_version,
+        }
+        for ep_info in episodes
+    ]
+    result.new = _insert_new_episodes(session, rows)
 
     session.commit()
-    result.total = session.query(Episode).count()
+    result.total = _episode_count(session)
     return result
 
 
@@ -143,25 +206,22 @@ def detect_from_content(
     episodes = parse_feed(feed_content, source_type)
     result = DetectResult(found=len(episodes))
 
-    existing_ids = {row[0] for row in session.query(Episode.episode_id).all()}
-
-    for ep_info in episodes:
-        if ep_info.episode_id in existing_ids:
-            continue
-        episode = Episode(
-            episode_id=ep_info.episode_id,
-            channel_id=channel_id,
-            source=ep_info.source,
-            title=ep_info.title,
-            url=ep_info.url,
-            published_at=ep_info.published_at,
-            status=EpisodeStatus.NEW,
-        )
-        session.add(episode)
-        result.new += 1
+    rows = [
+        {
+            "episode_id": ep_info.episode_id,
+            "channel_id": channel_id,
+            "source": ep_info.source,
+            "title": ep_info.title,
+            "url": ep_info.url,
+            "published_at": ep_info.published_at,
+            "status": EpisodeStatus.NEW,
+        }
+        for ep_info in episodes
+    ]
+    result.new = _insert_new_episodes(session, rows)
 
     session.commit()
-    result.total = session.query(Episode).count()
+    result.total = _episode_count(session)
     return result
 
 
@@ -215,9 +275,10 @@ def backfill_episodes(
             continue
         filtered.append(ep)
 
-    existing_ids = {row[0] for row in session.query(Episode.episode_id).all()}
+    existing_ids = _existing_episode_ids(session, [ep.episode_id for ep in filtered])
 
     inserted = 0
+    rows: list[dict] = []
     for ep_info in filtered:
         if ep_info.episode_id in existing_ids:
             continue
@@ -230,23 +291,26 @@ def backfill_episodes(
                 "[dry-run] Would insert: %s  %s  (%s)", ep_info.episode_id, ep_info.title, pub
             )
         else:
-            episode = Episode(
-                episode_id=ep_info.episode_id,
-                channel_id=resolved_channel_id,
-                source=ep_info.source,
-                title=ep_info.title,
-                url=ep_info.url,
-                published_at=ep_info.published_at,
-                status=EpisodeStatus.NEW,
+            rows.append(
+                {
+                    "episode_id": ep_info.episode_id,
+                    "channel_id": resolved_channel_id,
+                    "source": ep_info.source,
+                    "title": ep_info.title,
+                    "url": ep_info.url,
+                    "published_at": ep_info.published_at,
+                    "status": EpisodeStatus.NEW,
+                }
             )
-            session.add(episode)
         inserted += 1
 
     if not dry_run:
+        # Rows another run inserted since the lookup are skipped, not counted
+        inserted = _insert_new_episodes(session, rows)
         session.commit()
 
     result.new = inserted
-    result.total = session.query(Episode).count()
+    result.total = _episode_count(session)
     return result
 
 
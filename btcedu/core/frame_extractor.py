@@ -125,8 +125,7 @@ def _is_extraction_current(
 
 
 def _load_chapters(chapters_path: Path) -> ChapterDocument:
-    raw = json.loads(chapters_path.read_text(encoding="utf-8"))
-    return ChapterDocument(**raw)
+    return ChapterDocument.model_validate_json(chapters_path.read_bytes())
 
 
 def _build_chapter_timeline(
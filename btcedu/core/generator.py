@@ -249,7 +249,8 @@ def generate_content(
         status=RunStatus.RUNNING,
     )
     session.add(pipeline_run)
-    session.flush()
+    # Commit so the SQLite write lock is released before generating.
+    session.commit()
 
     result = GenerationResult(episode_id=episode_id, output_dir=str(output_dir))
 
@@ -439,7 +440,8 @@ def refine_content(
         status=RunStatus.RUNNING,
     )
     session.add(pipeline_run)
-    session.flush()
+    # Commit so the SQLite write lock is released before refining.
+    session.commit()
 
     result = GenerationResult(episode_id=episode_id, output_dir=str(output_dir))
 
@@ -627,7 +629,9 @@ def _generate_artifact(
         retrieval_snapshot_path=snapshot_path,
     )
     session.add(artifact)
-    session.flush()
+    # Commit per artifact so the next artifact's LLM call does not run
+    # inside a write transaction.
+    session.commit()
 
     return {
         "text": response.text,
@@ -4,14 +4,16 @@ import json
 import logging
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from btcedu.config import Settings
 from btcedu.models.episode import Episode, EpisodeStatus
+from btcedu.utils import jsonio
 
 # Lazy import to avoid circular imports at module level:
 # from btcedu.core.reviewer import has_pending_review
@@ -76,6 +78,28 @@ _V2_STAGES = [
 # Keep _STAGES as alias for backward compat
 _STAGES = _V1_STAGES
 
+# Statuses a v1 episode can be resumed from (used by ``btcedu run``)
+V1_PENDING_STATUSES = (
+    EpisodeStatus.NEW,
+    EpisodeStatus.DOWNLOADED,
+    EpisodeStatus.TRANSCRIBED,
+    EpisodeStatus.CHUNKED,
+    EpisodeStatus.GENERATED,
+)
+
+# Statuses picked up by run_pending / run_latest (v1 + v2 pipelines)
+PENDING_STATUSES = V1_PENDING_STATUSES + (
+    EpisodeStatus.CORRECTED,
+    EpisodeStatus.SEGMENTED,  # news profiles
+    EpisodeStatus.TRANSLATED,
+    EpisodeStatus.ADAPTED,
+    EpisodeStatus.CHAPTERIZED,
+    EpisodeStatus.IMAGES_GENERATED,
+    EpisodeStatus.TTS_DONE,  # Sprint 9: render stage
+    EpisodeStatus.RENDERED,  # Sprint 10: review gate 3
+    EpisodeStatus.APPROVED,  # Sprint 11: publish stage
+)
+
 
 def _get_stages(
     settings: Settings,
@@ -974,6 +998,7 @@ def run_pending(
     max_episodes: int | None = None,
     since: datetime | None = None,
     profile: str | None = None,
+    workers: int = 1,
 ) -> list[PipelineReport]:
     """Process all pending episodes through the pipeline.
 
@@ -987,33 +1012,15 @@ def run_pending(
         max_episodes: Limit number of episodes to process.
         since: Only process episodes published after this date.
         profile: If given, only process episodes with this content_profile.
+        workers: Number of episodes to process concurrently. Each worker
+            thread uses its own session bound to the same engine.
 
     Returns:
-        List of PipelineReports.
+        List of PipelineReports, in the same order as the episodes were queued.
     """
     query = (
         session.query(Episode)
-        .filter(
-            Episode.status.in_(
-                [
-                    EpisodeStatus.NEW,
-                    EpisodeStatus.DOWNLOADED,
-                    EpisodeStatus.TRANSCRIBED,
-                    EpisodeStatus.CHUNKED,
-                    EpisodeStatus.GENERATED,
-                    # v2 pipeline statuses
-                    EpisodeStatus.CORRECTED,
-                    EpisodeStatus.SEGMENTED,  # news profiles
-                    EpisodeStatus.TRANSLATED,
-                    EpisodeStatus.ADAPTED,
-                    EpisodeStatus.CHAPTERIZED,
-                    EpisodeStatus.IMAGES_GENERATED,
-                    EpisodeStatus.TTS_DONE,  # Sprint 9: render stage
-                    EpisodeStatus.RENDERED,  # Sprint 10: review gate 3
-                    EpisodeStatus.APPROVED,  # Sprint 11: publish stage
-                ]
-            )
-        )
+        .filter(Episode.status.in_(PENDING_STATUSES))
         .order_by(Episode.published_at.asc())
     )
 
@@ -1040,6 +1047,9 @@ def run_pending(
 
     logger.info("Processing %d pending episode(s)...", len(episodes))
 
+    if workers > 1 and len(episodes) > 1:
+        return _run_episodes_concurrently(session, episodes, settings, workers)
+
     reports = []
     for ep in episodes:
         report = run_episode_pipeline(session, ep, settings)
@@ -1048,6 +1058,30 @@ def run_pending(
     return reports
 
 
+def _run_episodes_concurrently(
+    session: Session,
+    episodes: list[Episode],
+    settings: Settings,
+    workers: int,
+) -> list[PipelineReport]:
+    """Run episodes on a thread pool, one session per episode.
+
+    Sessions are not thread-safe, so each task re-loads its episode in a
+    fresh session bound to the caller's engine. Stage idempotency checks
+    still apply, so a crashed run resumes from the last completed stage.
+    """
+    worker_session_factory = sessionmaker(bind=session.get_bind())
+    episode_pks = [ep.id for ep in episodes]
+
+    def _process_one(episode_pk: int) -> PipelineReport:
+        with worker_session_factory() as worker_session:
+            episode = worker_session.get(Episode, episode_pk)
+            return run_episode_pipeline(worker_session, episode, settings)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_process_one, episode_pks))
+
+
 def run_latest(
     session: Session,
     settings: Settings,
@@ -1077,27 +1111,7 @@ def run_latest(
     # Find newest pending episode
     candidates_query = (
         session.query(Episode)
-        .filter(
-            Episode.status.in_(
-                [
-                    EpisodeStatus.NEW,
-                    EpisodeStatus.DOWNLOADED,
-                    EpisodeStatus.TRANSCRIBED,
-                    EpisodeStatus.CHUNKED,
-                    EpisodeStatus.GENERATED,
-                    # v2 pipeline statuses
-                    EpisodeStatus.CORRECTED,
-                    EpisodeStatus.SEGMENTED,  # news profiles
-                    EpisodeStatus.TRANSLATED,
-                    EpisodeStatus.ADAPTED,
-                    EpisodeStatus.CHAPTERIZED,
-                    EpisodeStatus.IMAGES_GENERATED,
-                    EpisodeStatus.TTS_DONE,  # Sprint 9
-                    EpisodeStatus.RENDERED,  # Sprint 10
-                    EpisodeStatus.APPROVED,  # Sprint 11: publish
-                ]
-            )
-        )
+        .filter(Episode.status.in_(PENDING_STATUSES))
         .order_by(Episode.published_at.desc())
     )
 
@@ -1176,7 +1190,27 @@ def write_report(report: PipelineReport, reports_dir: str) -> str:
     """
     report_dir = Path(reports_dir) / report.episode_id
     report_dir.mkdir(parents=True, exist_ok=True)
+    return _write_report_file(report, report_dir)
 
+
+def write_reports(reports: list[PipelineReport], reports_dir: str) -> list[str]:
+    """Write several PipelineReports, creating each episode directory only once.
+
+    Returns:
+        Paths to the written report files, in the order of *reports*.
+    """
+    created: set[Path] = set()
+    paths = []
+    for report in reports:
+        report_dir = Path(reports_dir) / report.episode_id
+        if report_dir not in created:
+            report_dir.mkdir(parents=True, exist_ok=True)
+            created.add(report_dir)
+        paths.append(_write_report_file(report, report_dir))
+    return paths
+
+
+def _write_report_file(report: PipelineReport, report_dir: Path) -> str:
     timestamp = report.started_at.strftime("%Y%m%d_%H%M%S")
     path = report_dir / f"report_{timestamp}.json"
 
@@ -1200,7 +1234,7 @@ def write_report(report: PipelineReport, reports_dir: str) -> str:
         ],
     }
 
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_bytes(jsonio.dumps(data, indent=True))
     logger.info("Report written: %s", path)
 
     return str(path)
@@ -3,9 +3,11 @@
 import hashlib
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from btcedu.models.prompt_version import PromptVersion
@@ -15,6 +17,16 @@ logger = logging.getLogger(__name__)
 # Default templates directory (relative to project root)
 TEMPLATES_DIR = Path(__file__).parent.parent / "prompts" / "templates"
 
+# Parsed templates per path, reused while the file's mtime and size are
+# unchanged: (mtime_ns, size, metadata, body)
+_TEMPLATE_CACHE: dict[Path, tuple[int, int, dict, str]] = {}
+
+
+@lru_cache(maxsize=128)
+def _content_hash(content: str) -> str:
+    body = PromptRegistry._strip_frontmatter(content)
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
 
 class PromptRegistry:
     """Manages prompt template versions with content hashing.
@@ -65,11 +77,7 @@ class PromptRegistry:
         content_hash = self.compute_hash(body)
 
         # Check if this exact content already exists for this name
-        existing = (
-            self._session.query(PromptVersion)
-            .filter(PromptVersion.name == name, PromptVersion.content_hash == content_hash)
-            .first()
-        )
+        existing = self._find_version(name, content_hash)
         if existing:
             logger.info(
                 "Prompt %s already registered with hash %s (version %d)",
@@ -100,7 +108,17 @@ class PromptRegistry:
             notes=notes,
         )
         self._session.add(pv)
-        self._session.commit()
+        try:
+            self._session.commit()
+        except IntegrityError:
+            # A concurrent worker registered the same template first
+            self._session.rollback()
+            existing = self._find_version(name, content_hash)
+            if existing is None:
+                raise
+            if set_default and not existing.is_default:
+                self.promote_to_default(existing.id)
+            return existing
 
         logger.info(
             "Registered prompt %s version %d (hash=%s)", name, version_num, content_hash[:12]
@@ -111,6 +129,13 @@ class PromptRegistry:
 
         return pv
 
+    def _find_version(self, name: str, content_hash: str) -> PromptVersion | None:
+        return (
+            self._session.query(PromptVersion)
+            .filter(PromptVersion.name == name, PromptVersion.content_hash == content_hash)
+            .first()
+        )
+
     def promote_to_default(self, version_id: int) -> None:
         """Promote a specific PromptVersion to be the default for its name.
 
@@ -150,8 +175,7 @@ class PromptRegistry:
         Strips YAML frontmatter (delimited by ---) before hashing so that
         metadata changes don't invalidate the content hash.
         """
-        body = self._strip_frontmatter(content)
-        return hashlib.sha256(body.encode("utf-8")).hexdigest()
+        return _content_hash(content)
 
     def resolve_template_path(self, name: str, profile: str | None = None) -> Path:
         """Resolve template path with profile-namespaced fallback.
@@ -172,7 +196,8 @@ class PromptRegistry:
 
         Returns (metadata_dict, body_content). The metadata dict contains
         fields from the YAML frontmatter (name, model, temperature, etc.).
-        The body is the template content after the frontmatter.
+        The body is the template content after the frontmatter. Parsed
+        templates are cached until the file's mtime or size changes.
 
         If *profile* is given and *template_path* is a relative name,
         tries ``templates_dir / profile / name`` first then falls back.
@@ -180,6 +205,11 @@ class PromptRegistry:
         template_path = Path(template_path)
         if not template_path.is_absolute():
             template_path = self.resolve_template_path(str(template_path), profile)
+        stat = template_path.stat()
+        cached = _TEMPLATE_CACHE.get(template_path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return dict(cached[2]), cached[3]
+
         content = template_path.read_text(encoding="utf-8")
 
         metadata = {}
@@ -192,7 +222,8 @@ class PromptRegistry:
             metadata = yaml.safe_load(frontmatter_text) or {}
             body = content[match.end() :]
 
-        return metadata, body
+        _TEMPLATE_CACHE[template_path] = (stat.st_mtime_ns, stat.st_size, metadata, body)
+        return dict(metadata), body
 
     def _next_version(self, name: str) -> int:
         """Get the next version number for a prompt name."""
@@ -6,6 +6,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -15,6 +16,9 @@ from btcedu.models.episode import Episode, EpisodeStatus, PipelineRun, RunStatus
 from btcedu.models.publish_job import PublishJob, PublishJobStatus
 from btcedu.models.review import ReviewStatus, ReviewTask
 
+if TYPE_CHECKING:
+    from btcedu.services.youtube_service import YouTubeService
+
 logger = logging.getLogger(__name__)
 
 
@@ -374,12 +378,34 @@ def _build_youtube_metadata(
 # ---------------------------------------------------------------------------
 
 
+def build_youtube_service(settings: Settings) -> "YouTubeService":
+    """Return the upload service for *settings* (dry-run or YouTube Data API).
+
+    Build it once and pass it to :func:`publish_video` when publishing several
+    episodes so the OAuth2 credentials are loaded a single time.
+    """
+    from btcedu.services.youtube_service import DryRunYouTubeService, YouTubeDataAPIService
+
+    if getattr(settings, "dry_run", False):
+        return DryRunYouTubeService()
+    credentials_path = getattr(
+        settings,
+        "youtube_credentials_path",
+        "data/.youtube_credentials.json",
+    )
+    return YouTubeDataAPIService(
+        credentials_path=credentials_path,
+        chunk_size_bytes=getattr(settings, "youtube_upload_chunk_size_mb", 10) * 1024 * 1024,
+    )
+
+
 def publish_video(
     session: Session,
     episode_id: str,
     settings: Settings,
     force: bool = False,
     privacy: str | None = None,
+    youtube_service: "YouTubeService | None" = None,
 ) -> PublishResult:
     """Publish approved video to YouTube.
 
@@ -400,6 +426,8 @@ def publish_video(
         force: Skip idempotency check (re-publishes).
         privacy: Override privacy setting ("unlisted", "private", "public").
             Defaults to settings.youtube_default_privacy.
+        youtube_service: Upload service to use; defaults to
+            ``build_youtube_service(settings)``.
 
     Returns:
         PublishResult with video_id, url, and safety check results.
@@ -499,11 +527,7 @@ def publish_video(
     draft_path = Path(settings.outputs_dir) / episode_id / "render" / "draft.mp4"
 
     # Build upload request
-    from btcedu.services.youtube_service import (
-        DryRunYouTubeService,
-        YouTubeDataAPIService,
-        YouTubeUploadRequest,
-    )
+    from btcedu.services.youtube_service import YouTubeUploadRequest
 
     upload_req = YouTubeUploadRequest(
         video_path=draft_path,
@@ -522,19 +546,7 @@ def publish_video(
     )
 
     is_dry_run = getattr(settings, "dry_run", False)
-
-    if is_dry_run:
-        youtube_svc = DryRunYouTubeService()
-    else:
-        credentials_path = getattr(
-            settings,
-            "youtube_credentials_path",
-            "data/.youtube_credentials.json",
-        )
-        youtube_svc = YouTubeDataAPIService(
-            credentials_path=credentials_path,
-            chunk_size_bytes=getattr(settings, "youtube_upload_chunk_size_mb", 10) * 1024 * 1024,
-        )
+    youtube_svc = youtube_service or build_youtube_service(settings)
 
     # Update PublishJob to uploading
     publish_job.status = PublishJobStatus.UPLOADING.value
@@ -194,14 +194,35 @@ def _is_minor_correction(diff_path: str | None) -> bool:
     return True
 
 
-def _write_review_history(task: ReviewTask, decision: ReviewDecision) -> None:
-    """Append a review decision to the episode's review_history.json.
+def _review_history_entry(task: ReviewTask, decision: ReviewDecision) -> dict:
+    """Snapshot *task* and its flushed *decision* as a review_history.json entry.
+
+    Taken before the commit so that writing the history afterwards does not
+    reload both rows from the database (commit expires them).
+    """
+    return {
+        "review_task_id": task.id,
+        "episode_id": task.episode_id,
+        "stage": task.stage,
+        "decision": decision.decision,
+        "notes": decision.notes,
+        "quality_rating": decision.quality_rating,
+        "decided_at": decision.decided_at.isoformat() if decision.decided_at else None,
+        "artifact_hash": task.artifact_hash,
+        "task_status": task.status,
+    }
+
+
+def _write_review_history(entry: dict) -> None:
+    """Append a review decision entry to the episode's review_history.json.
 
     Creates the file if it doesn't exist. Each entry captures the decision,
     reviewer notes, and timestamps for file-level audit trail.
     """
     settings = _get_runtime_settings()
-    history_path = Path(settings.outputs_dir) / task.episode_id / "review" / "review_history.json"
+    history_path = (
+        Path(settings.outputs_dir) / entry["episode_id"] / "review" / "review_history.json"
+    )
 
     # Load existing history or start fresh
     history: list[dict] = []
@@ -211,17 +232,6 @@ def _write_review_history(task: ReviewTask, decision: ReviewDecision) -> None:
         except (json.JSONDecodeError, OSError):
             history = []
 
-    entry = {
-        "review_task_id": task.id,
-        "episode_id": task.episode_id,
-        "stage": task.stage,
-        "decision": decision.decision,
-        "notes": decision.notes,
-        "quality_rating": decision.quality_rating,
-        "decided_at": decision.decided_at.isoformat() if decision.decided_at else None,
-        "artifact_hash": task.artifact_hash,
-        "task_status": task.status,
-    }
     history.append(entry)
 
     try:
@@ -344,11 +354,13 @@ def approve_review(
         quality_rating=quality_rating,
     )
     session.add(decision)
+    session.flush()
+    entry = _review_history_entry(task, decision)
     session.commit()
 
-    _write_review_history(task, decision)
+    _write_review_history(entry)
 
-    logger.info("Approved review task %d (episode %s)", task.id, task.episode_id)
+    logger.info("Approved review task %d (episode %s)", review_task_id, entry["episode_id"])
     return decision
 
 
@@ -391,11 +403,13 @@ def reject_review(
         quality_rating=quality_rating,
     )
     session.add(decision)
+    session.flush()
+    entry = _review_history_entry(task, decision)
     session.commit()
 
-    _write_review_history(task, decision)
+    _write_review_history(entry)
 
-    logger.info("Rejected review task %d (episode %s)", task.id, task.episode_id)
+    logger.info("Rejected review task %d (episode %s)", review_task_id, entry["episode_id"])
     return decision
 
 
@@ -444,14 +458,16 @@ def request_changes(
         quality_rating=quality_rating,
     )
     session.add(decision)
+    session.flush()
+    entry = _review_history_entry(task, decision)
     session.commit()
 
-    _write_review_history(task, decision)
+    _write_review_history(entry)
 
     logger.info(
         "Requested changes on review task %d (episode %s)",
-        task.id,
-        task.episode_id,
+        review_task_id,
+        entry["episode_id"],
     )
     return decision
 
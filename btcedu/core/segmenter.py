@@ -171,7 +171,8 @@ def segment_broadcast(
         status=RunStatus.RUNNING,
     )
     session.add(pipeline_run)
-    session.flush()
+    # Commit so the SQLite write lock is released before segmenting.
+    session.commit()
 
     t0 = time.monotonic()
 
@@ -1711,9 +1711,8 @@ def _load_chapters(episode_id: str, settings: Settings) -> ChapterDocument:
         raise FileNotFoundError(f"Chapters file not found: {chapters_path}")
 
     try:
-        data = json.loads(chapters_path.read_text(encoding="utf-8"))
-        return ChapterDocument(**data)
-    except (json.JSONDecodeError, ValidationError) as e:
+        return ChapterDocument.model_validate_json(chapters_path.read_bytes())
+    except ValidationError as e:
         raise ValueError(f"Invalid chapters.json: {e}") from e
 
 
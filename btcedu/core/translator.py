@@ -202,7 +202,8 @@ def translate_transcript(
         status=RunStatus.RUNNING,
     )
     session.add(pipeline_run)
-    session.flush()
+    # Commit so the SQLite write lock is released before translating.
+    session.commit()
 
     t0 = time.monotonic()
 
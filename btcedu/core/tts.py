@@ -343,9 +343,8 @@ def generate_tts(
 def _load_chapters(chapters_path: Path) -> ChapterDocument:
     """Load and validate chapter JSON."""
     try:
-        chapters_data = json.loads(chapters_path.read_text(encoding="utf-8"))
-        return ChapterDocument(**chapters_data)
-    except (json.JSONDecodeError, ValidationError) as e:
+        return ChapterDocument.model_validate_json(chapters_path.read_bytes())
+    except ValidationError as e:
         raise ValueError(f"Invalid chapters.json at {chapters_path}: {e}") from e
 
 
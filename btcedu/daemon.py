@@ -0,0 +1,241 @@
+"""Local daemon mode: keep one warm process and forward CLI invocations to it.
+
+``btcedu daemon`` listens on a unix socket. When ``BTCEDU_DAEMON`` is set
+(to a socket path, or ``1`` for the default one) the ``btcedu`` entry point
+sends its argv to that socket instead of importing SQLAlchemy, pydantic and
+the pipeline modules itself, and replays the captured output and exit code.
+If no daemon is reachable the command simply runs in-process.
+
+Each request carries the client's environment and working directory.
+Commands run under the client's environment with settings re-read (so
+``DRY_RUN``, ``DATABASE_URL`` and ``.env`` edits apply), and their log
+output is captured along with stdout/stderr. A client in another working
+directory is told to run the command itself. Requests are served one at a
+time: the environment swap and output capture are process-wide.
+
+The client only talks to a socket owned by its own user, so another local
+user cannot stand in for the daemon.
+"""
+
+import contextlib
+import io
+import json
+import logging
+import os
+import socket
+import stat
+import struct
+import sys
+import traceback
+
+logger = logging.getLogger(__name__)
+
+ENV_VAR = "BTCEDU_DAEMON"
+
+
+def default_socket_path() -> str:
+    """Per-user socket path, so daemons of different users never collide.
+
+    Prefers ``$XDG_RUNTIME_DIR`` (private to the user); the ``/tmp``
+    fallback is guarded by the owner check in :func:`forward`.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "btcedu.sock")
+    return os.path.join("/tmp", f"btcedu-{os.getuid()}.sock")
+
+
+def socket_path_from_env() -> str | None:
+    """Resolve ``BTCEDU_DAEMON`` to a socket path (``None`` when unset)."""
+    value = os.environ.get(ENV_VAR, "").strip()
+    if not value or value.lower() in ("0", "false", "no"):
+        return None
+    if value.lower() in ("1", "true", "yes"):
+        return default_socket_path()
+    return value
+
+
+def _recv_all(conn: socket.socket) -> bytes:
+    chunks = []
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+@contextlib.contextmanager
+def _client_environment(env: dict[str, str]):
+    """Run with *env* as ``os.environ`` and freshly loaded settings."""
+    from btcedu.config import get_settings
+
+    saved = os.environ.copy()
+    os.environ.clear()
+    os.environ.update(env)
+    get_settings.cache_clear()
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+        get_settings.cache_clear()
+
+
+@contextlib.contextmanager
+def _capture_logging(stream: io.StringIO):
+    """Send root-logger output to *stream* (the CLI's own format and level)."""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+    try:
+        yield
+    finally:
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
+
+
+def run_captured(argv: list[str], env: dict[str, str] | None = None) -> dict:
+    """Run the CLI in-process for *argv*, returning exit code and captured output.
+
+    With *env*, the command sees that environment (and settings loaded from
+    it) instead of the daemon's own. Log records go to the captured stderr.
+    """
+    from btcedu.cli import cli
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    env_context = _client_environment(env) if env is not None else contextlib.nullcontext()
+    with (
+        env_context,
+        contextlib.redirect_stdout(stdout),
+        contextlib.redirect_stderr(stderr),
+        _capture_logging(stderr),
+    ):
+        try:
+            cli.main(argv, prog_name="btcedu", obj={})
+            exit_code = 0
+        except SystemExit as e:
+            code = e.code
+            if code is None:
+                exit_code = 0
+            elif isinstance(code, int):
+                exit_code = code
+            else:
+                print(code, file=sys.stderr)
+                exit_code = 1
+        except Exception:
+            # Same traceback the user would see when running in-process
+            traceback.print_exc()
+            exit_code = 1
+    return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def handle_connection(conn: socket.socket) -> None:
+    """Serve a single forwarded invocation on *conn*."""
+    try:
+        request = json.loads(_recv_all(conn))
+        env = request.get("env")
+        if request.get("cwd") != os.getcwd() or not isinstance(env, dict):
+            # Relative paths (and .env) would resolve differently, or the
+            # client's environment is unknown: let it run the command itself.
+            response = {"fallback": True}
+        else:
+            response = run_captured(
+                [str(a) for a in request["argv"]],
+                env={str(k): str(v) for k, v in env.items()},
+            )
+    except (ValueError, KeyError, TypeError) as e:
+        response = {"exit_code": 2, "stdout": "", "stderr": f"Error: bad daemon request: {e}\n"}
+    conn.sendall(json.dumps(response).encode("utf-8"))
+
+
+def serve(socket_path: str) -> None:
+    """Listen on *socket_path* and serve forwarded invocations until interrupted."""
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket is owner-only (0600)
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    logger.info("btcedu daemon listening on %s", socket_path)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    handle_connection(conn)
+                except OSError as e:
+                    logger.warning("Daemon connection error: %s", e)
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+
+
+def _owned_by_us(socket_path: str) -> bool:
+    """True if *socket_path* is a socket owned by the current user."""
+    try:
+        st = os.stat(socket_path)
+    except OSError:
+        return False
+    if not stat.S_ISSOCK(st.st_mode):
+        return False
+    if st.st_uid != os.getuid():
+        logger.warning("Ignoring btcedu daemon socket %s owned by another user", socket_path)
+        return False
+    return True
+
+
+def _peer_is_us(conn: socket.socket) -> bool:
+    """Check the listening process runs as our user (Linux ``SO_PEERCRED``).
+
+    Closes the gap between the ownership check and ``connect``; where the
+    option is unavailable the ownership check stands alone.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    if uid != os.getuid():
+        logger.warning("Ignoring btcedu daemon running as uid %d", uid)
+        return False
+    return True
+
+
+def forward(socket_path: str, argv: list[str]) -> int | None:
+    """Send *argv* to the daemon and replay its output.
+
+    Returns the command's exit code, or ``None`` when the daemon is not
+    reachable, not ours, or asks the caller to run locally.
+    """
+    if not _owned_by_us(socket_path):
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except OSError:
+            return None
+        if not _peer_is_us(client):
+            return None
+        # Once the request is sent the command may already have run, so a
+        # broken reply is reported rather than retried in-process.
+        request = {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+        try:
+            client.sendall(json.dumps(request).encode("utf-8"))
+            client.shutdown(socket.SHUT_WR)
+            response = json.loads(_recv_all(client))
+        except (OSError, ValueError) as e:
+            sys.stderr.write(f"Error: lost connection to btcedu daemon: {e}\n")
+            return 1
+
+    if response.get("fallback"):
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stdout.flush()
+    return int(response.get("exit_code", 1))
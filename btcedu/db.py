@@ -1,4 +1,6 @@
-from sqlalchemy import create_engine, text
+from functools import lru_cache
+
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from btcedu.config import get_settings
@@ -9,11 +11,28 @@ class Base(DeclarativeBase):
 
 
 def get_engine(database_url: str | None = None):
+    """Return the process-wide engine for *database_url* (default: settings).
+
+    Engines are cached per URL so repeated session factories share one
+    connection pool instead of re-creating it (and re-running PRAGMAs).
+    """
     url = database_url or get_settings().database_url
+    if ":memory:" in url:
+        # Every in-memory engine is a separate database; never share one
+        return _build_engine(url)
+    return _cached_engine(url)
+
+
+def _build_engine(url: str):
     kwargs: dict = {"echo": False}
     if url and url.startswith("sqlite"):
         kwargs["connect_args"] = {"timeout": 30}
+    else:
+        # Server databases: drop dead connections and recycle idle ones
+        kwargs.update(pool_size=5, max_overflow=10, pool_pre_ping=True, pool_recycle=1800)
     engine = create_engine(url, **kwargs)
+    if url and url.startswith("sqlite"):
+        event.listen(engine, "connect", _set_sqlite_pragmas)
     # Enable WAL mode for SQLite so readers don't block writers
     if url and url.startswith("sqlite") and ":memory:" not in url:
         with engine.connect() as conn:
@@ -22,6 +41,29 @@ def get_engine(database_url: str | None = None):
     return engine
 
 
+# Per-connection SQLite settings (journal_mode=WAL above is stored in the file).
+# synchronous=NORMAL is durable across application crashes in WAL mode and
+# only skips the fsync on each commit; the rest trade memory for fewer reads.
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _set_sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+_cached_engine = lru_cache(maxsize=8)(_build_engine)
+
+
 def get_session_factory(database_url: str | None = None) -> sessionmaker[Session]:
     engine = get_engine(database_url)
     return sessionmaker(bind=engine)
@@ -2,6 +2,7 @@
 
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from datetime import UTC, datetime
 
 from sqlalchemy import text
@@ -687,6 +688,60 @@ class AddQualityRatingMigration(Migration):
         logger.info(f"Migration {self.version} completed successfully")
 
 
+class AddEpisodeStatusIndexMigration(Migration):
+    """Migration 012: Index episodes by (status, published_at)."""
+
+    @property
+    def version(self) -> str:
+        return "012_add_episode_status_index"
+
+    @property
+    def description(self) -> str:
+        return "Add (status, published_at) index on episodes for pending-episode queries"
+
+    def up(self, session: Session) -> None:
+        logger.info(f"Running migration: {self.version}")
+
+        session.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_episodes_status_published "
+                "ON episodes(status, published_at)"
+            )
+        )
+        session.commit()
+        logger.info("Created idx_episodes_status_published index")
+
+        self.mark_applied(session)
+        logger.info(f"Migration {self.version} completed successfully")
+
+
+class AddPipelineRunEpisodeIndexMigration(Migration):
+    """Migration 013: Index pipeline_runs by episode_id."""
+
+    @property
+    def version(self) -> str:
+        return "013_add_pipeline_run_episode_index"
+
+    @property
+    def description(self) -> str:
+        return "Add episode_id index on pipeline_runs for per-episode run and cost queries"
+
+    def up(self, session: Session) -> None:
+        logger.info(f"Running migration: {self.version}")
+
+        session.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_pipeline_runs_episode_id "
+                "ON pipeline_runs(episode_id)"
+            )
+        )
+        session.commit()
+        logger.info("Created ix_pipeline_runs_episode_id index")
+
+        self.mark_applied(session)
+        logger.info(f"Migration {self.version} completed successfully")
+
+
 # Registry of all available migrations
 MIGRATIONS = [
     AddChannelsSupportMigration(),
@@ -700,19 +755,23 @@ MIGRATIONS = [
     CreateDeadLetterQueueMigration(),
     AddQualityRatingMigration(),
     AddChannelContentProfileMigration(),
+    AddEpisodeStatusIndexMigration(),
+    AddPipelineRunEpisodeIndexMigration(),
 ]
 
 
-def get_pending_migrations(session: Session) -> list[Migration]:
-    """Get list of migrations that haven't been applied yet."""
-    # Ensure schema_migrations table exists
-    _ensure_migrations_table(session)
+def get_pending_migrations(
+    session: Session, applied: Iterable[str] | None = None
+) -> list[Migration]:
+    """Get list of migrations that haven't been applied yet.
 
-    pending = []
-    for migration in MIGRATIONS:
-        if not migration.is_applied(session):
-            pending.append(migration)
-    return pending
+    Pass ``applied`` (e.g. from get_applied_migrations) to reuse versions the
+    caller has already read; otherwise they are loaded in one query.
+    """
+    if applied is None:
+        applied = get_applied_migrations(session)
+    applied_versions = set(applied)
+    return [m for m in MIGRATIONS if m.version not in applied_versions]
 
 
 def get_applied_migrations(session: Session) -> list[str]:
@@ -720,8 +779,8 @@ def get_applied_migrations(session: Session) -> list[str]:
     # Ensure schema_migrations table exists
     _ensure_migrations_table(session)
 
-    results = session.query(SchemaMigration).order_by(SchemaMigration.applied_at).all()
-    return [m.version for m in results]
+    results = session.query(SchemaMigration.version).order_by(SchemaMigration.applied_at)
+    return [version for (version,) in results]
 
 
 def _ensure_migrations_table(session: Session) -> None:
@@ -1,7 +1,7 @@
 import enum
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from btcedu.db import Base
@@ -106,6 +106,11 @@ class Episode(Base):
         back_populates="episode", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Pending-episode queries: status IN (...) ORDER BY published_at
+        Index("idx_episodes_status_published", "status", "published_at"),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<Episode(id={self.id}, episode_id='{self.episode_id}', status='{self.status.value}')>"
@@ -116,7 +121,9 @@ class PipelineRun(Base):
     __tablename__ = "pipeline_runs"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    episode_id: Mapped[int] = mapped_column(Integer, ForeignKey("episodes.id"), nullable=False)
+    episode_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("episodes.id"), nullable=False, index=True
+    )
     stage: Mapped[PipelineStage] = mapped_column(Enum(PipelineStage), nullable=False)
     status: Mapped[RunStatus] = mapped_column(
         Enum(RunStatus), nullable=False, default=RunStatus.RUNNING
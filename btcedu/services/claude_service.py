@@ -3,6 +3,7 @@
 import hashlib
 import json
 import logging
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -12,6 +13,13 @@ logger = logging.getLogger(__name__)
 # Claude Sonnet 4 pricing (per million tokens)
 SONNET_INPUT_PRICE_PER_M = 3.0
 SONNET_OUTPUT_PRICE_PER_M = 15.0
+# Prompt caching: writes cost 1.25x the input price, reads 0.1x
+SONNET_CACHE_WRITE_PRICE_PER_M = 3.75
+SONNET_CACHE_READ_PRICE_PER_M = 0.30
+# Message Batches API requests are billed at half price
+BATCH_PRICE_FACTOR = 0.5
+# Seconds between Message Batches status checks
+BATCH_POLL_INTERVAL = 30.0
 
 # OpenAI GPT-4o pricing (per million tokens)
 GPT4O_INPUT_PRICE_PER_M = 2.50
@@ -33,15 +41,30 @@ def calculate_cost(
     input_tokens: int,
     output_tokens: int,
     provider: str = "anthropic",
+    cache_write_tokens: int = 0,
+    cache_read_tokens: int = 0,
+    batch: bool = False,
 ) -> float:
-    """Calculate estimated cost in USD for an LLM API call."""
+    """Calculate estimated cost in USD for an LLM API call.
+
+    ``input_tokens`` excludes prompt-cache tokens, which Anthropic bills
+    separately as ``cache_write_tokens`` / ``cache_read_tokens``. ``batch``
+    applies the Message Batches discount.
+    """
     if provider == "openai":
         input_cost = (input_tokens / 1_000_000) * GPT4O_INPUT_PRICE_PER_M
         output_cost = (output_tokens / 1_000_000) * GPT4O_OUTPUT_PRICE_PER_M
     else:
-        input_cost = (input_tokens / 1_000_000) * SONNET_INPUT_PRICE_PER_M
+        input_cost = (
+            input_tokens * SONNET_INPUT_PRICE_PER_M
+            + cache_write_tokens * SONNET_CACHE_WRITE_PRICE_PER_M
+            + cache_read_tokens * SONNET_CACHE_READ_PRICE_PER_M
+        ) / 1_000_000
         output_cost = (output_tokens / 1_000_000) * SONNET_OUTPUT_PRICE_PER_M
-    return round(input_cost + output_cost, 6)
+    cost = input_cost + output_cost
+    if batch:
+        cost *= BATCH_PRICE_FACTOR
+    return round(cost, 6)
 
 
 def compute_prompt_hash(
@@ -79,6 +102,7 @@ def call_claude(
     dry_run_path: Path | None = None,
     max_tokens: int | None = None,
     json_mode: bool = False,
+    cache_system_prompt: bool = False,
 ) -> ClaudeResponse:
     """Call LLM API (Anthropic or OpenAI fallback).
 
@@ -93,6 +117,8 @@ def call_claude(
         dry_run_path: If settings.dry_run, write payload here instead of calling API.
         max_tokens: Override settings.claude_max_tokens for this call.
         json_mode: If True, request JSON output from the API (OpenAI response_format).
+        cache_system_prompt: Mark the system prompt for Anthropic prompt caching.
+            Worth it when several calls in a row share the same system prompt.
 
     Returns:
         ClaudeResponse with text, token counts, and cost.
@@ -110,7 +136,13 @@ def call_claude(
             max_tokens=max_tokens,
             json_mode=json_mode,
         )
-    return _call_anthropic(system_prompt, user_message, settings, max_tokens=max_tokens)
+    return _call_anthropic(
+        system_prompt,
+        user_message,
+        settings,
+        max_tokens=max_tokens,
+        cache_system_prompt=cache_system_prompt,
+    )
 
 
 def _call_anthropic(
@@ -118,36 +150,67 @@ def _call_anthropic(
     user_message: str,
     settings,
     max_tokens: int | None = None,
+    cache_system_prompt: bool = False,
 ) -> ClaudeResponse:
     """Call Anthropic Claude Messages API."""
     from anthropic import Anthropic
 
-    effective_max_tokens = max_tokens or settings.claude_max_tokens
-
     client = Anthropic(
         api_key=settings.anthropic_api_key,
         max_retries=settings.max_retries,
     )
 
     response = client.messages.create(
-        model=settings.claude_model,
-        max_tokens=effective_max_tokens,
-        temperature=settings.claude_temperature,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}],
+        **_anthropic_params(system_prompt, user_message, settings, max_tokens, cache_system_prompt)
     )
+    return _parse_anthropic_message(response, settings)
+
 
+def _anthropic_params(
+    system_prompt: str,
+    user_message: str,
+    settings,
+    max_tokens: int | None,
+    cache_system_prompt: bool,
+) -> dict:
+    """Messages API parameters, shared by single calls and batch requests."""
+    return {
+        "model": settings.claude_model,
+        "max_tokens": max_tokens or settings.claude_max_tokens,
+        "temperature": settings.claude_temperature,
+        "system": (
+            [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+            if cache_system_prompt
+            else system_prompt
+        ),
+        "messages": [{"role": "user", "content": user_message}],
+    }
+
+
+def _parse_anthropic_message(message, settings, batch: bool = False) -> ClaudeResponse:
+    """Turn an Anthropic Message into a ClaudeResponse with token counts and cost."""
     text = ""
-    for block in response.content:
+    for block in message.content:
         if block.type == "text":
             text += block.text
 
-    input_tokens = response.usage.input_tokens
-    output_tokens = response.usage.output_tokens
-    cost = calculate_cost(input_tokens, output_tokens, provider="anthropic")
+    cache_write_tokens = getattr(message.usage, "cache_creation_input_tokens", None) or 0
+    cache_read_tokens = getattr(message.usage, "cache_read_input_tokens", None) or 0
+    output_tokens = message.usage.output_tokens
+    cost = calculate_cost(
+        message.usage.input_tokens,
+        output_tokens,
+        provider="anthropic",
+        cache_write_tokens=cache_write_tokens,
+        cache_read_tokens=cache_read_tokens,
+        batch=batch,
+    )
+    # Report the full prompt size; caching only changes what it costs
+    input_tokens = message.usage.input_tokens + cache_write_tokens + cache_read_tokens
 
     logger.info(
-        "Anthropic call: %d in / %d out tokens, $%.4f (%s)",
+        "Anthropic %s: %d in / %d out tokens, $%.4f (%s)",
+        "batch result" if batch else "call",
         input_tokens,
         output_tokens,
         cost,
@@ -163,6 +226,91 @@ def _call_anthropic(
     )
 
 
+def call_claude_batch(
+    requests: list[tuple[str, str]],
+    settings,
+    dry_run_paths: list[Path | None] | None = None,
+    max_tokens: int | None = None,
+    cache_system_prompt: bool = False,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+) -> list[ClaudeResponse | Exception]:
+    """Run several ``(system_prompt, user_message)`` calls as one Message Batch.
+
+    Batches are billed at half price but complete asynchronously, so this
+    blocks, polling every *poll_interval* seconds, until the batch has
+    ended. Results are returned in request order: a ClaudeResponse, or a
+    ``RuntimeError`` for a request that errored, expired or was canceled,
+    so one failed request does not discard the others (already billed).
+    Submitting or polling the batch itself still raises.
+
+    In dry-run mode, or when the OpenAI fallback is active, each request
+    simply goes through :func:`call_claude` (with the matching entry of
+    *dry_run_paths*), its exception taking the place of a failed result.
+    """
+    if not requests:
+        return []
+
+    if settings.dry_run or _resolve_provider(settings) == "openai":
+        paths = dry_run_paths or [None] * len(requests)
+        results: list[ClaudeResponse | Exception] = []
+        for (system_prompt, user_message), path in zip(requests, paths, strict=True):
+            try:
+                results.append(
+                    call_claude(
+                        system_prompt,
+                        user_message,
+                        settings,
+                        dry_run_path=path,
+                        max_tokens=max_tokens,
+                        cache_system_prompt=cache_system_prompt,
+                    )
+                )
+            except Exception as e:
+                results.append(e)
+        return results
+
+    from anthropic import Anthropic
+
+    client = Anthropic(
+        api_key=settings.anthropic_api_key,
+        max_retries=settings.max_retries,
+    )
+
+    batch = client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": f"req-{i}",
+                "params": _anthropic_params(
+                    system_prompt, user_message, settings, max_tokens, cache_system_prompt
+                ),
+            }
+            for i, (system_prompt, user_message) in enumerate(requests)
+        ]
+    )
+    logger.info("Submitted message batch %s (%d requests)", batch.id, len(requests))
+
+    while batch.processing_status != "ended":
+        time.sleep(poll_interval)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    responses: list[ClaudeResponse | Exception] = [
+        RuntimeError(f"Message batch {batch.id} returned no result for request {i}")
+        for i in range(len(requests))
+    ]
+    for entry in client.messages.batches.results(batch.id):
+        index = int(entry.custom_id.removeprefix("req-"))
+        if entry.result.type != "succeeded":
+            error = getattr(entry.result, "error", None)
+            logger.warning("Message batch %s request %d %s", batch.id, index, entry.result.type)
+            responses[index] = RuntimeError(
+                f"Message batch {batch.id} request {index} {entry.result.type}"
+                + (f": {error}" if error else "")
+            )
+            continue
+        responses[index] = _parse_anthropic_message(entry.result.message, settings, batch=True)
+    return responses
+
+
 def _call_openai(
     system_prompt: str,
     user_message: str,
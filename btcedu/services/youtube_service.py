@@ -1,6 +1,7 @@
 """YouTube Data API v3 service: OAuth2, resumable upload, metadata."""
 
 import logging
+import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -128,16 +129,27 @@ class YouTubeDataAPIService:
         self._chunk_size = chunk_size_bytes
         self._max_retries = max_retries
         self._credentials = _credentials  # Optional injected credentials
+        # Credentials loaded from file are reused across uploads (and the
+        # threads of a concurrent publish) until they stop being valid.
+        self._cached_credentials = None
+        self._credentials_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # OAuth2 helpers
     # ------------------------------------------------------------------
 
     def _load_credentials(self):
-        """Load and refresh OAuth2 credentials from file."""
+        """Return valid OAuth2 credentials, reading the file only when needed."""
         if self._credentials is not None:
             return self._credentials  # Injected (test mode)
 
+        with self._credentials_lock:
+            if self._cached_credentials is None or not self._cached_credentials.valid:
+                self._cached_credentials = self._read_credentials()
+            return self._cached_credentials
+
+    def _read_credentials(self):
+        """Load and refresh OAuth2 credentials from file."""
         try:
             from google.auth.transport.requests import Request
             from google.oauth2.credentials import Credentials
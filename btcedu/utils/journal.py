@@ -1,5 +1,6 @@
 """Project journal: append-only progress log with secret redaction."""
 
+import os
 import re
 from datetime import UTC, datetime
 from pathlib import Path
@@ -72,3 +73,27 @@ def journal_event(event_type: str, data: dict, journal_path: Path | None = None)
         lines.append(f"- **{key}**: {value}")
     body = "\n".join(lines)
     return journal_append(event_type, body, journal_path=journal_path)
+
+
+def tail_lines(path: Path, n: int, block_size: int = 64 * 1024) -> tuple[bool, list[str]]:
+    """Return ``(truncated, last_lines)`` for the last *n* lines of *path*.
+
+    The file is read backwards in blocks until enough newlines are found, so
+    only the tail is read and decoded. *truncated* says whether any lines
+    precede the tail; they are not counted, as that would mean reading the
+    whole file.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = bytearray()
+        while pos > 0 and buf.count(b"\n") <= n:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            buf[:0] = f.read(step)
+
+    # When pos > 0 the first decoded line is the tail end of a line that
+    # starts in the unread prefix; it is never part of last_lines.
+    lines = bytes(buf).decode("utf-8", errors="replace").splitlines()
+    tail = lines[-n:] if n > 0 else []
+    return pos > 0 or len(lines) > len(tail), tail
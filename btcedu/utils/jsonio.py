@@ -0,0 +1,30 @@
+"""JSON (de)serialisation that uses orjson when it is installed.
+
+orjson is an optional speed-up (``pip install bitcoin-education[speedups]``);
+without it the stdlib :mod:`json` module produces equivalent output.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra is absent
+    orjson = None
+
+
+def loads(data: bytes | str):
+    """Parse JSON from *data* (bytes are parsed without an extra decode)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialise *obj* to UTF-8 encoded JSON bytes.
+
+    Non-ASCII characters are written as-is; ``indent=True`` pretty-prints
+    with two spaces, matching ``json.dumps(..., indent=2)``.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
@@ -332,18 +332,15 @@ class JobManager:
 
         self._update(job, stage="generating")
         self._log(job, "Generating content...")
-        original_dry_run = settings.dry_run
-        settings.dry_run = job.dry_run
-        try:
-            result = generate_content(
-                session,
-                job.episode_id,
-                settings,
-                force=job.force,
-                top_k=job.top_k,
-            )
-        finally:
-            settings.dry_run = original_dry_run
+        # Settings are shared process-wide; override dry_run on a copy
+        settings = settings.model_copy(update={"dry_run": job.dry_run})
+        result = generate_content(
+            session,
+            job.episode_id,
+            settings,
+            force=job.force,
+            top_k=job.top_k,
+        )
         self._update(
             job,
             result={
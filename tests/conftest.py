@@ -11,6 +11,18 @@ FIXTURES = Path(__file__).parent / "fixtures"
 SAMPLE_TRANSCRIPT = (FIXTURES / "sample_transcript_de.txt").read_text()
 
 
+@pytest.fixture(autouse=True)
+def _no_background_migration_check(request, monkeypatch):
+    """Keep the CLI's migration-check thread off the shared test session.
+
+    CLI tests hand the command a factory returning ``db_session``, which a
+    background thread must not touch. Tests marked ``migration_check``
+    exercise the real scheduling.
+    """
+    if request.node.get_closest_marker("migration_check") is None:
+        monkeypatch.setattr("btcedu.cli._schedule_migration_check", lambda database_url: None)
+
+
 @pytest.fixture
 def db_engine():
     """In-memory SQLite engine for tests with FTS5."""
@@ -1,6 +1,9 @@
 """Tests for the adaptation module (Sprint 5)."""
 
+import hashlib
 import json
+import os
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -8,12 +11,20 @@ import pytest
 
 from btcedu.core.adapter import (
     _classify_adaptation,
+    _combined_hash,
+    _file_hash,
+    _fill_placeholders,
+    _hash_file,
     _is_adaptation_current,
     _segment_text,
     _split_prompt,
+    _write_json,
+    _write_segments,
     adapt_script,
+    adapt_scripts_batch,
     compute_adaptation_diff,
 )
+from btcedu.models.content_artifact import ContentArtifact
 from btcedu.models.episode import Episode, EpisodeStatus, PipelineRun, PipelineStage, RunStatus
 from btcedu.models.review import ReviewStatus, ReviewTask
 
@@ -201,6 +212,52 @@ def test_classify_adaptation_regulatory():
     assert _classify_adaptation("Türkiye'de düzenleme farklıdır") == "regulatory_context"
 
 
+def test_classify_adaptation_precedence_not_position():
+    """Earlier categories win even when a later keyword appears first."""
+    assert _classify_adaptation("BaFin bilgisi kaldırıldı") == "legal_removal"
+    assert _classify_adaptation("30 EUR, kültürel uyarlama") == "cultural_reference"
+    assert _classify_adaptation("genel açıklama") == "other"
+
+
+def _classify_adaptation_chain(content: str) -> str:
+    """The original if/elif classifier, kept as the reference behaviour."""
+    content_lower = content.lower()
+    if "kaldırıldı" in content_lower or "[removed" in content_lower:
+        return "legal_removal"
+    elif "ton düzeltmesi" in content_lower or "tone" in content_lower:
+        return "tone_adjustment"
+    elif "kültürel" in content_lower or "cultural" in content_lower:
+        return "cultural_reference"
+    elif any(
+        inst in content_lower
+        for inst in ["bafin", "sparkasse", "bundesbank", "spk", "merkez bankası"]
+    ):
+        return "institution_replacement"
+    elif any(curr in content_lower for curr in ["eur", "usd", "tl", "€", "$", "₺"]):
+        return "currency_conversion"
+    elif "düzenleme" in content_lower or "mevzuat" in content_lower or "regulat" in content_lower:
+        return "regulatory_context"
+    else:
+        return "other"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[T1: mevzuatla uyumlu hale getirildi]",
+        "Türkiye mevzuatına göre düzenlendi",
+        "kültürel bağlamda regulation",
+        "Bundesbank → Merkez Bankası, 10 EUR",
+        "[removed: tone of the original]",
+        "spktl",
+        "genel açıklama",
+    ],
+)
+def test_classify_adaptation_matches_reference_chain(content):
+    """Overlapping keywords resolve exactly as the if/elif chain did."""
+    assert _classify_adaptation(content) == _classify_adaptation_chain(content)
+
+
 def test_compute_adaptation_diff():
     """Test computing adaptation diff from tagged text."""
     translation = "BaFin yeni düzenlemeler yayınladı. Bir Bitcoin 30.000 Euro değerinde."
@@ -241,12 +298,39 @@ def test_compute_adaptation_diff_mixed_tiers():
     assert diff["summary"]["tier2_count"] == 1
 
 
+def test_fill_placeholders_single_pass():
+    """Substituted values are not rescanned; unknown placeholders survive."""
+    template = "TR: {{ translation }}\nDE: {{ original_german }}\n{{ other }} costs $5 {x}"
+
+    filled = _fill_placeholders(
+        template, translation="literal {{ original_german }}", original_german="Hallo"
+    )
+
+    assert filled == "TR: literal {{ original_german }}\nDE: Hallo\n{{ other }} costs $5 {x}"
+
+
+def test_compute_adaptation_diff_context_width():
+    """Context spans context_chars on each side; 0 leaves it empty."""
+    adapted = "0123456789`[T1: 30 USD]`abcdefghij"
+    tag_start = adapted.index("[T1")
+    tag_end = adapted.index("]") + 1
+
+    narrow = compute_adaptation_diff("", adapted, "ep_test", context_chars=3)
+    assert narrow["adaptations"][0]["context"] == adapted[tag_start - 3 : tag_end + 3]
+
+    wide = compute_adaptation_diff("", adapted, "ep_test")
+    assert wide["adaptations"][0]["context"] == adapted
+
+    none = compute_adaptation_diff("", adapted, "ep_test", context_chars=0)
+    assert none["adaptations"][0]["context"] == ""
+
+
 def test_is_adaptation_current_missing_file(tmp_path):
     """Test idempotency check when adapted file doesn't exist."""
     adapted_path = tmp_path / "adapted.md"
     provenance_path = tmp_path / "provenance.json"
 
-    result = _is_adaptation_current(
+    result, _ = _is_adaptation_current(
         adapted_path,
         provenance_path,
         "translation_hash",
@@ -268,7 +352,7 @@ def test_is_adaptation_current_stale_marker(tmp_path):
     provenance_path = tmp_path / "provenance.json"
     provenance_path.write_text("{}", encoding="utf-8")
 
-    result = _is_adaptation_current(
+    result, _ = _is_adaptation_current(
         adapted_path,
         provenance_path,
         "translation_hash",
@@ -295,7 +379,7 @@ def test_is_adaptation_current_hash_mismatch(tmp_path):
     }
     provenance_path.write_text(json.dumps(provenance_data), encoding="utf-8")
 
-    result = _is_adaptation_current(
+    result, _ = _is_adaptation_current(
         adapted_path,
         provenance_path,
         "new_translation",
@@ -321,7 +405,7 @@ def test_is_adaptation_current_all_match(tmp_path):
     }
     provenance_path.write_text(json.dumps(provenance_data), encoding="utf-8")
 
-    result = _is_adaptation_current(
+    result, provenance = _is_adaptation_current(
         adapted_path,
         provenance_path,
         "trans123",
@@ -330,6 +414,25 @@ def test_is_adaptation_current_all_match(tmp_path):
     )
 
     assert result is True
+    assert provenance == provenance_data
+
+
+def test_is_adaptation_current_ok_marker(tmp_path):
+    """A matching .ok marker skips parsing the provenance JSON."""
+    adapted_path = tmp_path / "adapted.md"
+    adapted_path.write_text("adapted content", encoding="utf-8")
+    provenance_path = tmp_path / "provenance.json"
+    provenance_path.write_text("not json", encoding="utf-8")
+    ok_marker = tmp_path / "adapted.md.ok"
+    ok_marker.write_text(_combined_hash("trans123", "german123", "prompt123"), encoding="utf-8")
+
+    assert _is_adaptation_current(
+        adapted_path, provenance_path, "trans123", "german123", "prompt123"
+    ) == (True, None)
+    # A different input falls back to the (here corrupt) provenance
+    assert _is_adaptation_current(
+        adapted_path, provenance_path, "trans456", "german123", "prompt123"
+    ) == (False, None)
 
 
 # ---------------------------------------------------------------------------
@@ -382,6 +485,226 @@ def test_adapt_script_success(
     assert "german" in provenance["input_content_hashes"]
 
 
+@patch("btcedu.core.batching.call_claude_batch")
+def test_adapt_scripts_batch(
+    mock_batch,
+    translated_episode,
+    mock_settings,
+    db_session,
+    mock_claude_adapt_response,
+):
+    """Episodes needing adaptation go through one batch; others report per episode."""
+    mock_batch.return_value = [type("Response", (), mock_claude_adapt_response)]
+
+    results = adapt_scripts_batch(db_session, ["ep_test", "ep_missing"], mock_settings)
+
+    assert list(results) == ["ep_test", "ep_missing"]
+    assert results["ep_test"].skipped is False
+    assert results["ep_test"].tier1_count == 2
+    assert isinstance(results["ep_missing"], ValueError)
+    requests = mock_batch.call_args.args[0]
+    assert len(requests) == 1
+    assert "BaFin yeni düzenlemeler yayınladı" in requests[0][1]  # translation in user message
+    db_session.refresh(translated_episode)
+    assert translated_episode.status == EpisodeStatus.ADAPTED
+
+    # Already adapted: nothing left to submit
+    results = adapt_scripts_batch(db_session, ["ep_test"], mock_settings)
+    assert results["ep_test"].skipped is True
+    assert mock_batch.call_args.args[0] == []
+
+
+@patch("btcedu.core.batching.call_claude_batch", side_effect=RuntimeError("batch expired"))
+def test_adapt_scripts_batch_failure_marks_runs_failed(
+    mock_batch, translated_episode, mock_settings, db_session
+):
+    results = adapt_scripts_batch(db_session, ["ep_test"], mock_settings)
+
+    assert isinstance(results["ep_test"], RuntimeError)
+    run = (
+        db_session.query(PipelineRun).filter(PipelineRun.episode_id == translated_episode.id).one()
+    )
+    assert run.status == RunStatus.FAILED
+    assert run.error_message == "batch expired"
+
+
+@patch("btcedu.core.batching.call_claude_batch")
+def test_adapt_scripts_batch_partial_failure_fails_only_owner(
+    mock_batch,
+    translated_episode,
+    mock_settings,
+    db_session,
+    tmp_path,
+    mock_claude_adapt_response,
+):
+    """A failed batch request fails its own episode; the rest still finish."""
+    other_dir = tmp_path / "transcripts" / "ep_other"
+    other_dir.mkdir(parents=True)
+    (other_dir / "transcript.corrected.de.txt").write_text("Bitcoin.", encoding="utf-8")
+    (other_dir / "transcript.tr.txt").write_text("Bitcoin.", encoding="utf-8")
+    db_session.add(
+        Episode(
+            episode_id="ep_other",
+            source="youtube_rss",
+            title="Bitcoin",
+            url="https://youtube.com/watch?v=ep_other",
+            status=EpisodeStatus.TRANSLATED,
+            pipeline_version=2,
+        )
+    )
+    db_session.add(
+        ReviewTask(
+            episode_id="ep_other",
+            stage="correct",
+            status=ReviewStatus.APPROVED.value,
+            artifact_paths="[]",
+        )
+    )
+    db_session.commit()
+    mock_batch.return_value = [
+        type("Response", (), mock_claude_adapt_response),
+        RuntimeError("request 1 expired"),
+    ]
+
+    results = adapt_scripts_batch(db_session, ["ep_test", "ep_other"], mock_settings)
+
+    assert results["ep_test"].skipped is False
+    assert isinstance(results["ep_other"], RuntimeError)
+    db_session.refresh(translated_episode)
+    assert translated_episode.status == EpisodeStatus.ADAPTED
+    other = db_session.query(Episode).filter(Episode.episode_id == "ep_other").one()
+    assert other.status == EpisodeStatus.TRANSLATED
+    run = db_session.query(PipelineRun).filter(PipelineRun.episode_id == other.id).one()
+    assert run.status == RunStatus.FAILED
+    assert run.error_message == "request 1 expired"
+
+
+@patch("btcedu.core.adapter._segment_text", return_value=["seg-0", "seg-1", "seg-2"])
+@patch("btcedu.core.adapter.call_claude")
+def test_adapt_script_segments_concurrent_in_order(
+    mock_call_claude, _mock_segment, translated_episode, mock_settings, db_session
+):
+    """Segments are adapted in parallel but reassembled in input order."""
+
+    def respond(system_prompt, user_message, settings, **kwargs):
+        i = next(i for i in range(3) if f"seg-{i}" in user_message)
+        time.sleep((3 - i) * 0.02)  # later segments finish first
+        return type(
+            "Response",
+            (),
+            {"text": f"out-{i}", "input_tokens": 10, "output_tokens": 5, "cost_usd": 0.01},
+        )
+
+    mock_call_claude.side_effect = respond
+
+    result = adapt_script(db_session, "ep_test", mock_settings, force=False)
+
+    adapted_path = Path(mock_settings.outputs_dir) / "ep_test" / "script.adapted.tr.md"
+    assert adapted_path.read_text(encoding="utf-8") == "out-0\n\nout-1\n\nout-2"
+    assert result.segments_processed == 3
+    assert result.input_tokens == 30
+    assert result.output_tokens == 15
+    assert result.cost_usd == pytest.approx(0.03)
+    # The shared system prompt is marked for prompt caching on every segment
+    assert all(c.kwargs["cache_system_prompt"] for c in mock_call_claude.call_args_list)
+
+
+@patch("btcedu.core.adapter._write_json", side_effect=OSError("disk full"))
+@patch("btcedu.core.adapter.call_claude")
+def test_adapt_script_output_write_failure_keeps_status(
+    mock_call_claude,
+    mock_write_json,
+    translated_episode,
+    mock_settings,
+    db_session,
+    mock_claude_adapt_response,
+):
+    """A failed background write fails the run without marking the episode adapted."""
+    mock_call_claude.return_value = type("Response", (), mock_claude_adapt_response)
+
+    with pytest.raises(OSError, match="disk full"):
+        adapt_script(db_session, "ep_test", mock_settings)
+
+    db_session.refresh(translated_episode)
+    assert translated_episode.status == EpisodeStatus.TRANSLATED
+    run = (
+        db_session.query(PipelineRun).filter(PipelineRun.episode_id == translated_episode.id).one()
+    )
+    assert run.status == RunStatus.FAILED
+    assert db_session.query(ContentArtifact).count() == 0
+
+
+@patch("btcedu.core.adapter.call_claude")
+def test_adapt_script_script_write_failure_not_treated_as_current(
+    mock_call_claude,
+    translated_episode,
+    mock_settings,
+    db_session,
+    mock_claude_adapt_response,
+):
+    """A failed script write leaves no provenance/.ok vouching for the partial file."""
+    mock_call_claude.return_value = type("Response", (), mock_claude_adapt_response)
+    first = adapt_script(db_session, "ep_test", mock_settings)
+    adapted_path = Path(first.adapted_path)
+    full_text = adapted_path.read_text(encoding="utf-8")
+
+    def truncated_write(path, segments):
+        path.write_text(segments[0][:10], encoding="utf-8")
+        raise OSError("disk full")
+
+    with (
+        patch("btcedu.core.adapter._write_segments", side_effect=truncated_write),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        adapt_script(db_session, "ep_test", mock_settings, force=True)
+
+    assert not Path(first.provenance_path).exists()
+    assert not Path(first.diff_path).exists()
+    assert not (adapted_path.parent / "script.adapted.tr.md.ok").exists()
+
+    rerun = adapt_script(db_session, "ep_test", mock_settings)
+    assert rerun.skipped is False
+    assert adapted_path.read_text(encoding="utf-8") == full_text
+
+
+@patch("btcedu.core.adapter.call_claude")
+def test_adapt_script_diff_write_failure_not_treated_as_current(
+    mock_call_claude,
+    translated_episode,
+    mock_settings,
+    db_session,
+    tmp_path,
+    mock_claude_adapt_response,
+):
+    """A failed diff write leaves no provenance vouching for the changed inputs."""
+    mock_call_claude.return_value = type("Response", (), mock_claude_adapt_response)
+    first = adapt_script(db_session, "ep_test", mock_settings)
+    translation_path = tmp_path / "transcripts" / "ep_test" / "transcript.tr.txt"
+    translation_path.write_text("Bugün Lightning hakkında konuşacağız.", encoding="utf-8")
+
+    write_json = _write_json
+
+    def failing_write(path, data):
+        if path.name == "adaptation_diff.json":
+            path.write_text('{"trunc', encoding="utf-8")
+            raise OSError("disk full")
+        write_json(path, data)
+
+    with (
+        patch("btcedu.core.adapter._write_json", side_effect=failing_write),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        adapt_script(db_session, "ep_test", mock_settings)
+
+    assert not Path(first.provenance_path).exists()
+    assert not Path(first.diff_path).exists()
+    assert not (Path(first.adapted_path).parent / "script.adapted.tr.md.ok").exists()
+
+    rerun = adapt_script(db_session, "ep_test", mock_settings)
+    assert rerun.skipped is False
+    json.loads(Path(rerun.diff_path).read_text(encoding="utf-8"))
+
+
 @patch("btcedu.core.adapter.call_claude")
 def test_adapt_script_idempotent(
     mock_call_claude,
@@ -401,6 +724,34 @@ def test_adapt_script_idempotent(
     result2 = adapt_script(db_session, "ep_test", mock_settings, force=False)
     assert result2.skipped is True
     assert result2.adaptation_count == 2  # Still reports from cached diff
+    assert result2.input_char_count == result1.input_char_count
+    assert result2.output_char_count == result1.output_char_count
+    assert (Path(result1.adapted_path).parent / "script.adapted.tr.md.ok").exists()
+
+
+def test_write_segments_matches_joined_text(tmp_path):
+    """Segments are written exactly as the blank-line joined text."""
+    path = tmp_path / "script.adapted.tr.md"
+    segments = ["Birinci bölüm.", "İkinci bölüm [T1: 30 USD].", "Son."]
+
+    _write_segments(path, segments)
+
+    assert path.read_text(encoding="utf-8") == "\n\n".join(segments)
+
+
+def test_hash_file_cached_by_mtime_and_size(tmp_path):
+    """File hashes are recomputed only when mtime or size changes."""
+    path = tmp_path / "transcript.tr.txt"
+    path.write_bytes(b"merhaba")
+    _hash_file.cache_clear()
+
+    assert _file_hash(path) == hashlib.sha256(b"merhaba").hexdigest()
+    assert _file_hash(path) == hashlib.sha256(b"merhaba").hexdigest()
+    assert _hash_file.cache_info().hits == 1
+
+    path.write_bytes(b"merhaba dunya")
+    os.utime(path, ns=(1, 1))
+    assert _file_hash(path) == hashlib.sha256(b"merhaba dunya").hexdigest()
 
 
 @patch("btcedu.core.adapter.call_claude")
@@ -622,7 +973,6 @@ def test_adapt_script_content_artifact(
     mock_claude_adapt_response,
 ):
     """Test that ContentArtifact is created correctly."""
-    from btcedu.models.content_artifact import ContentArtifact
 
     mock_call_claude.return_value = type("Response", (), mock_claude_adapt_response)
 
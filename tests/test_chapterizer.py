@@ -2,6 +2,7 @@
 
 import hashlib
 import json
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,12 +10,17 @@ import pytest
 
 from btcedu.core.chapterizer import (
     ChapterizationResult,
+    _clean_json,
     _compute_duration_estimate,
+    _fill_placeholders,
     _is_chapterization_current,
+    _mark_downstream_stale,
+    _overlap_context,
     _segment_script,
     _split_prompt,
     chapterize_script,
 )
+from btcedu.models.chapter_schema import ChapterDocument
 from btcedu.models.episode import Episode, EpisodeStatus
 from btcedu.models.review import ReviewStatus, ReviewTask
 
@@ -110,6 +116,15 @@ Here is the data.
     assert "Here is the data." in user
 
 
+def test_fill_placeholders_single_pass():
+    """Placeholders are filled once; substituted text is not rescanned."""
+    template = "# Input\n\n{{episode_id}}\n{{adapted_script}}\n{{unknown}}"
+    result = _fill_placeholders(
+        template, episode_id="ep_1", adapted_script="literal {{episode_id}} in script"
+    )
+    assert result == "# Input\n\nep_1\nliteral {{episode_id}} in script\n{{unknown}}"
+
+
 def test_split_prompt_no_marker():
     """Test prompt splitting when no '# Input' marker exists."""
     template = "This is a simple prompt without Input section."
@@ -140,12 +155,45 @@ def test_segment_script_long():
         assert len(seg) <= 1500  # Allow some overflow for paragraph boundaries
 
 
+def test_overlap_context_takes_trailing_paragraphs():
+    """Whole trailing paragraphs are kept while they fit in the budget."""
+    segment = "a" * 30 + "\n\n" + "b" * 20 + "\n\n" + "c" * 20
+    assert _overlap_context(segment, 20) == "c" * 20
+    assert _overlap_context(segment, 42) == "b" * 20 + "\n\n" + "c" * 20
+    assert _overlap_context(segment, 1000) == segment
+
+
+def test_overlap_context_skips_oversized_paragraph():
+    """Nothing is returned when even the last paragraph exceeds the budget."""
+    assert _overlap_context("a" * 60 + "\n\n" + "b" * 60, 10) == ""
+
+
+def test_clean_json_strips_comments_and_trailing_commas():
+    """Comments outside strings and trailing commas are removed."""
+    text = (
+        "{\n"
+        "  // full-line comment\n"
+        '  "url": "https://example.com", // inline comment\n'
+        '  "items": [1, 2,],\n'
+        '  "quote": "say \\"//\\" here",\n'
+        "}"
+    )
+    assert json.loads(_clean_json(text)) == {
+        "url": "https://example.com",
+        "items": [1, 2],
+        "quote": 'say "//" here',
+    }
+
+
 def test_is_chapterization_current_no_output():
     """Test idempotency check: returns False if output doesn't exist."""
     chapters_path = Path("/tmp/nonexistent/chapters.json")
     provenance_path = Path("/tmp/nonexistent/provenance.json")
-    result = _is_chapterization_current(chapters_path, provenance_path, "hash1", "hash2")
+    result, provenance = _is_chapterization_current(
+        chapters_path, provenance_path, "hash1", "hash2"
+    )
     assert result is False
+    assert provenance is None
 
 
 def test_is_chapterization_current_stale_marker(tmp_path):
@@ -161,7 +209,7 @@ def test_is_chapterization_current_stale_marker(tmp_path):
         '{"prompt_hash": "hash1", "input_content_hash": "hash2"}', encoding="utf-8"
     )
 
-    result = _is_chapterization_current(chapters_path, provenance_path, "hash2", "hash1")
+    result, _ = _is_chapterization_current(chapters_path, provenance_path, "hash2", "hash1")
     assert result is False
     assert not stale_marker.exists()  # Marker should be consumed
 
@@ -178,8 +226,56 @@ def test_is_chapterization_current_valid(tmp_path):
     }
     provenance_path.write_text(json.dumps(provenance), encoding="utf-8")
 
-    result = _is_chapterization_current(chapters_path, provenance_path, "hash2", "hash1")
+    result, cached = _is_chapterization_current(chapters_path, provenance_path, "hash2", "hash1")
     assert result is True
+    assert cached == provenance
+
+
+def test_is_chapterization_current_rereads_changed_provenance(tmp_path):
+    """The cached provenance decode is invalidated when the file changes."""
+    chapters_path = tmp_path / "chapters.json"
+    chapters_path.write_text("{}", encoding="utf-8")
+    provenance_path = tmp_path / "provenance.json"
+    provenance_path.write_text(
+        json.dumps({"prompt_hash": "hash1", "input_content_hash": "hash2"}), encoding="utf-8"
+    )
+    assert _is_chapterization_current(chapters_path, provenance_path, "hash2", "hash1")[0]
+
+    provenance_path.write_text(
+        json.dumps({"prompt_hash": "hash1", "input_content_hash": "changed"}), encoding="utf-8"
+    )
+    result, provenance = _is_chapterization_current(
+        chapters_path, provenance_path, "hash2", "hash1"
+    )
+    assert result is False
+    assert provenance is None
+
+
+def test_is_chapterization_current_corrupt_provenance(tmp_path):
+    """A corrupt provenance file forces a re-run instead of raising."""
+    chapters_path = tmp_path / "chapters.json"
+    chapters_path.write_text("{}", encoding="utf-8")
+    provenance_path = tmp_path / "provenance.json"
+    provenance_path.write_text("{not json", encoding="utf-8")
+
+    assert _is_chapterization_current(chapters_path, provenance_path, "hash2", "hash1") == (
+        False,
+        None,
+    )
+
+
+def test_mark_downstream_stale_writes_markers(tmp_path):
+    """Every existing downstream stage gets the same stale marker."""
+    settings = MagicMock()
+    settings.outputs_dir = str(tmp_path)
+    (tmp_path / "ep_test" / "images").mkdir(parents=True)
+    (tmp_path / "ep_test" / "tts").mkdir()
+
+    _mark_downstream_stale("ep_test", settings)
+
+    marker = tmp_path / "ep_test" / "images" / ".stale"
+    assert json.loads(marker.read_text(encoding="utf-8"))["invalidated_by"] == "chapterize"
+    assert (tmp_path / "ep_test" / "tts" / ".stale").read_bytes() == marker.read_bytes()
 
 
 # ---------------------------------------------------------------------------
@@ -288,6 +384,9 @@ def test_chapterize_script_success(
     # Check files were created
     chapters_path = Path(settings.outputs_dir) / "ep_test" / "chapters.json"
     assert chapters_path.exists()
+    chapters_text = chapters_path.read_text(encoding="utf-8")
+    assert '"title": "Giriş"' in chapters_text  # non-ASCII kept, indented output
+    assert ChapterDocument.model_validate_json(chapters_text).total_chapters == 2
 
     provenance_path = (
         Path(settings.outputs_dir) / "ep_test" / "provenance" / "chapterize_provenance.json"
@@ -299,12 +398,132 @@ def test_chapterize_script_success(
     assert episode.status == EpisodeStatus.CHAPTERIZED
 
 
+def _segment_chapter_json(i: int) -> str:
+    """Single-chapter LLM response whose narration identifies segment *i*."""
+    return json.dumps(
+        {
+            "schema_version": "1.0",
+            "episode_id": "ep_test",
+            "title": f"Segment {i}",
+            "total_chapters": 1,
+            "estimated_duration_seconds": 60,
+            "chapters": [
+                {
+                    "chapter_id": "ch01",
+                    "title": f"Bölüm {i}",
+                    "order": 1,
+                    "narration": {
+                        "text": f"segment {i} " + " ".join(["kelime"] * 100),
+                        "word_count": 102,
+                        "estimated_duration_seconds": 60,
+                    },
+                    "visual": {"type": "title_card", "description": "Logo"},
+                    "overlays": [],
+                    "transitions": {"in": "cut", "out": "cut"},
+                }
+            ],
+        }
+    )
+
+
+@patch("btcedu.core.chapterizer._segment_script", return_value=["seg-0", "seg-1", "seg-2"])
+@patch("btcedu.core.chapterizer.call_claude")
+@patch("btcedu.core.chapterizer.PromptRegistry")
+def test_chapterize_script_segments_concurrent_in_order(
+    mock_registry, mock_call_claude, _mock_segment, adapted_episode, db_session, tmp_path
+):
+    """Segments are chapterized in parallel but merged in input order."""
+    settings = MagicMock()
+    settings.outputs_dir = str(tmp_path / "outputs")
+    settings.claude_model = "claude-sonnet-4-20250514"
+    settings.claude_temperature = 0.3
+    settings.claude_max_tokens = 8192
+    settings.dry_run = False
+    settings.chapterize_concurrency = 3
+    settings.chapterize_overlap_chars = 0
+
+    adapted_path = Path(settings.outputs_dir) / "ep_test" / "script.adapted.tr.md"
+    adapted_path.parent.mkdir(parents=True, exist_ok=True)
+    adapted_path.write_text("# Bitcoin Nedir?\n\nTest script.", encoding="utf-8")
+
+    mock_registry.return_value.register_version.return_value = MagicMock(version=1)
+    mock_registry.return_value.load_template.return_value = (
+        "",
+        "# System\n\n# Input\n\n{{episode_id}}\n{{adapted_script}}",
+    )
+    mock_registry.return_value.compute_hash.return_value = "prompt_hash_123"
+
+    def respond(system_prompt, user_message, settings, **kwargs):
+        i = next(i for i in range(3) if f"seg-{i}" in user_message)
+        time.sleep((3 - i) * 0.02)  # later segments finish first
+        return MagicMock(
+            text=_segment_chapter_json(i), input_tokens=10, output_tokens=5, cost_usd=0.01
+        )
+
+    mock_call_claude.side_effect = respond
+
+    result = chapterize_script(db_session, "ep_test", settings, force=False)
+
+    doc = ChapterDocument.model_validate_json(
+        (Path(settings.outputs_dir) / "ep_test" / "chapters.json").read_bytes()
+    )
+    assert [ch.chapter_id for ch in doc.chapters] == ["ch01", "ch02", "ch03"]
+    assert [ch.narration.text.split()[1] for ch in doc.chapters] == ["0", "1", "2"]
+    assert doc.estimated_duration_seconds == sum(
+        ch.narration.estimated_duration_seconds for ch in doc.chapters
+    )
+    assert result.segments_processed == 3
+    assert result.input_tokens == 30
+    assert result.cost_usd == pytest.approx(0.03)
+
+
+@patch("btcedu.core.chapterizer._segment_script", return_value=["seg-0", "seg-1"])
+@patch("btcedu.core.chapterizer.call_claude")
+@patch("btcedu.core.chapterizer.PromptRegistry")
+def test_chapterize_script_overlap_sent_as_context_block(
+    mock_registry, mock_call_claude, _mock_segment, adapted_episode, db_session, tmp_path
+):
+    """Overlap goes in a separate context-only block, not into the segment text."""
+    settings = MagicMock()
+    settings.outputs_dir = str(tmp_path / "outputs")
+    settings.claude_model = "claude-sonnet-4-20250514"
+    settings.claude_temperature = 0.3
+    settings.claude_max_tokens = 8192
+    settings.dry_run = False
+    settings.chapterize_concurrency = 1
+    settings.chapterize_overlap_chars = 100
+
+    mock_registry.return_value.register_version.return_value = MagicMock(version=1)
+    mock_registry.return_value.load_template.return_value = (
+        "",
+        "# System\n\n# Input\n\n{{episode_id}}\n{{adapted_script}}",
+    )
+    mock_registry.return_value.compute_hash.return_value = "prompt_hash_123"
+    mock_call_claude.side_effect = [
+        MagicMock(text=_segment_chapter_json(i), input_tokens=10, output_tokens=5, cost_usd=0.01)
+        for i in range(2)
+    ]
+
+    chapterize_script(db_session, "ep_test", settings, force=False)
+
+    first, second = (c.kwargs["user_message"] for c in mock_call_claude.call_args_list)
+    assert "context only" not in first
+    script_part, context_part = second.split("context only, do not chapterize")
+    assert "seg-1" in script_part and "seg-0" not in script_part
+    assert "seg-0" in context_part
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
 @patch("btcedu.core.chapterizer.call_claude")
 @patch("btcedu.core.chapterizer.PromptRegistry")
 def test_chapterize_script_idempotency(
-    mock_registry, mock_call_claude, adapted_episode, db_session, tmp_path
+    mock_registry, mock_call_claude, adapted_episode, db_session, tmp_path, newline
 ):
-    """Test chapterization idempotency: second run skips if output is current."""
+    """Test chapterization idempotency: second run skips if output is current.
+
+    The input hash is taken over newline-normalised text, so a CRLF script
+    matches provenance recorded for the same text with LF endings.
+    """
     settings = MagicMock()
     settings.outputs_dir = str(tmp_path / "outputs")
     settings.transcripts_dir = str(tmp_path / "transcripts")
@@ -317,7 +536,7 @@ def test_chapterize_script_idempotency(
     adapted_path = Path(settings.outputs_dir) / "ep_test" / "script.adapted.tr.md"
     adapted_path.parent.mkdir(parents=True, exist_ok=True)
     adapted_text = "# Bitcoin Nedir?\n\nTest script."
-    adapted_path.write_text(adapted_text, encoding="utf-8")
+    adapted_path.write_bytes(adapted_text.replace("\n", newline).encode("utf-8"))
 
     # Mock prompt registry
     mock_version = MagicMock()
@@ -484,3 +703,113 @@ def test_chapterize_script_wrong_status(db_session, tmp_path):
     with pytest.raises(ValueError) as exc_info:
         chapterize_script(db_session, "ep_wrong_status", settings, force=False)
     assert "expected 'adapted'" in str(exc_info.value).lower()
+
+
+@pytest.mark.parametrize(
+    ("stage", "status", "message"),
+    [
+        ("render", ReviewStatus.PENDING.value, "has pending review"),
+        ("adapt", ReviewStatus.REJECTED.value, "has not been approved"),
+    ],
+)
+def test_chapterize_script_review_gate(
+    adapted_episode, db_session, tmp_path, stage, status, message
+):
+    """Review Gate 2 blocks on any open review or a missing adapt approval."""
+    settings = MagicMock()
+    settings.outputs_dir = str(tmp_path / "outputs")
+
+    if stage == "adapt":
+        db_session.query(ReviewTask).filter(ReviewTask.episode_id == "ep_test").update(
+            {"status": status}
+        )
+    else:
+        db_session.add(
+            ReviewTask(episode_id="ep_test", stage=stage, status=status, artifact_paths="[]")
+        )
+    db_session.commit()
+
+    with pytest.raises(ValueError, match=message):
+        chapterize_script(db_session, "ep_test", settings, force=False)
+
+
+@patch("btcedu.core.chapterizer.call_claude")
+@patch("btcedu.core.chapterizer.PromptRegistry")
+def test_chapterize_script_chapters_write_failure_drops_provenance(
+    mock_registry, mock_call_claude, adapted_episode, db_session, tmp_path
+):
+    """A failed chapters.json write leaves no provenance claiming it is current."""
+    settings = MagicMock()
+    settings.outputs_dir = str(tmp_path / "outputs")
+    settings.claude_model = "claude-sonnet-4-20250514"
+    settings.claude_temperature = 0.3
+    settings.claude_max_tokens = 8192
+    settings.dry_run = False
+    settings.chapterize_overlap_chars = 0
+
+    mock_registry.return_value.register_version.return_value = MagicMock(version=1)
+    mock_registry.return_value.load_template.return_value = (
+        "",
+        "# System\n\n# Input\n\n{{episode_id}}\n{{adapted_script}}",
+    )
+    mock_registry.return_value.compute_hash.return_value = "prompt_hash_123"
+    mock_call_claude.return_value = MagicMock(
+        text=_segment_chapter_json(0), input_tokens=10, output_tokens=5, cost_usd=0.01
+    )
+
+    # chapters.json as a directory makes the write fail
+    (Path(settings.outputs_dir) / "ep_test" / "chapters.json").mkdir()
+
+    with pytest.raises(OSError):
+        chapterize_script(db_session, "ep_test", settings, force=False)
+
+    provenance_path = (
+        Path(settings.outputs_dir) / "ep_test" / "provenance" / "chapterize_provenance.json"
+    )
+    assert not provenance_path.exists()
+    episode = db_session.query(Episode).filter(Episode.episode_id == "ep_test").first()
+    assert episode.status == EpisodeStatus.ADAPTED
+
+
+@patch("btcedu.core.chapterizer.call_claude")
+@patch("btcedu.core.chapterizer.PromptRegistry")
+def test_chapterize_script_interrupted_write_drops_provenance(
+    mock_registry, mock_call_claude, adapted_episode, db_session, tmp_path
+):
+    """An interrupt during the chapters.json write also removes the provenance."""
+    settings = MagicMock()
+    settings.outputs_dir = str(tmp_path / "outputs")
+    settings.claude_model = "claude-sonnet-4-20250514"
+    settings.claude_temperature = 0.3
+    settings.claude_max_tokens = 8192
+    settings.dry_run = False
+    settings.chapterize_overlap_chars = 0
+
+    mock_registry.return_value.register_version.return_value = MagicMock(version=1)
+    mock_registry.return_value.load_template.return_value = (
+        "",
+        "# System\n\n# Input\n\n{{episode_id}}\n{{adapted_script}}",
+    )
+    mock_registry.return_value.compute_hash.return_value = "prompt_hash_123"
+    mock_call_claude.return_value = MagicMock(
+        text=_segment_chapter_json(0), input_tokens=10, output_tokens=5, cost_usd=0.01
+    )
+
+    provenance_path = (
+        Path(settings.outputs_dir) / "ep_test" / "provenance" / "chapterize_provenance.json"
+    )
+    write_bytes = Path.write_bytes
+
+    def interrupted(self, data):
+        if self.name == "chapters.json":
+            # Let the background provenance write land first
+            deadline = time.monotonic() + 5
+            while not provenance_path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            raise KeyboardInterrupt
+        return write_bytes(self, data)
+
+    with patch.object(Path, "write_bytes", interrupted), pytest.raises(KeyboardInterrupt):
+        chapterize_script(db_session, "ep_test", settings, force=False)
+
+    assert not provenance_path.exists()
@@ -103,3 +103,12 @@ class TestSettings:
         settings = Settings(anthropic_api_key="sk-ant-new", claude_api_key="sk-ant-old")
         assert settings.anthropic_api_key == "sk-ant-new"
         assert settings.claude_api_key == ""  # cleared after migration
+
+    def test_get_settings_is_cached(self):
+        from btcedu.config import get_settings
+
+        get_settings.cache_clear()
+        try:
+            assert get_settings() is get_settings()
+        finally:
+            get_settings.cache_clear()
@@ -1,7 +1,10 @@
 """Tests for the transcript correction module (Sprint 2)."""
 
+import hashlib
 import json
+import time
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -12,10 +15,13 @@ from btcedu.core.corrector import (
     _is_correction_current,
     _segment_transcript,
     _split_prompt,
+    _word_opcodes,
     compute_correction_diff,
     correct_transcript,
+    correct_transcripts_batch,
 )
 from btcedu.models.episode import Episode, EpisodeStatus, PipelineRun, PipelineStage, RunStatus
+from btcedu.services.claude_service import ClaudeResponse
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -78,6 +84,13 @@ class TestComputeCorrectionDiff:
         assert diff["original_length"] == len(text)
         assert diff["corrected_length"] == len(text)
 
+    def test_no_changes_skips_diff(self):
+        text = "Bitcoin ist eine dezentrale Währung."
+        with patch("btcedu.core.corrector._word_opcodes") as word_opcodes:
+            diff = compute_correction_diff(text, text, "ep001")
+        word_opcodes.assert_not_called()
+        assert diff["summary"] == {"total_changes": 0, "by_type": {}}
+
     def test_replace(self):
         original = "Heute über Bit Coin sprechen"
         corrected = "Heute über Bitcoin sprechen"
@@ -139,6 +152,54 @@ class TestComputeCorrectionDiff:
             assert "start_word" in change["position"]
             assert "end_word" in change["position"]
 
+    def test_long_transcript_changes_located(self):
+        words = [f"wort{i % 700}" for i in range(20_000)]
+        corrected = list(words)
+        corrected[150] = "Bitcoin"
+        del corrected[9_000]
+        corrected.insert(15_000, "Blockchain")
+        diff = compute_correction_diff(" ".join(words), " ".join(corrected), "ep001")
+        assert [(c["type"], c["position"]["start_word"]) for c in diff["changes"]] == [
+            ("replace", 150),
+            ("delete", 9_000),
+            ("insert", 15_001),
+        ]
+
+
+class TestWordOpcodes:
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ("", ""),
+            ("a b c", ""),
+            ("", "a b c"),
+            ("a b c d", "a x c d"),
+            ("a a b a a", "a b a a a"),
+            ("x y z", "z y x"),
+            ("the cat the dog the end", "the dog the cat the end"),
+        ],
+    )
+    def test_opcodes_rebuild_corrected(self, a, b):
+        a, b = a.split(), b.split()
+        rebuilt = []
+        i = j = 0
+        for tag, i1, i2, j1, j2 in _word_opcodes(a, b):
+            assert (i1, j1) == (i, j)
+            if tag == "equal":
+                assert a[i1:i2] == b[j1:j2]
+            rebuilt += b[j1:j2]
+            i, j = i2, j2
+        assert (i, j) == (len(a), len(b))
+        assert rebuilt == b
+
+    def test_frequent_words_not_junked(self):
+        # No anchors, and both words are "popular" by SequenceMatcher's
+        # autojunk heuristic; they must still be matched.
+        a = ["und"] * 200 + ["die"] * 100
+        b = ["die"] * 101 + ["und"] * 201
+        opcodes = _word_opcodes(a, b)
+        assert max(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag == "equal") == 200
+
 
 # ---------------------------------------------------------------------------
 # Unit tests: _segment_transcript
@@ -212,13 +273,13 @@ class TestIsCorrectionCurrent:
         provenance.write_text(
             json.dumps({"prompt_hash": "hash123", "input_content_hash": "inputhash456"})
         )
-        assert _is_correction_current(corrected, provenance, "inputhash456", "hash123") is True
+        assert _is_correction_current(corrected, provenance, "inputhash456", "hash123")[0] is True
 
     def test_missing_corrected_file(self, tmp_path):
         corrected = tmp_path / "corrected.txt"  # doesn't exist
         provenance = tmp_path / "provenance.json"
         provenance.write_text(json.dumps({"prompt_hash": "h", "input_content_hash": "i"}))
-        assert _is_correction_current(corrected, provenance, "i", "h") is False
+        assert _is_correction_current(corrected, provenance, "i", "h")[0] is False
 
     def test_stale_marker(self, tmp_path):
         corrected = tmp_path / "corrected.txt"
@@ -227,7 +288,7 @@ class TestIsCorrectionCurrent:
         stale.write_text("{}")
         provenance = tmp_path / "provenance.json"
         provenance.write_text(json.dumps({"prompt_hash": "h", "input_content_hash": "i"}))
-        assert _is_correction_current(corrected, provenance, "i", "h") is False
+        assert _is_correction_current(corrected, provenance, "i", "h")[0] is False
 
     def test_prompt_hash_mismatch(self, tmp_path):
         corrected = tmp_path / "corrected.txt"
@@ -236,7 +297,7 @@ class TestIsCorrectionCurrent:
         provenance.write_text(
             json.dumps({"prompt_hash": "old_hash", "input_content_hash": "inputhash"})
         )
-        assert _is_correction_current(corrected, provenance, "inputhash", "new_hash") is False
+        assert _is_correction_current(corrected, provenance, "inputhash", "new_hash")[0] is False
 
     def test_input_hash_mismatch(self, tmp_path):
         corrected = tmp_path / "corrected.txt"
@@ -245,13 +306,13 @@ class TestIsCorrectionCurrent:
         provenance.write_text(
             json.dumps({"prompt_hash": "hash", "input_content_hash": "old_input"})
         )
-        assert _is_correction_current(corrected, provenance, "new_input", "hash") is False
+        assert _is_correction_current(corrected, provenance, "new_input", "hash")[0] is False
 
     def test_missing_provenance(self, tmp_path):
         corrected = tmp_path / "corrected.txt"
         corrected.write_text("corrected text")
         provenance = tmp_path / "provenance.json"  # doesn't exist
-        assert _is_correction_current(corrected, provenance, "i", "h") is False
+        assert _is_correction_current(corrected, provenance, "i", "h")[0] is False
 
 
 # ---------------------------------------------------------------------------
@@ -326,6 +387,32 @@ class TestCorrectTranscript:
         assert result2.output_tokens == 0
         assert result2.change_count == result1.change_count
 
+    def test_idempotent_skip_reads_counts_from_provenance(
+        self, db_session, transcribed_episode, mock_settings
+    ):
+        """The skip path takes its counts from provenance, not the outputs."""
+        result1 = correct_transcript(db_session, "ep_test", mock_settings)
+        Path(result1.diff_path).unlink()
+
+        result2 = correct_transcript(db_session, "ep_test", mock_settings)
+        assert result2.change_count == result1.change_count
+        assert result2.output_char_count == result1.output_char_count
+
+    def test_crlf_transcript_hash_matches_text(
+        self, db_session, transcribed_episode, mock_settings
+    ):
+        """The input hash is taken over the newline-translated text."""
+        transcript_path = Path(transcribed_episode.transcript_path)
+        transcript_path.write_bytes(b"Bit Coin\r\n\r\nBlok Chain\r\n")
+
+        result = correct_transcript(db_session, "ep_test", mock_settings)
+        provenance = json.loads(Path(result.provenance_path).read_text(encoding="utf-8"))
+        expected = hashlib.sha256(
+            transcript_path.read_text(encoding="utf-8").encode("utf-8")
+        ).hexdigest()
+        assert provenance["input_content_hash"] == expected
+        assert result.input_char_count == len("Bit Coin\n\nBlok Chain\n")
+
     def test_force_reruns(self, db_session, transcribed_episode, mock_settings):
         """With force=True, re-runs even if output exists."""
         correct_transcript(db_session, "ep_test", mock_settings)
@@ -337,6 +424,112 @@ class TestCorrectTranscript:
         )
         assert len(runs) == 2
 
+    def test_segments_corrected_concurrently_in_order(
+        self, db_session, transcribed_episode, mock_settings
+    ):
+        """Segments are corrected in parallel but reassembled in input order."""
+
+        def respond(system_prompt, user_message, settings, **kwargs):
+            i = next(i for i in range(3) if f"seg-{i}" in user_message)
+            time.sleep((3 - i) * 0.02)  # later segments finish first
+            return SimpleNamespace(text=f"out-{i}", input_tokens=10, output_tokens=5, cost_usd=0.01)
+
+        with (
+            patch(
+                "btcedu.core.corrector._segment_transcript",
+                return_value=["seg-0", "seg-1", "seg-2"],
+            ),
+            patch("btcedu.core.corrector.call_claude", side_effect=respond) as mock_call,
+        ):
+            result = correct_transcript(db_session, "ep_test", mock_settings)
+
+        assert Path(result.corrected_path).read_text(encoding="utf-8") == (
+            "out-0\n\nout-1\n\nout-2"
+        )
+        assert result.input_tokens == 30
+        assert result.cost_usd == pytest.approx(0.03)
+        # The shared system prompt is marked for prompt caching on every segment
+        assert all(c.kwargs["cache_system_prompt"] for c in mock_call.call_args_list)
+
+
+class TestCorrectTranscriptsBatch:
+    def test_batch_corrects_and_reports_per_episode(
+        self, db_session, transcribed_episode, mock_settings
+    ):
+        """Episodes needing correction go through one batch; others report per episode."""
+        response = SimpleNamespace(
+            text="Heute sprechen wir über Bitcoin.", input_tokens=10, output_tokens=5, cost_usd=0.01
+        )
+        with patch(
+            "btcedu.core.batching.call_claude_batch", return_value=[response]
+        ) as mock_batch:
+            results = correct_transcripts_batch(
+                db_session, ["ep_test", "ep_missing"], mock_settings
+            )
+
+        assert list(results) == ["ep_test", "ep_missing"]
+        assert results["ep_test"].cost_usd == 0.01
+        assert isinstance(results["ep_missing"], ValueError)
+        requests = mock_batch.call_args.args[0]
+        assert len(requests) == 1
+        assert "Sattoshi Nakamoto" in requests[0][1]  # transcript in the user message
+        corrected = Path(results["ep_test"].corrected_path).read_text(encoding="utf-8")
+        assert corrected == "Heute sprechen wir über Bitcoin."
+        db_session.refresh(transcribed_episode)
+        assert transcribed_episode.status == EpisodeStatus.CORRECTED
+
+    def test_batch_failure_marks_runs_failed(self, db_session, transcribed_episode, mock_settings):
+        with patch(
+            "btcedu.core.batching.call_claude_batch", side_effect=RuntimeError("batch expired")
+        ):
+            results = correct_transcripts_batch(db_session, ["ep_test"], mock_settings)
+
+        assert isinstance(results["ep_test"], RuntimeError)
+        run = (
+            db_session.query(PipelineRun)
+            .filter(PipelineRun.episode_id == transcribed_episode.id)
+            .one()
+        )
+        assert run.status == RunStatus.FAILED
+        assert run.error_message == "batch expired"
+
+    def test_batch_partial_failure_fails_only_owner(
+        self, db_session, transcribed_episode, mock_settings, tmp_path
+    ):
+        """A failed batch request fails its own episode; the rest still finish."""
+        other_path = tmp_path / "transcripts" / "ep_other" / "transcript.clean.de.txt"
+        other_path.parent.mkdir(parents=True)
+        other_path.write_text("Bit Coin.", encoding="utf-8")
+        other = Episode(
+            episode_id="ep_other",
+            source="youtube_rss",
+            title="Bitcoin",
+            url="https://youtube.com/watch?v=ep_other",
+            status=EpisodeStatus.TRANSCRIBED,
+            transcript_path=str(other_path),
+            pipeline_version=2,
+        )
+        db_session.add(other)
+        db_session.commit()
+        response = SimpleNamespace(
+            text="Heute sprechen wir über Bitcoin.", input_tokens=10, output_tokens=5, cost_usd=0.01
+        )
+        with patch(
+            "btcedu.core.batching.call_claude_batch",
+            return_value=[response, RuntimeError("request 1 errored")],
+        ):
+            results = correct_transcripts_batch(db_session, ["ep_test", "ep_other"], mock_settings)
+
+        assert results["ep_test"].cost_usd == 0.01
+        assert isinstance(results["ep_other"], RuntimeError)
+        db_session.refresh(transcribed_episode)
+        db_session.refresh(other)
+        assert transcribed_episode.status == EpisodeStatus.CORRECTED
+        assert other.status == EpisodeStatus.TRANSCRIBED
+        run = db_session.query(PipelineRun).filter(PipelineRun.episode_id == other.id).one()
+        assert run.status == RunStatus.FAILED
+        assert run.error_message == "request 1 errored"
+
 
 # ---------------------------------------------------------------------------
 # Reviewer feedback injection
@@ -480,6 +673,62 @@ class TestCorrectCLI:
         assert "--episode-id" in result.output
         assert "--force" in result.output
 
+    def test_concurrency_overlaps_on_sqlite(self, tmp_path, mock_settings):
+        """--concurrency workers can sit in LLM calls at once on a SQLite file DB."""
+        import threading
+
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        from btcedu.cli import cli
+        from btcedu.db import Base
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'cli.db'}", connect_args={"timeout": 1})
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+        with session_factory() as session:
+            for eid in ("ep_a", "ep_b"):
+                transcript = tmp_path / f"{eid}.de.txt"
+                transcript.write_text("Heute sprechen wir über Bit Coin.", encoding="utf-8")
+                session.add(
+                    Episode(
+                        episode_id=eid,
+                        source="youtube_rss",
+                        title=eid,
+                        url=f"https://youtube.com/watch?v={eid}",
+                        status=EpisodeStatus.TRANSCRIBED,
+                        transcript_path=str(transcript),
+                        pipeline_version=2,
+                    )
+                )
+            session.commit()
+
+        both_in_llm_call = threading.Barrier(2, timeout=10)
+
+        def fake_call_claude(system_prompt, user_message, settings, **kwargs):
+            both_in_llm_call.wait()
+            return ClaudeResponse(
+                text="Heute sprechen wir über Bitcoin.",
+                input_tokens=10,
+                output_tokens=10,
+                cost_usd=0.0,
+                model="test",
+            )
+
+        with patch("btcedu.core.corrector.call_claude", side_effect=fake_call_claude):
+            result = CliRunner().invoke(
+                cli,
+                ["correct", "--concurrency", "2", "--episode-id", "ep_a", "--episode-id", "ep_b"],
+                obj={"settings": mock_settings, "session_factory": session_factory},
+            )
+        engine.dispose()
+
+        assert result.exit_code == 0, result.output
+        assert [line.split()[:2] for line in result.output.splitlines()] == [
+            ["[OK]", "ep_a"],
+            ["[OK]", "ep_b"],
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Phase 5: item_id in correction diff
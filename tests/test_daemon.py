@@ -0,0 +1,121 @@
+"""Tests for the local CLI daemon (socket forwarding)."""
+
+import json
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from btcedu import daemon
+
+
+def test_socket_path_from_env(monkeypatch):
+    monkeypatch.delenv(daemon.ENV_VAR, raising=False)
+    assert daemon.socket_path_from_env() is None
+    monkeypatch.setenv(daemon.ENV_VAR, "1")
+    assert daemon.socket_path_from_env() == daemon.default_socket_path()
+    monkeypatch.setenv(daemon.ENV_VAR, "/run/user/1000/btcedu.sock")
+    assert daemon.socket_path_from_env() == "/run/user/1000/btcedu.sock"
+
+
+def test_run_captured_returns_output_and_exit_code():
+    result = daemon.run_captured(["--help"])
+    assert result["exit_code"] == 0
+    assert "btcedu - Bitcoin Education Automation Pipeline" in result["stdout"]
+
+    result = daemon.run_captured(["no-such-command"])
+    assert result["exit_code"] == 2
+    assert "No such command" in result["stderr"]
+
+
+@pytest.fixture
+def daemon_socket():
+    # AF_UNIX paths are length-limited, so avoid pytest's long tmp_path
+    sock_dir = tempfile.mkdtemp(prefix="btcedu-")
+    path = os.path.join(sock_dir, "d.sock")
+    server = threading.Thread(target=daemon.serve, args=(path,), daemon=True)
+    server.start()
+    for _ in range(100):
+        if os.path.exists(path):
+            break
+        threading.Event().wait(0.01)
+    yield path
+
+
+def test_forward_replays_daemon_output(daemon_socket, capsys):
+    exit_code = daemon.forward(daemon_socket, ["journal", "--help"])
+    assert exit_code == 0
+    assert "Show the project progress log." in capsys.readouterr().out
+
+
+def test_request_from_other_cwd_asks_client_to_fall_back():
+    client, server = socket.socketpair()
+    with client, server:
+        client.sendall(json.dumps({"argv": ["--help"], "cwd": "/elsewhere"}).encode())
+        client.shutdown(socket.SHUT_WR)
+        daemon.handle_connection(server)
+        server.shutdown(socket.SHUT_WR)
+        assert json.loads(daemon._recv_all(client)) == {"fallback": True}
+
+
+def test_forward_without_daemon_returns_none(tmp_path):
+    missing = str(tmp_path / "missing.sock")
+    assert daemon.forward(missing, ["status"]) is None
+
+
+def test_socket_is_owner_only(daemon_socket):
+    assert os.stat(daemon_socket).st_mode & 0o777 == 0o600
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(daemon_socket)
+
+
+def test_request_without_env_asks_client_to_fall_back():
+    client, server = socket.socketpair()
+    with client, server:
+        client.sendall(json.dumps({"argv": ["--help"], "cwd": os.getcwd()}).encode())
+        client.shutdown(socket.SHUT_WR)
+        daemon.handle_connection(server)
+        server.shutdown(socket.SHUT_WR)
+        assert json.loads(daemon._recv_all(client)) == {"fallback": True}
+
+
+def test_client_environment_applies_env_and_reloads_settings(monkeypatch):
+    from btcedu.config import get_settings
+
+    monkeypatch.setenv("DRY_RUN", "false")
+    get_settings.cache_clear()
+    assert get_settings().dry_run is False
+
+    with daemon._client_environment({**os.environ, "DRY_RUN": "true"}):
+        assert os.environ["DRY_RUN"] == "true"
+        assert get_settings().dry_run is True
+
+    assert os.environ["DRY_RUN"] == "false"
+    assert get_settings().dry_run is False
+    get_settings.cache_clear()
+
+
+def test_run_captured_includes_log_output(monkeypatch):
+    import logging
+
+    from btcedu.cli import cli
+
+    def noisy_main(*args, **kwargs):
+        logging.getLogger("btcedu.core.test").warning("stage went sideways")
+
+    monkeypatch.setattr(cli, "main", noisy_main)
+    result = daemon.run_captured(["anything"], env=dict(os.environ))
+    assert "[WARNING] btcedu.core.test: stage went sideways" in result["stderr"]
+
+
+def test_forward_ignores_socket_of_other_user(daemon_socket, monkeypatch):
+    monkeypatch.setattr(os, "getuid", lambda: os.stat(daemon_socket).st_uid + 1)
+    assert daemon.forward(daemon_socket, ["journal", "--help"]) is None
+
+
+def test_forward_ignores_non_socket(tmp_path):
+    not_a_socket = tmp_path / "d.sock"
+    not_a_socket.write_text("")
+    assert daemon.forward(str(not_a_socket), ["status"]) is None
@@ -0,0 +1,20 @@
+"""Tests for engine construction in btcedu.db."""
+
+from sqlalchemy import text
+
+from btcedu.db import get_engine
+
+
+def test_sqlite_file_engine_uses_wal_and_pragmas(tmp_path):
+    engine = get_engine(f"sqlite:///{tmp_path / 'btcedu.db'}")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+
+
+def test_in_memory_engine_gets_connection_pragmas():
+    engine = get_engine("sqlite:///:memory:")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
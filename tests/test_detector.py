@@ -198,6 +198,30 @@ class TestDetectFromContent:
         assert result.new == 1
         assert result.total == 4
 
+    def test_duplicate_entries_in_feed_inserted_once(self, db_session):
+        """Duplicates are dropped by the unique index, not a pre-fetched id set."""
+        entries = "".join(
+            f"""
+  <entry>
+    <id>yt:video:bulkEp{i:04d}</id>
+    <yt:videoId>bulkEp{i:04d}</yt:videoId>
+    <title>Episode {i}</title>
+    <link rel="alternate" href="https://www.youtube.com/watch?v=bulkEp{i:04d}"/>
+    <published>2024-06-22T10:00:00+00:00</published>
+  </entry>"""
+            for i in list(range(200)) + [7, 150]
+        )
+        feed = SAMPLE_FEED.replace("</feed>", entries + "\n</feed>")
+        detect_from_content(db_session, SAMPLE_FEED, "youtube_rss")
+
+        result = detect_from_content(db_session, feed, "youtube_rss")
+        assert result.found == 205
+        assert result.new == 200
+        assert result.total == 203
+        ep = db_session.query(Episode).filter(Episode.episode_id == "bulkEp0199").one()
+        assert ep.detected_at is not None
+        assert ep.retry_count == 0
+
 
 # ── Download: correct path + force flag ────────────────────────────
 
@@ -456,6 +480,30 @@ class TestBackfillEpisodes:
         assert result.new == 0
         assert result.total == 1
 
+    @patch("btcedu.core.detector.fetch_channel_videos_ytdlp")
+    def test_large_history_beyond_id_lookup_chunk(self, mock_fetch, db_session):
+        """Existing ids are looked up in chunks; defaults still apply to bulk rows."""
+        mock_fetch.return_value = [
+            EpisodeInfo(
+                episode_id=f"vid{i:04d}",
+                title=f"Ep {i}",
+                published_at=datetime(2024, 6, 15, tzinfo=UTC),
+                url=f"https://youtube.com/watch?v=vid{i:04d}",
+                source="youtube_backfill",
+            )
+            for i in range(1200)
+        ]
+        settings = _make_backfill_settings()
+
+        backfill_episodes(db_session, settings, max_count=700)
+        result = backfill_episodes(db_session, settings)
+
+        assert result.new == 500
+        assert result.total == 1200
+        ep = db_session.query(Episode).filter(Episode.episode_id == "vid1199").one()
+        assert ep.status == EpisodeStatus.NEW
+        assert ep.detected_at is not None
+
     @patch("btcedu.core.detector.fetch_channel_videos_ytdlp")
     def test_since_filter(self, mock_fetch, db_session):
         mock_fetch.return_value = [
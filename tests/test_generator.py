@@ -2,7 +2,8 @@
 
 import json
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -26,6 +27,7 @@ from btcedu.models.episode import (
 from btcedu.services.claude_service import (
     ClaudeResponse,
     calculate_cost,
+    call_claude_batch,
     compute_prompt_hash,
 )
 
@@ -338,6 +340,93 @@ class TestClaudeService:
         cost = calculate_cost(5000, 1500)
         assert cost == pytest.approx(0.0375, abs=0.001)
 
+    def test_cost_with_prompt_cache(self):
+        # 1M cache writes = $3.75, 1M cache reads = $0.30
+        cost = calculate_cost(0, 0, cache_write_tokens=1_000_000, cache_read_tokens=1_000_000)
+        assert cost == pytest.approx(4.05)
+
+    def test_cost_batch_is_half_price(self):
+        assert calculate_cost(1_000_000, 1_000_000, batch=True) == 9.0
+
+    def test_call_claude_batch_returns_results_in_request_order(self, tmp_path):
+        settings = _make_settings(tmp_path)
+
+        def message(text):
+            usage = SimpleNamespace(
+                input_tokens=1000,
+                output_tokens=100,
+                cache_creation_input_tokens=None,
+                cache_read_input_tokens=None,
+            )
+            return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)], usage=usage)
+
+        client = MagicMock()
+        client.messages.batches.create.return_value = SimpleNamespace(
+            id="batch_1", processing_status="in_progress"
+        )
+        client.messages.batches.retrieve.return_value = SimpleNamespace(
+            id="batch_1", processing_status="ended"
+        )
+        client.messages.batches.results.return_value = [
+            SimpleNamespace(
+                custom_id=f"req-{i}",
+                result=SimpleNamespace(type="succeeded", message=message(f"out {i}")),
+            )
+            for i in (1, 0)
+        ]
+
+        with patch("anthropic.Anthropic", return_value=client):
+            responses = call_claude_batch(
+                [("sys", "first"), ("sys", "second")], settings, poll_interval=0
+            )
+
+        assert [r.text for r in responses] == ["out 0", "out 1"]
+        assert responses[0].cost_usd == calculate_cost(1000, 100, batch=True)
+        requests = client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["req-0", "req-1"]
+        assert requests[1]["params"]["messages"][0]["content"] == "second"
+
+    def test_call_claude_batch_partial_failure_keeps_other_results(self, tmp_path):
+        settings = _make_settings(tmp_path)
+        usage = SimpleNamespace(
+            input_tokens=10,
+            output_tokens=5,
+            cache_creation_input_tokens=None,
+            cache_read_input_tokens=None,
+        )
+        client = MagicMock()
+        client.messages.batches.create.return_value = SimpleNamespace(
+            id="batch_1", processing_status="ended"
+        )
+        client.messages.batches.results.return_value = [
+            SimpleNamespace(
+                custom_id="req-0", result=SimpleNamespace(type="errored", error="boom")
+            ),
+            SimpleNamespace(
+                custom_id="req-1",
+                result=SimpleNamespace(
+                    type="succeeded",
+                    message=SimpleNamespace(
+                        content=[SimpleNamespace(type="text", text="ok")], usage=usage
+                    ),
+                ),
+            ),
+            SimpleNamespace(custom_id="req-2", result=SimpleNamespace(type="expired")),
+        ]
+
+        with patch("anthropic.Anthropic", return_value=client):
+            results = call_claude_batch(
+                [("sys", "a"), ("sys", "b"), ("sys", "c"), ("sys", "d")],
+                settings,
+                poll_interval=0,
+            )
+
+        assert isinstance(results[0], RuntimeError)
+        assert "request 0 errored: boom" in str(results[0])
+        assert results[1].text == "ok"
+        assert "request 2 expired" in str(results[2])
+        assert "no result for request 3" in str(results[3])
+
     def test_prompt_hash_deterministic(self):
         h1 = compute_prompt_hash("template", "model", 0.3, ["a", "b"])
         h2 = compute_prompt_hash("template", "model", 0.3, ["a", "b"])
@@ -1,4 +1,8 @@
-from btcedu.utils.journal import journal_append, journal_event, redact
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from btcedu.utils.journal import journal_append, journal_event, redact, tail_lines
 
 
 class TestRedact:
@@ -94,3 +98,61 @@ class TestJournalEvent:
         # The dict value itself isn't a KEY=value pattern, but the key name is logged
         # The important thing is: no raw secret should appear
         assert "sk-proj-xxx" not in content or "[REDACTED]" in content
+
+
+class TestTailLines:
+    def test_returns_last_lines_and_truncation(self, tmp_path):
+        path = tmp_path / "log.md"
+        path.write_text("".join(f"line {i}\n" for i in range(100)), encoding="utf-8")
+        truncated, tail = tail_lines(path, 3, block_size=16)
+        assert truncated is True
+        assert tail == ["line 97", "line 98", "line 99"]
+
+    def test_truncated_when_whole_file_fits_in_one_block(self, tmp_path):
+        path = tmp_path / "log.md"
+        path.write_text("one\ntwo\nthree\n", encoding="utf-8")
+        assert tail_lines(path, 2) == (True, ["two", "three"])
+
+    def test_short_file_is_not_truncated(self, tmp_path):
+        path = tmp_path / "log.md"
+        path.write_text("one\ntwo", encoding="utf-8")
+        assert tail_lines(path, 50) == (False, ["one", "two"])
+        assert tail_lines(path, 2) == (False, ["one", "two"])
+
+    def test_multibyte_split_across_blocks(self, tmp_path):
+        path = tmp_path / "log.md"
+        path.write_text("Grüße\nÇalışma\nğüşöç\n", encoding="utf-8")
+        assert tail_lines(path, 2, block_size=3) == (True, ["Çalışma", "ğüşöç"])
+
+    def test_reads_only_the_tail(self, tmp_path):
+        path = tmp_path / "log.md"
+        path.write_text("x" * 1_000_000 + "\nlast\n", encoding="utf-8")
+        read_sizes = []
+        real_open = open
+
+        def spy_open(*args, **kwargs):
+            f = real_open(*args, **kwargs)
+            real_read = f.read
+            f.read = lambda size=-1: read_sizes.append(size) or real_read(size)
+            return f
+
+        with patch("builtins.open", spy_open):
+            truncated, tail = tail_lines(path, 1, block_size=16)
+        assert (truncated, tail) == (True, ["last"])
+        assert sum(read_sizes) <= 32
+
+
+class TestJournalCLI:
+    def test_does_not_load_settings(self, tmp_path):
+        from btcedu.cli import cli
+
+        journal = tmp_path / "PROGRESS_LOG.md"
+        journal.write_text("one\ntwo\n", encoding="utf-8")
+        with (
+            patch("btcedu.utils.journal.JOURNAL_PATH", journal),
+            patch("btcedu.config.get_settings", side_effect=AssertionError) as get_settings,
+        ):
+            result = CliRunner().invoke(cli, ["journal", "--tail", "1"], obj={})
+        assert result.exit_code == 0, result.output
+        assert "two" in result.output
+        get_settings.assert_not_called()
@@ -0,0 +1,31 @@
+"""Tests for the orjson-backed JSON helpers."""
+
+import json
+
+import pytest
+
+from btcedu.utils import jsonio
+
+SAMPLE = {"title": "Bitcoin für Anfänger", "stages": [{"stage": "download", "cost": 0.5}]}
+
+
+def test_roundtrip_preserves_unicode():
+    raw = jsonio.dumps(SAMPLE, indent=True)
+    assert "für".encode() in raw
+    assert jsonio.loads(raw) == SAMPLE
+
+
+def test_indented_output_matches_stdlib():
+    expected = json.dumps(SAMPLE, ensure_ascii=False, indent=2).encode("utf-8")
+    assert jsonio.dumps(SAMPLE, indent=True) == expected
+
+
+def test_stdlib_fallback(monkeypatch):
+    monkeypatch.setattr(jsonio, "orjson", None)
+    assert jsonio.loads(jsonio.dumps(SAMPLE, indent=True)) == SAMPLE
+    assert jsonio.loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_invalid_json_raises_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        jsonio.loads(b"{not json")
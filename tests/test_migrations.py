@@ -301,3 +301,56 @@ def test_api_works_after_migration(seeded_old_db):
     assert channel.name == "Bitcoin Podcast"
     assert channel.content_profile == "bitcoin_podcast"
     assert channel.is_active is True
+
+
+@pytest.mark.migration_check
+def test_cli_migration_check_runs_once_per_url(tmp_path, monkeypatch):
+    """The CLI checks for pending migrations once per database, in the background."""
+    import threading
+
+    from btcedu import cli as cli_module
+
+    checked = []
+    done = threading.Event()
+
+    def fake_check(session_factory):
+        checked.append(session_factory)
+        done.set()
+
+    monkeypatch.setattr(cli_module, "_check_pending_migrations", fake_check)
+    cli_module._schedule_migration_check.cache_clear()
+    url = f"sqlite:///{tmp_path / 'check.db'}"
+    try:
+        for _ in range(2):
+            cli_module._lazy_session_factory(url)().close()
+        cli_module._lazy_session_factory(url, check_migrations=False)().close()
+        assert done.wait(5)
+    finally:
+        cli_module._schedule_migration_check.cache_clear()
+
+    assert len(checked) == 1
+
+
+def test_cli_migration_warning_survives_short_command(tmp_path):
+    """A command that exits before the check finishes still prints the warning."""
+    import subprocess
+    import sys
+
+    script = f"""
+import logging, time
+from btcedu import cli
+
+def slow_check(session_factory):
+    time.sleep(0.3)
+    logging.warning("Database migration required. Pending: 999_test")
+
+logging.basicConfig(level=logging.INFO)
+cli._check_pending_migrations = slow_check
+cli._lazy_session_factory({f"sqlite:///{tmp_path / 'short.db'}"!r})().close()
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=30
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "Database migration required. Pending: 999_test" in result.stderr
@@ -113,6 +113,10 @@ class TestEpisodeORM:
         assert run.estimated_cost_usd == 0.0
         assert run.started_at is not None
 
+    def test_pipeline_stage_values_are_lowercased_names(self):
+        # `btcedu cost` derives the stage label in SQL from the stored name
+        assert all(stage.value == stage.name.lower() for stage in PipelineStage)
+
 
 class TestPydanticSchemas:
     def test_episode_info(self):
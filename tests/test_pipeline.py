@@ -1,11 +1,14 @@
 """Tests for Phase 5 pipeline orchestration."""
 
 import json
+import threading
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
 from btcedu.config import Settings
 from btcedu.core.pipeline import (
@@ -19,8 +22,11 @@ from btcedu.core.pipeline import (
     run_latest,
     run_pending,
     write_report,
+    write_reports,
 )
+from btcedu.db import Base
 from btcedu.models.episode import Episode, EpisodeStatus
+from btcedu.services.claude_service import ClaudeResponse
 
 
 def _make_settings(tmp_path: Path) -> Settings:
@@ -316,6 +322,90 @@ class TestRunPending:
         assert len(reports) == 0
         mock_run.assert_not_called()
 
+    @patch("btcedu.core.pipeline.run_episode_pipeline")
+    def test_workers_use_own_sessions_and_keep_order(self, mock_run, tmp_path):
+        # File-backed DB: worker sessions open their own connections
+        engine = create_engine(f"sqlite:///{tmp_path / 'workers.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        for i in range(4):
+            session.add(
+                Episode(
+                    episode_id=f"ep_{i}",
+                    source="youtube_rss",
+                    title=f"Ep {i}",
+                    url=f"https://youtube.com/watch?v={i}",
+                    status=EpisodeStatus.NEW,
+                    published_at=datetime(2025, 1, i + 1, tzinfo=UTC),
+                )
+            )
+        session.commit()
+
+        mock_run.side_effect = lambda s, ep, settings: PipelineReport(
+            episode_id=ep.episode_id, title=ep.title, success=True
+        )
+        settings = _make_settings(tmp_path)
+
+        reports = run_pending(session, settings, workers=3)
+
+        assert [r.episode_id for r in reports] == ["ep_0", "ep_1", "ep_2", "ep_3"]
+        used_sessions = {call.args[0] for call in mock_run.call_args_list}
+        assert session not in used_sessions
+        session.close()
+        engine.dispose()
+
+    def test_workers_overlap_llm_calls_on_sqlite(self, tmp_path):
+        """Two workers can both be inside a stage's LLM call at once.
+
+        A stage that only flushed its RUNNING PipelineRun would hold SQLite's
+        write lock through the call, and the other worker's insert would
+        fail with "database is locked".
+        """
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'workers.db'}", connect_args={"timeout": 1}
+        )
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        for i in range(2):
+            transcript = tmp_path / f"transcript_{i}.de.txt"
+            transcript.write_text("Heute sprechen wir über Bit Coin.", encoding="utf-8")
+            session.add(
+                Episode(
+                    episode_id=f"ep_{i}",
+                    source="youtube_rss",
+                    title=f"Ep {i}",
+                    url=f"https://youtube.com/watch?v={i}",
+                    status=EpisodeStatus.TRANSCRIBED,
+                    transcript_path=str(transcript),
+                    pipeline_version=2,
+                    published_at=datetime(2025, 1, i + 1, tzinfo=UTC),
+                )
+            )
+        session.commit()
+
+        both_in_llm_call = threading.Barrier(2, timeout=10)
+
+        def fake_call_claude(system_prompt, user_message, settings, **kwargs):
+            both_in_llm_call.wait()
+            return ClaudeResponse(
+                text="Heute sprechen wir über Bitcoin.",
+                input_tokens=10,
+                output_tokens=10,
+                cost_usd=0.0,
+                model="test",
+            )
+
+        settings = _make_settings(tmp_path)
+        settings.pipeline_version = 2
+        with patch("btcedu.core.corrector.call_claude", side_effect=fake_call_claude):
+            reports = run_pending(session, settings, workers=2)
+
+        for report in reports:
+            correct = next(s for s in report.stages if s.stage == "correct")
+            assert correct.status == "success", correct.error
+        session.close()
+        engine.dispose()
+
 
 # ── RunLatest ────────────────────────────────────────────────────
 
@@ -486,6 +576,15 @@ class TestWriteReport:
         assert Path(path).exists()
         assert "ep003" in path
 
+    def test_write_reports_keeps_order(self, tmp_path):
+        reports = [PipelineReport(episode_id=eid, title=eid) for eid in ("ep_a", "ep_b")]
+        for r in reports:
+            r.completed_at = r.started_at
+
+        paths = write_reports(reports, str(tmp_path / "reports"))
+
+        assert [json.loads(Path(p).read_text())["episode_id"] for p in paths] == ["ep_a", "ep_b"]
+
 
 # ── ResolvePipelinePlan ─────────────────────────────────────────
 
@@ -1,6 +1,9 @@
 """Tests for PromptRegistry."""
 
+from unittest.mock import MagicMock, patch
+
 import pytest
+from click.testing import CliRunner
 
 from btcedu.core.prompt_registry import TEMPLATES_DIR, PromptRegistry
 from btcedu.models.prompt_version import PromptVersion
@@ -113,6 +116,23 @@ class TestPromptRegistry:
         assert metadata == {}
         assert "Just plain text content." in body
 
+    def test_load_template_cached_until_file_changes(self, registry, tmp_path):
+        tmpl_path = tmp_path / "plain.md"
+        tmpl_path.write_text(NO_FRONTMATTER, encoding="utf-8")
+
+        with patch("btcedu.core.prompt_registry.yaml.safe_load") as safe_load:
+            registry.load_template(tmpl_path)
+            metadata, _ = registry.load_template(tmpl_path)
+            metadata["mutated"] = True
+            tmpl_path.write_text("---\nname: x\n---\nNew body.", encoding="utf-8")
+            safe_load.return_value = {"name": "x"}
+            metadata, body = registry.load_template(tmpl_path)
+
+        assert safe_load.call_count == 1
+        assert metadata == {"name": "x"}
+        assert body == "New body."
+        assert registry.load_template(tmpl_path)[0] == {"name": "x"}
+
     def test_register_version_creates_record(self, registry, tmp_templates, db_session):
         tmpl_path = tmp_templates / "test_prompt.md"
         pv = registry.register_version("test_prompt", tmpl_path)
@@ -279,3 +299,52 @@ class TestPromptRegistry:
     def test_strip_frontmatter_no_frontmatter(self):
         result = PromptRegistry._strip_frontmatter(NO_FRONTMATTER)
         assert "Just plain text content." in result
+
+
+class TestPromptListCLI:
+    def _add_versions(self, db_session):
+        for name in ("alpha", "beta"):
+            for version in (1, 2, 3):
+                db_session.add(
+                    PromptVersion(name=name, version=version, content_hash=f"{name}{version}")
+                )
+        db_session.commit()
+
+    def _invoke(self, db_session, args):
+        from btcedu.cli import cli
+
+        return CliRunner().invoke(
+            cli,
+            ["prompt", "list", *args],
+            obj={"settings": MagicMock(), "session_factory": lambda: db_session},
+        )
+
+    def _listed(self, output):
+        return [
+            (parts[1], int(parts[2]))
+            for parts in (line.split() for line in output.splitlines())
+            if len(parts) > 2 and parts[0].isdigit()
+        ]
+
+    def test_pages_follow_name_then_version_desc(self, db_session):
+        self._add_versions(db_session)
+
+        first = self._invoke(db_session, ["--limit", "4"])
+        assert first.exit_code == 0, first.output
+        assert self._listed(first.output) == [
+            ("alpha", 3),
+            ("alpha", 2),
+            ("alpha", 1),
+            ("beta", 3),
+        ]
+        assert "next-cursor: beta:3" in first.output
+
+        second = self._invoke(db_session, ["--limit", "4", "--after", "beta:3"])
+        assert second.exit_code == 0, second.output
+        assert self._listed(second.output) == [("beta", 2), ("beta", 1)]
+        assert "next-cursor" not in second.output
+
+    def test_rejects_malformed_cursor(self, db_session):
+        result = self._invoke(db_session, ["--after", "beta"])
+        assert result.exit_code == 2
+        assert "NAME:VERSION" in result.output
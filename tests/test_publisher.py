@@ -17,6 +17,7 @@ from btcedu.core.publisher import (
     _check_cost_sanity,
     _check_metadata_completeness,
     _format_timestamp,
+    build_youtube_service,
     get_latest_publish_job,
     publish_video,
 )
@@ -24,6 +25,7 @@ from btcedu.db import Base
 from btcedu.models.episode import Episode, EpisodeStatus, PipelineRun, RunStatus
 from btcedu.models.publish_job import PublishJob
 from btcedu.models.review import ReviewStatus, ReviewTask
+from btcedu.services.youtube_service import DryRunYouTubeService, YouTubeDataAPIService
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -428,6 +430,34 @@ class TestPublishVideo:
         assert data["dry_run"] is True
         assert "safety_checks" in data
 
+    def test_uses_injected_youtube_service(
+        self, db_session, approved_episode, approved_review_task, settings, tmp_path
+    ):
+        settings.dry_run = True
+        _make_chapters_json(tmp_path, approved_episode.episode_id)
+        service = DryRunYouTubeService()
+
+        with (
+            patch("btcedu.core.publisher.build_youtube_service") as build,
+            patch.object(service, "upload_video", wraps=service.upload_video) as upload,
+        ):
+            publish_video(
+                db_session, approved_episode.episode_id, settings, youtube_service=service
+            )
+        build.assert_not_called()
+        upload.assert_called_once()
+
+
+class TestBuildYouTubeService:
+    def test_dry_run_service(self, settings):
+        settings.dry_run = True
+        assert isinstance(build_youtube_service(settings), DryRunYouTubeService)
+
+    def test_api_service_uses_credentials_path(self, settings):
+        service = build_youtube_service(settings)
+        assert isinstance(service, YouTubeDataAPIService)
+        assert service._credentials_path == settings.youtube_credentials_path
+
 
 # ---------------------------------------------------------------------------
 # Tests: get_latest_publish_job
@@ -2,8 +2,10 @@
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from sqlalchemy import event
 
 from btcedu.core.pipeline import StageResult, _run_stage
 from btcedu.core.reviewer import (
@@ -130,6 +132,28 @@ class TestApproveReview:
         # Episode should still be CORRECTED — pipeline advances on next run
         assert episode.status == EpisodeStatus.CORRECTED
 
+    def test_history_written_without_reloading_task(self, db_session, review_task):
+        review_task_id = review_task.id
+        db_session.expire_all()
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            with patch("btcedu.core.reviewer._write_review_history") as write_history:
+                approve_review(db_session, review_task_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        task_selects = [s for s in statements if s.startswith("SELECT") and "review_tasks" in s]
+        assert len(task_selects) == 1
+        entry = write_history.call_args.args[0]
+        assert entry["review_task_id"] == review_task_id
+        assert entry["task_status"] == ReviewStatus.APPROVED.value
+
 
 class TestRejectReview:
     def test_reverts_episode(self, db_session, review_task, corrected_episode):
@@ -7,6 +7,8 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from btcedu.migrations import (
+    AddEpisodeStatusIndexMigration,
+    AddPipelineRunEpisodeIndexMigration,
     AddV2PipelineColumnsMigration,
     CreatePromptVersionsTableMigration,
     CreateReviewTablesMigration,
@@ -284,8 +286,8 @@ def test_all_migrations_run_sequentially(post_001_session):
     session = post_001_session
 
     pending = get_pending_migrations(session)
-    # 001 is already applied, so we should see 002 through 011
-    assert len(pending) == 10
+    # 001 is already applied, so we should see 002 through 013
+    assert len(pending) == 12
 
     run_migrations(session, dry_run=False)
 
@@ -320,3 +322,37 @@ def test_existing_pipeline_works_after_migrations(seeded_post_001):
 
     result = session.execute(text("SELECT status FROM episodes WHERE episode_id = 'ep001'"))
     assert result.scalar() == "downloaded"
+
+
+def test_migration_012_adds_status_index(post_001_session):
+    session = post_001_session
+    migration = AddEpisodeStatusIndexMigration()
+    migration.up(session)
+    migration.up(session)  # Should not error
+
+    rows = session.execute(
+        text(
+            "SELECT name FROM sqlite_master "
+            "WHERE type='index' AND name='idx_episodes_status_published'"
+        )
+    ).fetchall()
+    assert len(rows) == 1
+    plan = session.execute(
+        text(
+            "EXPLAIN QUERY PLAN SELECT id FROM episodes "
+            "WHERE status IN ('NEW', 'DOWNLOADED') ORDER BY published_at"
+        )
+    ).fetchall()
+    assert any("idx_episodes_status_published" in row[-1] for row in plan)
+
+
+def test_migration_013_adds_pipeline_run_episode_index(post_001_session):
+    session = post_001_session
+    migration = AddPipelineRunEpisodeIndexMigration()
+    migration.up(session)
+    migration.up(session)  # Should not error
+
+    plan = session.execute(
+        text("EXPLAIN QUERY PLAN SELECT count(DISTINCT episode_id) FROM pipeline_runs")
+    ).fetchall()
+    assert any("ix_pipeline_runs_episode_id" in row[-1] for row in plan)
@@ -143,3 +143,32 @@ class TestTranscribeEpisode:
 
         with pytest.raises(ValueError, match="No Whisper API key"):
             transcribe_episode(db_session, "ep001", settings)
+
+
+class TestTranscribeCLI:
+    def test_concurrency_keeps_output_order(self, tmp_path):
+        from unittest.mock import MagicMock
+
+        from click.testing import CliRunner
+
+        from btcedu.cli import cli
+
+        def fake_transcribe(session, eid, settings, force=False):
+            if eid == "ep_bad":
+                raise ValueError("no audio")
+            return f"/transcripts/{eid}.txt"
+
+        with patch("btcedu.core.transcriber.transcribe_episode", side_effect=fake_transcribe):
+            result = CliRunner().invoke(
+                cli,
+                ["transcribe", "--concurrency", "3"]
+                + [arg for eid in ("ep1", "ep_bad", "ep3") for arg in ("--episode-id", eid)],
+                obj={"settings": _make_settings(tmp_path), "session_factory": MagicMock},
+            )
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == [
+            "[OK] ep1 -> /transcripts/ep1.txt",
+            "[FAIL] ep_bad: no audio",
+            "[OK] ep3 -> /transcripts/ep3.txt",
+        ]
@@ -683,9 +683,9 @@ class TestTranslateCLI:
 
         with (
             patch("btcedu.core.translator.call_claude") as mock_claude,
-            patch("btcedu.cli.get_settings") as mock_get_settings,
-            patch("btcedu.cli.init_db"),
-            patch("btcedu.cli.get_session_factory") as mock_get_session_factory,
+            patch("btcedu.config.get_settings") as mock_get_settings,
+            patch("btcedu.db.init_db"),
+            patch("btcedu.db.get_session_factory") as mock_get_session_factory,
         ):
             mock_claude.return_value = type(
                 "Response",
@@ -713,9 +713,9 @@ class TestTranslateCLI:
         from btcedu.cli import cli
 
         with (
-            patch("btcedu.cli.get_settings") as mock_get_settings,
-            patch("btcedu.cli.init_db"),
-            patch("btcedu.cli.get_session_factory") as mock_get_session_factory,
+            patch("btcedu.config.get_settings") as mock_get_settings,
+            patch("btcedu.db.init_db"),
+            patch("btcedu.db.get_session_factory") as mock_get_session_factory,
         ):
             mock_get_settings.return_value = mock_settings
             mock_get_session_factory.return_value = lambda: db_session
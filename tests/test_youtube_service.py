@@ -2,9 +2,11 @@
 
 import json
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from btcedu.services.youtube_service import (
     DryRunYouTubeService,
+    YouTubeDataAPIService,
     YouTubeUploadRequest,
     YouTubeUploadResponse,
     check_token_status,
@@ -77,6 +79,29 @@ class TestDryRunYouTubeService:
         assert response.video_id == "DRY_RUN"
 
 
+# ---------------------------------------------------------------------------
+# YouTubeDataAPIService credentials
+# ---------------------------------------------------------------------------
+
+
+class TestYouTubeDataAPIServiceCredentials:
+    def test_credentials_read_once_while_valid(self, tmp_path):
+        svc = YouTubeDataAPIService(credentials_path=str(tmp_path / "creds.json"))
+        creds = MagicMock(valid=True)
+        with patch.object(svc, "_read_credentials", return_value=creds) as read:
+            assert svc._load_credentials() is creds
+            assert svc._load_credentials() is creds
+        read.assert_called_once()
+
+    def test_credentials_reread_when_invalid(self, tmp_path):
+        svc = YouTubeDataAPIService(credentials_path=str(tmp_path / "creds.json"))
+        stale, fresh = MagicMock(valid=True), MagicMock(valid=True)
+        with patch.object(svc, "_read_credentials", side_effect=[stale, fresh]):
+            svc._load_credentials()
+            stale.valid = False
+            assert svc._load_credentials() is fresh
+
+
 # ---------------------------------------------------------------------------
 # check_token_status
 # ---------------------------------------------------------------------------